@@ -0,0 +1,176 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Country adjacency and proximity graph
+
+For every country we rank all the other countries of its continent once:
+countries it borders come first, then the rest, each group nearest
+centroid first.  Asking for the k nearest neighbours is then just a slice
+of that list, so harder questions can use geographically confusable
+distractors without doing any geometry at question time.
+
+The hand-traced outlines do not always meet exactly (the South America
+traces leave gaps of a couple of units), so two countries count as
+bordering when their outlines come within BORDER_DISTANCE of each other.
+"""
+
+# outlines closer than this, in map units, are treated as a shared border
+BORDER_DISTANCE = 4.0
+
+# outlines are flattened this coarsely for the border test, in map units
+FLATTEN_TOLERANCE = 0.5
+
+def centroid(rings):
+    """Area-weighted centroid of a list of flat x,y rings"""
+    area = cx = cy = 0.0
+    for ring in rings:
+        n = len(ring)
+        for i in range(0, n, 2):
+            x0, y0 = ring[i - 2], ring[i - 1]
+            x1, y1 = ring[i], ring[i + 1]
+            cross = x0 * y1 - x1 * y0
+            area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+    if area == 0:
+        xs = [ring[i] for ring in rings for i in range(0, len(ring), 2)]
+        ys = [ring[i + 1] for ring in rings for i in range(0, len(ring), 2)]
+        return sum(xs) / len(xs), sum(ys) / len(ys)
+    return cx / (3 * area), cy / (3 * area)
+
+def _segment_distance_squared(px, py, ax, ay, bx, by):
+    dx = bx - ax
+    dy = by - ay
+    length = dx * dx + dy * dy
+    if length == 0:
+        t = 0.0
+    else:
+        t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length))
+    ex = ax + t * dx - px
+    ey = ay + t * dy - py
+    return ex * ex + ey * ey
+
+def find_borders(shapes, distance=BORDER_DISTANCE):
+    """Return the set of (key, key) pairs whose outlines come within distance
+
+    shapes -- dictionary mapping keys to lists of flat x,y rings
+    """
+    cell = max(distance * 4, 1.0)
+    segments = {}
+    for key, rings in shapes.items():
+        for ring in rings:
+            n = len(ring)
+            for i in range(0, n, 2):
+                ax, ay = ring[i - 2], ring[i - 1]
+                bx, by = ring[i], ring[i + 1]
+                segment = (key, ax, ay, bx, by)
+                for gx in range(int((min(ax, bx) - distance) // cell), int((max(ax, bx) + distance) // cell) + 1):
+                    for gy in range(int((min(ay, by) - distance) // cell), int((max(ay, by) + distance) // cell) + 1):
+                        segments.setdefault((gx, gy), []).append(segment)
+
+    limit = distance * distance
+    borders = set()
+    for key, rings in shapes.items():
+        for ring in rings:
+            for i in range(0, len(ring), 2):
+                x, y = ring[i], ring[i + 1]
+                for other, ax, ay, bx, by in segments.get((int(x // cell), int(y // cell)), ()):
+                    if other == key or (key, other) in borders:
+                        continue
+                    if _segment_distance_squared(x, y, ax, ay, bx, by) <= limit:
+                        borders.add((key, other))
+                        borders.add((other, key))
+    return borders
+
+class AdjacencyGraph(object):
+    """Precomputed neighbour rankings
+
+    ranked -- dictionary mapping each key to all other keys, nearest first
+    bordering -- dictionary mapping each key to the number of keys at the
+        start of its ranking that share a border with it
+    """
+    def __init__(self, ranked, bordering):
+        self.ranked = ranked
+        self.bordering = bordering
+
+    def nearest(self, key, k):
+        """Return the k countries nearest to key, bordering countries first"""
+        return self.ranked[key][:k]
+
+    def neighbours(self, key):
+        """Return the countries sharing a border with key"""
+        return self.ranked[key][:self.bordering[key]]
+
+def build_adjacency(shapes):
+    """Build an AdjacencyGraph from a dictionary of key to flat x,y rings"""
+    borders = find_borders(shapes)
+    centroids = dict([(key, centroid(rings)) for key, rings in shapes.items() if rings])
+    ranked = {}
+    bordering = {}
+    for key, (x, y) in centroids.items():
+        def closeness(other):
+            ox, oy = centroids[other]
+            return ((key, other) not in borders, (ox - x) ** 2 + (oy - y) ** 2, other)
+        others = [other for other in centroids if other != key]
+        others.sort(key=closeness)
+        ranked[key] = others
+        bordering[key] = len([other for other in others if (key, other) in borders])
+    return AdjacencyGraph(ranked, bordering)
+
+def continent_shapes(keys, geometry):
+    """Flattened outlines of the given countries, for build_adjacency"""
+    return dict([(key, geometry[key].flatten(FLATTEN_TOLERANCE)) for key in keys])
+
+def continent_adjacency(continent):
+    """Return the AdjacencyGraph of a continents.Continent
+
+    A compiled map bundle already holds the graph; otherwise it is
+    computed from the outlines.
+    """
+    stored = getattr(continent.geometry, "adjacency", None)
+    if stored is not None:
+        return stored(continent.key)
+    return build_adjacency(continent_shapes(continent.keys, continent.geometry))
+
+def benchmark(k=4, repeat=3):
+    """Time building the graph and querying it"""
+    import time
+    import mapbundle
+    from continents import ContinentRegistry
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        shapes = continent_shapes(continent.keys, continent.geometry)
+        start = time.time()
+        graph = build_adjacency(shapes)
+        built = time.time() - start
+
+        start = time.time()
+        for i in range(repeat * 1000):
+            for country in continent.keys:
+                graph.nearest(country, k)
+        query = (time.time() - start) / (repeat * 1000 * len(continent.keys))
+
+        print "%s: built in %.1f ms, nearest(%d) in %.2f us" % (key, built * 1000, k, query * 1e6)
+        for country in continent.keys[:3]:
+            print "  %s borders %s" % (country, ', '.join(graph.neighbours(country)))
+
+if __name__ == '__main__':
+    benchmark()
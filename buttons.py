@@ -0,0 +1,103 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Pre-rendered pick list buttons
+
+A ButtonAtlas holds the finished button images, border, background and
+text, for every country of a continent, in both the normal and the
+selected look.  It fills itself on a worker thread as soon as the
+continent is chosen, so drawing the pick list is only blits.
+"""
+
+import threading
+
+import pygame
+
+FOREGROUND = (180, 180, 180)
+BACKGROUND = (50, 50, 50)
+SELECTED = (255, 0, 0)
+
+class ButtonAtlas(object):
+    """Button images for a continent's countries in one language and font
+
+    continent -- the continents.Continent whose country names to show
+    language -- the language of the names
+    font_spec -- (file name or None, size) of the font to draw them with
+
+    A new atlas is needed when the language or font changes; the game
+    keys its atlases on both.
+    """
+    def __init__(self, continent, language, font_spec):
+        self.continent = continent
+        self.language = language
+        # SDL_ttf is not thread safe: the atlas has a Font of its own, used
+        # by the worker and the main thread only while holding _lock
+        self.font = pygame.font.Font(*font_spec)
+        self._lock = threading.Lock()
+        self._images = {}
+        self._thread = None
+
+    def start(self):
+        """Render every button in the background"""
+        if self._thread is not None:
+            return
+        keys = list(self.continent.keys)
+
+        def run():
+            for key in keys:
+                for is_selected in (0, 1):
+                    self.get(key, is_selected)
+
+        self._thread = threading.Thread(target=run, name="button atlas")
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def get(self, key, is_selected):
+        """Return the button image for a country, rendering it if need be"""
+        try:
+            return self._images[key, is_selected]
+        except KeyError:
+            pass
+        self._lock.acquire()
+        try:
+            # the other thread may have rendered it while we waited
+            image = self._images.get((key, is_selected))
+            if image is None:
+                image = self._images[key, is_selected] = self.render(key, is_selected)
+            return image
+        finally:
+            self._lock.release()
+
+    def render(self, key, is_selected):
+        """Draw a country's button: background, border and name
+
+        Call with _lock held.
+        """
+        text = self.continent.name(key, self.language)
+        textimg = self.font.render(text, 1, FOREGROUND)
+        textwidth, textheight = self.font.size(text)
+        image = pygame.Surface((textwidth + 16, textheight + 8))
+        rect = image.get_rect()
+        pygame.draw.rect(image, BACKGROUND, rect, 0)
+        if is_selected:
+            pygame.draw.rect(image, SELECTED, rect, 2)
+        else:
+            pygame.draw.rect(image, FOREGROUND, rect, 2)
+        image.blit(textimg, (8, 4))
+        return image
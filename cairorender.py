@@ -0,0 +1,191 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Direct cairo rendering of the quiz map
+
+The map svg is generated from outlines we already hold as numbers, so
+handing it to rsvg only to have the text parsed back into paths is wasted
+work.  draw_countries replays the screen-space outlines straight onto a
+cairo context, with the fill and stroke given as data, and draws what the
+svg route draws: a filled path with a black, round-capped, mitred stroke.
+When the outlines carry their topology arcs, every border is stroked once
+after the fills instead of once for each country along it.
+"""
+
+import cairo
+
+STROKE_COLOR = (0, 0, 0)
+
+def _rgb(color):
+    return color[0] / 255.0, color[1] / 255.0, color[2] / 255.0
+
+def draw_countries(context, screen, keys, fills, stroke_width=1.0, stroke_color=STROKE_COLOR):
+    """Draw countries onto a cairo context
+
+    screen -- transform.ScreenGeometry holding the outlines
+    keys -- country keys, in drawing order
+    fills -- dictionary mapping each key to an (r, g, b) fill colour
+    stroke_width -- outline width in pixels
+    stroke_color -- (r, g, b) outline colour
+    """
+    context.set_line_width(stroke_width)
+    context.set_line_cap(cairo.LINE_CAP_ROUND)
+    context.set_line_join(cairo.LINE_JOIN_MITER)
+    context.set_miter_limit(4)
+    context.set_fill_rule(cairo.FILL_RULE_WINDING)
+    stroke = _rgb(stroke_color)
+    colors = {}
+    arcs = screen.arcs
+    for key in keys:
+        context.new_path()
+        for ring in screen.rings(key):
+            context.move_to(ring[0], ring[1])
+            for i in range(2, len(ring), 2):
+                context.line_to(ring[i], ring[i + 1])
+            context.close_path()
+        fill = fills[key]
+        if fill not in colors:
+            colors[fill] = _rgb(fill)
+        context.set_source_rgb(*colors[fill])
+        if arcs is None:
+            context.fill_preserve()
+            context.set_source_rgb(*stroke)
+            context.stroke()
+        else:
+            context.fill()
+    if arcs is None:
+        return
+
+    # stroke each border once, whichever of its countries are drawn
+    drawn = set(keys)
+    context.new_path()
+    for arc, owners in zip(arcs, screen.arc_owners):
+        if len(arc) < 4:
+            continue
+        for owner in owners:
+            if owner in drawn:
+                break
+        else:
+            continue
+        context.move_to(arc[0], arc[1])
+        for i in range(2, len(arc), 2):
+            context.line_to(arc[i], arc[i + 1])
+        if arc[0] == arc[-2] and arc[1] == arc[-1]:
+            context.close_path()
+    context.set_source_rgb(*stroke)
+    context.stroke()
+
+def pixel_difference(first, second, threshold=8):
+    """Compare two equally sized cairo ImageSurfaces
+
+    returns the largest difference of any channel, and the number of
+    pixels with a channel differing by more than threshold
+    """
+    from array import array
+    first = array('B', str(first.get_data()))
+    second = array('B', str(second.get_data()))
+    if len(first) != len(second):
+        raise ValueError("surfaces differ in size")
+    largest = 0
+    differing = set()
+    for i in xrange(len(first)):
+        difference = abs(first[i] - second[i])
+        if difference:
+            if difference > largest:
+                largest = difference
+            if difference > threshold:
+                differing.add(i // 4)
+    return largest, len(differing)
+
+# check() fails when more than this fraction of a map's pixels differ from
+# rsvg's rendering by more than the pixel_difference threshold; antialiased
+# edges and the single stroke along shared borders account for a few
+MAX_DIFFERING_FRACTION = 0.005
+
+def _reference_maps():
+    """Yield the data to draw each continent's map both ways"""
+    import mapbundle
+    import mapsvg
+    import simplify
+    import transform
+    from continents import ContinentRegistry
+    from hittest import matrix_scale
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        lod = simplify.LevelsOfDetail(continent)
+        level = lod.choose_level(simplify.effective_scale(continent.data))
+        matrix = transform.screen_matrix(continent.data)
+        screen = transform.continent_screen_geometry(continent, lod, level, matrix)
+        svg = mapsvg.reference_document(continent, screen.svg_path, matrix)
+        order = mapsvg.render_order(continent)
+        fills = dict([(k, mapsvg.STATE_COLORS[mapsvg.country_state(continent.countries[k])])
+                      for k in continent.keys])
+        yield key, svg, screen, order, fills, matrix_scale(matrix)
+
+def check(threshold=8, max_differing=MAX_DIFFERING_FRACTION):
+    """Check the replay draws each continent's map as rsvg does
+
+    Fails if more than max_differing of the pixels differ by more than
+    threshold in any channel.
+    """
+    import rsvg
+    from olpcgames import _cairoimage
+
+    for key, svg, screen, order, fills, stroke_width in _reference_maps():
+        svg_surface, context = _cairoimage.newContext(1200, 1230)
+        rsvg.Handle(data=svg).render_cairo(context)
+        replay_surface, context = _cairoimage.newContext(1200, 1230)
+        draw_countries(context, screen, order, fills, stroke_width)
+
+        largest, differing = pixel_difference(svg_surface, replay_surface, threshold)
+        allowed = int(1200 * 1230 * max_differing)
+        assert differing <= allowed, (key, differing, allowed, largest)
+        print "%s: %d pixels differ by more than %d (at most %d allowed)" % (
+            key, differing, threshold, allowed)
+
+def benchmark(repeat=10):
+    """Time the replay against rendering the same map through rsvg"""
+    import time
+    import rsvg
+    from olpcgames import _cairoimage
+
+    for key, svg, screen, order, fills, stroke_width in _reference_maps():
+        svg_time = replay_time = None
+        for i in range(repeat):
+            start = time.time()
+            svg_surface, context = _cairoimage.newContext(1200, 1230)
+            rsvg.Handle(data=svg).render_cairo(context)
+            elapsed = time.time() - start
+            if svg_time is None or elapsed < svg_time:
+                svg_time = elapsed
+
+            start = time.time()
+            replay_surface, context = _cairoimage.newContext(1200, 1230)
+            draw_countries(context, screen, order, fills, stroke_width)
+            elapsed = time.time() - start
+            if replay_time is None or elapsed < replay_time:
+                replay_time = elapsed
+
+        print "%s: rsvg %.1f ms, replay %.1f ms" % (key, svg_time * 1000, replay_time * 1000)
+
+if __name__ == '__main__':
+    check()
+    benchmark()
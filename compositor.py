@@ -0,0 +1,199 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Cached map raster with per-country repainting
+
+The MapCompositor rasterizes a continent's map once.  Between questions
+only two or three countries change colour, so for each of them it
+re-renders just the countries overlapping that country's bounding box,
+into a surface the size of the box, and copies the result over the
+cached image.  Everything overlapping the box is drawn again in z order,
+so shared borders come out exactly as in a full render.  Countries are
+drawn with cairorender, straight from their screen-space outlines.
+"""
+
+import math
+
+import pygame
+
+from olpcgames import _cairoimage
+from hittest import matrix_scale
+from mapsvg import STATE_COLORS, country_state, render_order
+from cairorender import draw_countries
+
+class MapCompositor(object):
+    """The rendered map of one continent, kept up to date by repainting
+
+    continent -- the continents.Continent to draw
+    screen -- the continent's transform.ScreenGeometry
+    size -- (width, height) of the map raster in pixels
+    """
+    def __init__(self, continent, screen, size=(1200, 1230)):
+        self.continent = continent
+        self.screen = screen
+        self.size = size
+        self.order = render_order(continent)
+        self.image = None
+        self.stroke_width = matrix_scale(screen.matrix)
+        # antialiasing and half the stroke reach past a country's outline
+        self.padding = int(math.ceil(self.stroke_width / 2.0)) + 1
+        self._fills = {}
+
+    def _refresh(self, key):
+        """Update a country's fill, returning whether it changed"""
+        if key not in self.continent.countries:
+            return False
+        fill = STATE_COLORS[country_state(self.continent.countries[key])]
+        if self._fills.get(key) != fill:
+            self._fills[key] = fill
+            return True
+        return False
+
+    def render(self, keys):
+        """Bring the raster up to date after keys may have changed state
+
+        returns the rectangles of the image that were redrawn
+        """
+        if self.image is None:
+            for key in self.order:
+                self._refresh(key)
+            self.image = self._rasterize(self.order, pygame.Rect((0, 0), self.size))
+            return [self.image.get_rect()]
+
+        rects = []
+        for key in keys:
+            if self._refresh(key):
+                rect = self.country_rect(key)
+                if rect.width and rect.height:
+                    self.repaint(rect)
+                    rects.append(rect)
+        return rects
+
+    def prepare(self, fills):
+        """Render the repaints a change of fills will need, without applying them
+
+        fills -- dictionary mapping keys to their expected (r, g, b) fill
+
+        This only reads the compositor, so it can run on a worker thread
+        while the image is on screen, as long as nothing renders meanwhile.
+
+        returns the prepared repaints, for apply()
+        """
+        expected = dict(self._fills)
+        expected.update(fills)
+        patches = []
+        for key, fill in fills.items():
+            if self._fills.get(key) != fill:
+                rect = self.country_rect(key)
+                if rect.width and rect.height:
+                    patches.append((rect, self._rasterize(self._overlapping(rect), rect, expected)))
+        return expected, patches
+
+    def apply(self, prepared):
+        """Copy repaints made by prepare() into the image
+
+        A following render() call repaints any country whose state turned
+        out different from what was expected.
+
+        returns the rectangles of the image that were redrawn
+        """
+        fills, patches = prepared
+        for rect, region in patches:
+            region.set_alpha(None)
+            self.image.blit(region, rect.topleft)
+        self._fills = fills
+        return [rect for rect, region in patches]
+
+    def country_rect(self, key):
+        """The part of the image a country's fill and stroke can touch"""
+        min_x, min_y, max_x, max_y = self.screen.bbox(key)
+        left = int(math.floor(min_x)) - self.padding
+        top = int(math.floor(min_y)) - self.padding
+        rect = pygame.Rect(left, top,
+            int(math.ceil(max_x)) + self.padding - left, int(math.ceil(max_y)) + self.padding - top)
+        return rect.clip(pygame.Rect((0, 0), self.size))
+
+    def repaint(self, rect):
+        """Re-render every country overlapping rect and copy it into the image"""
+        region = self._rasterize(self._overlapping(rect), rect, self._fills)
+        # copy the pixels, alpha included, rather than blending them
+        region.set_alpha(None)
+        self.image.blit(region, rect.topleft)
+
+    def _overlapping(self, rect):
+        """The keys of the countries that can draw into rect, in drawing order"""
+        keys = []
+        for key in self.order:
+            min_x, min_y, max_x, max_y = self.screen.bbox(key)
+            if (max_x + self.padding >= rect.left and min_x - self.padding <= rect.right and
+                    max_y + self.padding >= rect.top and min_y - self.padding <= rect.bottom):
+                keys.append(key)
+        return keys
+
+    def _rasterize(self, keys, rect, fills=None):
+        if fills is None:
+            fills = self._fills
+        surface, context = _cairoimage.newContext(rect.width, rect.height)
+        context.translate(-rect.left, -rect.top)
+        draw_countries(context, self.screen, keys, fills, self.stroke_width)
+        return _cairoimage.asImage(surface)
+
+def benchmark(repeat=20):
+    """Compare rasterizing the whole map per question with repainting changed countries"""
+    import time
+    from random import choice
+    import mapbundle
+    import simplify
+    import transform
+    from continents import ContinentRegistry
+
+    pygame.init()
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        lod = simplify.LevelsOfDetail(continent)
+        level = lod.choose_level(simplify.effective_scale(continent.data))
+        screen = transform.continent_screen_geometry(continent, lod, level,
+            transform.screen_matrix(continent.data))
+        compositor = MapCompositor(continent, screen)
+        compositor.render(continent.keys)
+
+        countries = continent.countries
+        full = repaint = 0.0
+        previous = None
+        for i in range(repeat):
+            current = choice(continent.keys)
+            if previous is not None:
+                countries[previous]["is_current"] = 0
+            countries[current]["is_current"] = 1
+
+            start = time.time()
+            compositor.render([previous, current])
+            repaint += time.time() - start
+
+            start = time.time()
+            compositor._rasterize(compositor.order, pygame.Rect((0, 0), compositor.size))
+            full += time.time() - start
+            previous = current
+
+        print "%s: full raster %.1f ms, repaint changed countries %.1f ms per question" % (
+            key, full / repeat * 1000, repaint / repeat * 1000)
+
+if __name__ == '__main__':
+    benchmark()
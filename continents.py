@@ -0,0 +1,122 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Lazy per-continent loading of country data
+
+The ContinentRegistry loads a continent's countries the first time the
+continent is asked for, and keeps only the most recently used continents
+in memory.  Everything the game does per question then works on one
+continent's sorted key list instead of filtering the whole world.
+"""
+
+class Continent(object):
+    """The countries of a single continent
+
+    key -- continent key, e.g. "af"
+    data -- the continent's continents_data record
+    keys -- sorted list of the continent's country keys
+    countries -- dictionary of country key to country state, holding the
+        lang_* names, z_order, is_correct and is_current; these dictionaries
+        belong to the registry, so progress survives eviction
+    geometry -- the geometry store, already holding this continent's outlines
+    """
+    def __init__(self, key, data, keys, countries, geometry):
+        self.key = key
+        self.data = data
+        self.keys = keys
+        self.countries = countries
+        self.geometry = geometry
+        self._derived = {}
+
+    def name(self, key, language):
+        return self.countries[key]["lang_" + language]
+
+    def derived(self, name, build):
+        """Return data computed from this continent, building it only once
+
+        name -- cache key for the data
+        build -- callable taking this Continent and returning the data
+
+        Derived data (click indexes, simplified outlines and so on) is
+        evicted along with the continent.
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = build(self)
+            return value
+
+class ContinentRegistry(object):
+    """Loads continents on demand and evicts the ones not in use
+
+    continents_data, countries_data, geometry -- as returned by mapbundle.load
+    max_loaded -- how many continents to keep in memory at once
+
+    progress maps each country key seen so far to its state dictionary.
+    Evicting a continent drops its geometry and derived data but not its
+    progress, so answers given earlier count when it is loaded again.
+    """
+    def __init__(self, continents_data, countries_data, geometry, max_loaded=1):
+        self.continents_data = continents_data
+        self.countries_data = countries_data
+        self.geometry = geometry
+        self.max_loaded = max_loaded
+        self.progress = {}
+        # most recently used first
+        self._loaded = []
+
+    def get(self, continent):
+        """Return the Continent for the given key, loading it if necessary"""
+        for i, loaded in enumerate(self._loaded):
+            if loaded.key == continent:
+                if i:
+                    del self._loaded[i]
+                    self._loaded.insert(0, loaded)
+                return loaded
+
+        loaded = self._load(continent)
+        self._loaded.insert(0, loaded)
+        while len(self._loaded) > self.max_loaded:
+            self._evict(self._loaded.pop())
+        return loaded
+
+    def is_loaded(self, continent):
+        for loaded in self._loaded:
+            if loaded.key == continent:
+                return True
+        return False
+
+    def _load(self, continent):
+        keys = [key for key, record in self.countries_data.items()
+                if record["continent"] == continent]
+        keys.sort()
+        countries = {}
+        for key in keys:
+            state = self.progress.get(key)
+            if state is None:
+                state = self.progress[key] = dict(self.countries_data[key])
+                state["is_correct"] = 0
+            state["is_current"] = 0
+            countries[key] = state
+            # decode the outline now rather than in the middle of a question
+            self.geometry[key]
+        return Continent(continent, self.continents_data[continent], keys, countries, self.geometry)
+
+    def _evict(self, continent):
+        self.geometry.discard(continent.keys)
@@ -0,0 +1,379 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Pre-parsed country outlines
+
+The svg_path strings in mapdata are parsed once into a pair of compact
+arrays per country: one command code per segment and a flat array of
+float coordinates.  Renderers, hit-testers and exporters all share the
+same parsed copy through a GeometryStore, so nothing on a hot path has
+to tokenize path text again.
+"""
+
+import os
+import re
+import math
+from array import array
+
+# segment command codes
+MOVETO = 0
+LINETO = 1
+CURVETO = 2
+CLOSEPATH = 3
+
+# number of coordinates each command code consumes
+COORDS_PER_COMMAND = (2, 2, 6, 0)
+
+_token_re = re.compile(r'[MmLlHhVvCcZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+class PathParseError(Exception):
+    pass
+
+def parse_path(d):
+    """Parse svg path data into (commands, coords) arrays
+
+    Only the absolute and relative forms of M, L, H, V, C and Z are
+    understood, which covers everything in mapdata.  Relative and
+    horizontal/vertical segments are converted to absolute MOVETO,
+    LINETO and CURVETO codes so consumers only deal with four commands.
+    """
+    commands = array('B')
+    coords = array('f')
+    tokens = _token_re.findall(d)
+
+    x = y = 0.0
+    start_x = start_y = 0.0
+    command = None
+    i = 0
+    count = len(tokens)
+
+    def numbers(n):
+        if i + n > count:
+            raise PathParseError("Path data ends in the middle of a segment")
+        return [float(t) for t in tokens[i:i + n]]
+
+    while i < count:
+        token = tokens[i]
+        if token.isalpha():
+            command = token
+            i += 1
+            if command in 'Zz':
+                commands.append(CLOSEPATH)
+                x, y = start_x, start_y
+                continue
+        elif command is None:
+            raise PathParseError("Path data must start with a command, not " + token)
+
+        relative = command.islower()
+        upper = command.upper()
+        if upper == 'M' or upper == 'L':
+            nx, ny = numbers(2)
+            i += 2
+            if relative:
+                nx += x
+                ny += y
+            if upper == 'M':
+                commands.append(MOVETO)
+                start_x, start_y = nx, ny
+                # coordinate pairs following a moveto are implicit linetos
+                if relative:
+                    command = 'l'
+                else:
+                    command = 'L'
+            else:
+                commands.append(LINETO)
+            coords.extend((nx, ny))
+            x, y = nx, ny
+        elif upper == 'H' or upper == 'V':
+            value = numbers(1)[0]
+            i += 1
+            if upper == 'H':
+                if relative:
+                    value += x
+                x = value
+            else:
+                if relative:
+                    value += y
+                y = value
+            commands.append(LINETO)
+            coords.extend((x, y))
+        elif upper == 'C':
+            points = numbers(6)
+            i += 6
+            if relative:
+                for j in range(0, 6, 2):
+                    points[j] += x
+                    points[j + 1] += y
+            commands.append(CURVETO)
+            coords.extend(points)
+            x, y = points[4], points[5]
+        else:
+            raise PathParseError("Unsupported path command: " + command)
+
+    return commands, coords
+
+# svg path templates for each command code, used by to_svg_path
+_SVG_TEMPLATES = ('M %.3f,%.3f', 'L %.3f,%.3f', 'C %.3f,%.3f %.3f,%.3f %.3f,%.3f', 'z')
+
+class CountryGeometry(object):
+    """The parsed outline of a single country
+
+    commands -- array('B') of MOVETO/LINETO/CURVETO/CLOSEPATH codes
+    coords -- array('f') of x,y values, COORDS_PER_COMMAND[code] per command
+    bbox -- (min_x, min_y, max_x, max_y), including curve control points
+    """
+    __slots__ = ('commands', 'coords', 'bbox')
+
+    def __init__(self, commands, coords):
+        self.commands = commands
+        self.coords = coords
+        if coords:
+            xs = coords[0::2]
+            ys = coords[1::2]
+            self.bbox = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self.bbox = (0.0, 0.0, 0.0, 0.0)
+
+    def segments(self):
+        """Iterate over (command, coordinate tuple) pairs"""
+        coords = self.coords
+        offset = 0
+        for command in self.commands:
+            n = COORDS_PER_COMMAND[command]
+            yield command, tuple(coords[offset:offset + n])
+            offset += n
+
+    def to_svg_path(self):
+        """Serialize back to absolute svg path data"""
+        return ' '.join([_SVG_TEMPLATES[command] % points
+                         for command, points in self.segments()])
+
+    def num_vertices(self):
+        return len(self.coords) // 2
+
+    def flatten(self, tolerance):
+        """Flatten the outline into closed polylines
+
+        tolerance -- maximum distance, in path units, between a curve and
+            the line segments replacing it
+
+        returns a list of rings, each an array('f') of x,y values
+        """
+        rings = []
+        ring = None
+        coords = self.coords
+        offset = 0
+        x = y = 0.0
+        for command in self.commands:
+            if command == MOVETO:
+                x, y = coords[offset], coords[offset + 1]
+                ring = array('f', (x, y))
+                rings.append(ring)
+            elif command == LINETO:
+                x, y = coords[offset], coords[offset + 1]
+                ring.extend((x, y))
+            elif command == CURVETO:
+                _flatten_curve(ring, x, y, coords[offset:offset + 6], tolerance)
+                x, y = coords[offset + 4], coords[offset + 5]
+            offset += COORDS_PER_COMMAND[command]
+        return [r for r in rings if len(r) >= 6]
+
+def _flatten_curve(ring, x0, y0, points, tolerance):
+    """Append a cubic bezier to ring as line segments"""
+    x1, y1, x2, y2, x3, y3 = points
+    # Wang's formula: enough uniform steps to stay within tolerance
+    ddx = max(abs(x0 - 2 * x1 + x2), abs(x1 - 2 * x2 + x3))
+    ddy = max(abs(y0 - 2 * y1 + y2), abs(y1 - 2 * y2 + y3))
+    steps = int(math.ceil(math.sqrt(0.75 * math.sqrt(ddx * ddx + ddy * ddy) / tolerance)))
+    for i in range(1, steps):
+        t = float(i) / steps
+        mt = 1 - t
+        a = mt * mt * mt
+        b = 3 * mt * mt * t
+        c = 3 * mt * t * t
+        d = t * t * t
+        ring.extend((a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3))
+    ring.extend((x3, y3))
+
+def parse_geometry(d):
+    """Parse svg path data into a CountryGeometry"""
+    commands, coords = parse_path(d)
+    return CountryGeometry(commands, coords)
+
+def polyline_geometry(rings):
+    """Make a CountryGeometry of straight-sided rings
+
+    rings -- flat x,y arrays, each not repeating its first point
+    """
+    commands = array('B')
+    coords = array('f')
+    for ring in rings:
+        if len(ring) < 2:
+            continue
+        commands.append(MOVETO)
+        commands.extend(array('B', [LINETO]) * (len(ring) // 2 - 1))
+        commands.append(CLOSEPATH)
+        coords.extend(ring)
+    return CountryGeometry(commands, coords)
+
+class GeometryStore(object):
+    """Parsed country geometry, keyed by country key
+
+    paths -- dictionary mapping country keys to svg path data
+
+    Each path is parsed the first time it is asked for.  The path text is
+    kept, so discard() can drop the parsed copies of an evicted continent
+    and they are parsed again if it comes back.
+    """
+    def __init__(self, paths):
+        self._paths = dict(paths)
+        self._keys = sorted(self._paths)
+        self._parsed = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._parsed[key]
+        except KeyError:
+            geometry = parse_geometry(self._paths[key])
+            self._parsed[key] = geometry
+            return geometry
+
+    def __contains__(self, key):
+        return key in self._paths
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return list(self._keys)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def discard(self, keys):
+        """Forget parsed geometry; it is parsed again if needed"""
+        for key in keys:
+            self._parsed.pop(key, None)
+
+    def parse_all(self):
+        """Parse everything that has not been parsed yet"""
+        for key in self._keys:
+            self[key]
+
+def rss_kb():
+    """Return our current resident set size in kilobytes, or None if unknown"""
+    try:
+        fh = open('/proc/self/statm')
+    except IOError:
+        return None
+    try:
+        resident_pages = int(fh.read().split()[1])
+    finally:
+        fh.close()
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+# how many copies of a continent's paths the RSS measurement holds; one
+# copy is a few dozen kB, which the interpreter's spare pages can absorb
+RSS_COPIES = 100
+
+_rss_script = """
+import sys, gc
+sys.path.insert(0, %(directory)r)
+from mapdata import countries_data
+from geometry import parse_geometry, rss_kb
+paths = dict([(k, v["svg_path"]) for k, v in countries_data.items()
+              if k.startswith(%(prefix)r)])
+gc.collect()
+before = rss_kb()
+copies = []
+for i in range(%(copies)d):
+    if %(parsed)r:
+        copies.append(dict([(k, parse_geometry(p)) for k, p in paths.items()]))
+    else:
+        # slicing makes a new string, so every copy has its own text
+        copies.append(dict([(k, p[:-1] + p[-1]) for k, p in paths.items()]))
+gc.collect()
+after = rss_kb()
+if before is None or after is None:
+    print None
+else:
+    print after - before
+"""
+
+def _rss_kb_per_copy(continent, parsed, copies=RSS_COPIES):
+    """RSS growth per copy of a continent's paths, in a fresh interpreter
+
+    parsed -- measure parsed geometry rather than the path strings
+
+    Freed memory stays with the interpreter and is reused, so growth is
+    only visible in a new one.  Returns None if RSS is unknown.
+    """
+    import sys
+    import subprocess
+    script = _rss_script % {'directory': os.path.dirname(os.path.abspath(__file__)),
+                            'prefix': continent + "_", 'copies': copies, 'parsed': parsed}
+    process = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE)
+    output = process.communicate()[0].strip()
+    if output == 'None':
+        return None
+    return int(output) / float(copies)
+
+def benchmark(continents=('af', 'sa'), repeat=5):
+    """Compare parse time and memory of parsed geometry with the path strings"""
+    import sys
+    import time
+    from mapdata import countries_data
+
+    for continent in continents:
+        paths = dict([(k, v["svg_path"]) for k, v in countries_data.items()
+                      if k.startswith(continent + "_")])
+
+        best = None
+        for i in range(repeat):
+            start = time.time()
+            store = GeometryStore(paths)
+            store.parse_all()
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+
+        # both forms are held in a dictionary keyed by country
+        text_bytes = sys.getsizeof(paths) + sum([sys.getsizeof(p) for p in paths.values()])
+        parsed_bytes = sys.getsizeof(store._parsed)
+        vertices = 0
+        for key in store.keys():
+            geometry = store[key]
+            parsed_bytes += (sys.getsizeof(geometry) + sys.getsizeof(geometry.commands) +
+                             sys.getsizeof(geometry.coords) + sys.getsizeof(geometry.bbox))
+            vertices += geometry.num_vertices()
+
+        print "%s: %d countries, %d vertices" % (continent, len(store), vertices)
+        print "  parse all paths:  %.2f ms" % (best * 1000)
+        print "                    path strings  parsed"
+        print "  getsizeof:        %8d B    %8d B" % (text_bytes, parsed_bytes)
+        text_rss = _rss_kb_per_copy(continent, False)
+        parsed_rss = _rss_kb_per_copy(continent, True)
+        if text_rss is not None and parsed_rss is not None:
+            print "  RSS per copy:     %8.1f kB   %8.1f kB  (%d copies each)" % (
+                text_rss, parsed_rss, RSS_COPIES)
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,231 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Click and tap picking of countries and continents
+
+A SpatialIndex holds polygons in screen space.  A uniform grid of cells
+narrows a click down to the few polygons whose bounding boxes cover it,
+and only those get an exact point-in-polygon test.
+"""
+
+import re
+from array import array
+
+from geometry import parse_geometry
+
+# maximum distance, in screen pixels, between a curve and its polyline
+PICK_TOLERANCE = 0.5
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+def multiply(m, n):
+    """Compose two svg-style (a, b, c, d, e, f) matrices, applying n first"""
+    a, b, c, d, e, f = m
+    na, nb, nc, nd, ne, nf = n
+    return (a * na + c * nb, b * na + d * nb,
+            a * nc + c * nd, b * nc + d * nd,
+            a * ne + c * nf + e, b * ne + d * nf + f)
+
+def continent_matrix(continent_data):
+    """The map transform continent_group applies for a continents_data record"""
+    scale = continent_data["svg_scale"]
+    return (scale, 0.0, 0.0, scale,
+            float(continent_data["svg_translate_x"]), float(continent_data["svg_translate_y"]))
+
+def transform_ring(ring, matrix):
+    """Return a copy of a flat x,y array with matrix applied"""
+    a, b, c, d, e, f = matrix
+    result = array('f', ring)
+    for i in range(0, len(ring), 2):
+        x = ring[i]
+        y = ring[i + 1]
+        result[i] = a * x + c * y + e
+        result[i + 1] = b * x + d * y + f
+    return result
+
+def matrix_scale(matrix):
+    """Rough uniform scale factor of a matrix, for picking tolerances"""
+    a, b, c, d = matrix[:4]
+    return max(abs(a * d - b * c) ** 0.5, 1e-6)
+
+def point_in_rings(x, y, rings):
+    """Even-odd point-in-polygon test over a list of flat x,y rings"""
+    inside = False
+    for ring in rings:
+        n = len(ring)
+        px = ring[n - 2]
+        py = ring[n - 1]
+        for i in range(0, n, 2):
+            qx = ring[i]
+            qy = ring[i + 1]
+            if (qy > y) != (py > y):
+                if x < (px - qx) * (y - qy) / (py - qy) + qx:
+                    inside = not inside
+            px = qx
+            py = qy
+    return inside
+
+def rings_bbox(rings):
+    xs = []
+    ys = []
+    for ring in rings:
+        xs.append(min(ring[0::2]))
+        xs.append(max(ring[0::2]))
+        ys.append(min(ring[1::2]))
+        ys.append(max(ring[1::2]))
+    return min(xs), min(ys), max(xs), max(ys)
+
+class SpatialIndex(object):
+    """Grid-bucketed polygons for picking
+
+    cell_size -- edge length of a grid cell in screen pixels
+
+    Polygons are added in drawing order, so when they overlap the one
+    drawn last (on top) wins.
+    """
+    def __init__(self, cell_size=40):
+        self.cell_size = cell_size
+        self._entries = []
+        self._cells = {}
+
+    def add(self, key, rings):
+        """Add a polygon, given as a list of flat x,y rings in screen space"""
+        if not rings:
+            return
+        bbox = rings_bbox(rings)
+        index = len(self._entries)
+        self._entries.append((key, bbox, rings))
+        size = self.cell_size
+        for cx in range(int(bbox[0] // size), int(bbox[2] // size) + 1):
+            for cy in range(int(bbox[1] // size), int(bbox[3] // size) + 1):
+                self._cells.setdefault((cx, cy), []).append(index)
+
+    def pick(self, x, y):
+        """Return the key of the top-most polygon containing x,y, or None"""
+        size = self.cell_size
+        candidates = self._cells.get((int(x // size), int(y // size)))
+        if not candidates:
+            return None
+        entries = self._entries
+        for index in reversed(candidates):
+            key, bbox, rings = entries[index]
+            if bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]:
+                if point_in_rings(x, y, rings):
+                    return key
+        return None
+
+    def __len__(self):
+        return len(self._entries)
+
+def country_index(continent, screen=None):
+    """Build a SpatialIndex over a continents.Continent's countries
+
+    screen -- optional transform.ScreenGeometry whose outlines, already in
+        screen pixels, are indexed as drawn.  Without one, countries are
+        placed with the continent's svg_scale and svg_translate_* values.
+    """
+    keys = list(continent.keys)
+    keys.sort(key=lambda k: continent.countries[k]["z_order"])
+    index = SpatialIndex()
+    if screen is not None:
+        for key in keys:
+            index.add(key, screen.rings(key))
+        return index
+
+    matrix = continent_matrix(continent.data)
+    tolerance = PICK_TOLERANCE / matrix_scale(matrix)
+    for key in keys:
+        rings = continent.geometry[key].flatten(tolerance)
+        index.add(key, [transform_ring(ring, matrix) for ring in rings])
+    return index
+
+_tag_re = re.compile(r'<(/?)(g|path)\b([^>]*?)(/?)>', re.S)
+_attribute_re = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+_transform_re = re.compile(r'(matrix|translate|scale)\s*\(([^)]*)\)')
+_continent_fill_re = re.compile(r'cont_(\w+?)_fill')
+
+def parse_transform(text):
+    """Parse an svg transform attribute into an (a, b, c, d, e, f) matrix"""
+    matrix = IDENTITY
+    for name, args in _transform_re.findall(text or ''):
+        values = [float(v) for v in re.split(r'[\s,]+', args.strip()) if v]
+        if name == 'matrix':
+            step = tuple(values)
+        elif name == 'translate':
+            if len(values) == 1:
+                values.append(0.0)
+            step = (1.0, 0.0, 0.0, 1.0, values[0], values[1])
+        else:
+            if len(values) == 1:
+                values.append(values[0])
+            step = (values[0], 0.0, 0.0, values[1], 0.0, 0.0)
+        matrix = multiply(matrix, step)
+    return matrix
+
+def picker_index(svg_data):
+    """Build a SpatialIndex over the continent outlines of the picker svg
+
+    Paths filled with a cont_<key>_fill placeholder are indexed under the
+    continent key, with every enclosing group's transform applied.
+    """
+    index = SpatialIndex()
+    stack = [IDENTITY]
+    for closing, tag, attributes, self_closing in _tag_re.findall(svg_data):
+        if closing:
+            if tag == 'g' and len(stack) > 1:
+                stack.pop()
+            continue
+        attributes = dict(_attribute_re.findall(attributes))
+        matrix = multiply(stack[-1], parse_transform(attributes.get('transform')))
+        if tag == 'g':
+            if not self_closing:
+                stack.append(matrix)
+            continue
+        match = _continent_fill_re.search(attributes.get('style', ''))
+        if match and attributes.get('d'):
+            tolerance = PICK_TOLERANCE / matrix_scale(matrix)
+            rings = parse_geometry(attributes['d']).flatten(tolerance)
+            index.add(match.group(1), [transform_ring(ring, matrix) for ring in rings])
+    return index
+
+def benchmark(step=4, width=1200, height=900):
+    """Time picks over a dense click grid for each continent"""
+    import time
+    import mapbundle
+    from continents import ContinentRegistry
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    points = [(x, y) for x in range(0, width, step) for y in range(0, height, step)]
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        start = time.time()
+        index = country_index(continent)
+        built = time.time() - start
+
+        start = time.time()
+        hits = 0
+        for x, y in points:
+            if index.pick(x, y) is not None:
+                hits += 1
+        elapsed = time.time() - start
+        print "%s: index built in %.1f ms, %d picks (%d hits), %.1f us per pick" % (
+            key, built * 1000, len(points), hits, elapsed / len(points) * 1e6)
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,166 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Palette-indexed country map
+
+An IdMap rasterizes a continent once into an 8-bit surface in which each
+pixel holds the palette index of the country under it.  Blitting the
+surface looks the index up in the palette, so marking a country correct
+or current is a single palette change with no drawing at all, and the
+same pixels answer "which country is at x,y" with one lookup.
+
+The map is drawn without antialiasing; the cairo MapCompositor remains
+the default for better looking output.
+"""
+
+import pygame
+
+from hittest import matrix_scale
+from mapsvg import STATE_COLORS, country_state, render_order
+
+# palette index of pixels outside every country (drawn transparent)
+BACKGROUND = 0
+# palette index of the country outlines
+BORDER = 255
+
+BORDER_COLOR = (0, 0, 0)
+
+class IdMap(object):
+    """A continent's map as country indices plus a palette
+
+    continent -- the continents.Continent to draw
+    screen -- the continent's transform.ScreenGeometry
+    size -- (width, height) of the map in pixels
+    fallback -- optional callable (x, y) -> key used to pick on outline
+        pixels, which belong to no country
+    """
+    def __init__(self, continent, screen, size=(1200, 1230), fallback=None):
+        self.continent = continent
+        self.keys = render_order(continent)
+        if len(self.keys) >= BORDER:
+            raise ValueError("%d countries do not fit an 8-bit palette" % len(self.keys))
+        self.size = size
+        self.fallback = fallback
+        self.screen = screen
+
+        self.image = pygame.Surface(size, 0, 8)
+        palette = [BORDER_COLOR] * 256
+        self.image.set_palette(palette)
+        self.image.fill(BACKGROUND)
+        self._indices = {}
+        outlines = []
+        for position, key in enumerate(self.keys):
+            index = self._indices[key] = position + 1
+            for ring in screen.rings(key):
+                points = zip(ring[0::2], ring[1::2])
+                if len(points) >= 3:
+                    pygame.draw.polygon(self.image, index, points)
+                    outlines.append(points)
+        width = max(1, int(round(matrix_scale(screen.matrix))))
+        for points in outlines:
+            pygame.draw.lines(self.image, BORDER, True, points, width)
+        self.image.set_colorkey(BACKGROUND)
+
+        # a copy of the indices for picking, one byte per pixel
+        self._pixels = pygame.image.tostring(self.image, 'P')
+        self._colors = {}
+
+    def render(self, keys):
+        """Recolour the countries in keys whose state changed
+
+        returns the on-screen rectangles of the recoloured countries
+        """
+        rects = []
+        countries = self.continent.countries
+        if not self._colors:
+            keys = self.keys
+        for key in keys:
+            if key not in self._indices:
+                continue
+            color = STATE_COLORS[country_state(countries[key])]
+            if self._colors.get(key) != color:
+                self._colors[key] = color
+                self.image.set_palette_at(self._indices[key], color)
+                min_x, min_y, max_x, max_y = self.screen.bbox(key)
+                rects.append(pygame.Rect(int(min_x), int(min_y),
+                    int(max_x - min_x) + 2, int(max_y - min_y) + 2))
+        return rects
+
+    def prepare(self, fills):
+        """Nothing needs rendering ahead of time; recolouring is a palette change"""
+        return None
+
+    def apply(self, prepared):
+        """Counterpart of MapCompositor.apply; render() does the recolouring"""
+        return []
+
+    def pick(self, x, y):
+        """Return the key of the country at x,y, or None"""
+        width, height = self.size
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        index = ord(self._pixels[int(y) * width + int(x)])
+        if index == BACKGROUND:
+            return None
+        if index == BORDER:
+            if self.fallback is not None:
+                return self.fallback(x, y)
+            return None
+        return self.keys[index - 1]
+
+def benchmark(repeat=100):
+    """Time building the id map, recolouring a country and picking"""
+    import time
+    import mapbundle
+    import simplify
+    import transform
+    from continents import ContinentRegistry
+
+    pygame.init()
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        lod = simplify.LevelsOfDetail(continent)
+        level = lod.choose_level(simplify.effective_scale(continent.data))
+        screen = transform.ScreenGeometry(continent.keys, lambda k: lod.rings(k, level),
+            transform.screen_matrix(continent.data))
+
+        start = time.time()
+        idmap = IdMap(continent, screen)
+        idmap.render(continent.keys)
+        built = time.time() - start
+
+        country = continent.keys[0]
+        start = time.time()
+        for i in range(repeat):
+            continent.countries[country]["is_current"] = i % 2
+            idmap.render([country])
+        recolour = (time.time() - start) / repeat
+
+        points = [(x, y) for x in range(0, 1200, 4) for y in range(0, 1230, 4)]
+        start = time.time()
+        for x, y in points:
+            idmap.pick(x, y)
+        pick = (time.time() - start) / len(points)
+
+        print "%s: built in %.1f ms, recolour %.3f ms, pick %.2f us" % (
+            key, built * 1000, recolour * 1000, pick * 1e6)
+
+if __name__ == '__main__':
+    benchmark()
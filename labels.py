@@ -0,0 +1,190 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Country name labels for practice mode
+
+Every country gets a label anchor at its pole of inaccessibility, the
+point inside it farthest from its outline, which stays inside concave
+shapes like Chile or Mozambique where a centroid would not.  Anchors are
+computed once, by setup.py into the map bundle, and a LabelLayer renders
+each name once and culls colliding labels once, so drawing the labels is
+just a handful of blits.
+"""
+
+import heapq
+import math
+
+from hittest import point_in_rings, continent_matrix
+
+# label anchors are found to within this many map units
+PRECISION = 1.0
+
+# outlines are flattened this coarsely for label placement, in map units
+FLATTEN_TOLERANCE = 1.0
+
+def _outline_distance(x, y, rings):
+    """Distance from x,y to the nearest outline segment"""
+    best = None
+    for ring in rings:
+        n = len(ring)
+        ax, ay = ring[n - 2], ring[n - 1]
+        for i in range(0, n, 2):
+            bx, by = ring[i], ring[i + 1]
+            dx = bx - ax
+            dy = by - ay
+            length = dx * dx + dy * dy
+            if length == 0:
+                t = 0.0
+            else:
+                t = max(0.0, min(1.0, ((x - ax) * dx + (y - ay) * dy) / length))
+            ex = ax + t * dx - x
+            ey = ay + t * dy - y
+            d = ex * ex + ey * ey
+            if best is None or d < best:
+                best = d
+            ax, ay = bx, by
+    return math.sqrt(best)
+
+def _signed_distance(x, y, rings):
+    """Distance to the outline, negative outside the country"""
+    distance = _outline_distance(x, y, rings)
+    if point_in_rings(x, y, rings):
+        return distance
+    return -distance
+
+def pole_of_inaccessibility(rings, precision=PRECISION):
+    """Return (x, y, radius) of the point inside rings farthest from the outline
+
+    This is the polylabel algorithm: a quadtree search over the bounding
+    box that drops any cell which cannot hold a better point than the
+    best one found so far.
+    """
+    xs = [ring[i] for ring in rings for i in range(0, len(ring), 2)]
+    ys = [ring[i + 1] for ring in rings for i in range(0, len(ring), 2)]
+    min_x, min_y, max_x, max_y = min(xs), min(ys), max(xs), max(ys)
+    cell_size = min(max_x - min_x, max_y - min_y)
+    if cell_size == 0:
+        return min_x, min_y, 0.0
+
+    def cell(x, y, half):
+        d = _signed_distance(x, y, rings)
+        # (negated best possible distance inside the cell, for the heap)
+        return (-(d + half * math.sqrt(2)), d, x, y, half)
+
+    heap = []
+    half = cell_size / 2.0
+    x = min_x
+    while x < max_x:
+        y = min_y
+        while y < max_y:
+            heapq.heappush(heap, cell(x + half, y + half, half))
+            y += cell_size
+        x += cell_size
+
+    best = cell((min_x + max_x) / 2.0, (min_y + max_y) / 2.0, 0)
+    while heap:
+        candidate = heapq.heappop(heap)
+        potential, d, x, y, half = candidate
+        if d > best[1]:
+            best = candidate
+        if -potential - best[1] <= precision:
+            continue
+        half /= 2.0
+        for dx in (-half, half):
+            for dy in (-half, half):
+                heapq.heappush(heap, cell(x + dx, y + dy, half))
+    return best[2], best[3], max(best[1], 0.0)
+
+def label_anchors(keys, geometry):
+    """Return a dictionary of key to (x, y, radius) label anchors in map units"""
+    anchors = {}
+    for key in keys:
+        rings = geometry[key].flatten(FLATTEN_TOLERANCE)
+        if rings:
+            anchors[key] = pole_of_inaccessibility(rings)
+    return anchors
+
+def continent_anchors(continent):
+    """Return the label anchors of a continents.Continent
+
+    A compiled map bundle already holds them; otherwise they are computed
+    from the outlines.
+    """
+    stored = getattr(continent.geometry, "label_anchors", None)
+    if stored is not None:
+        return stored(continent.key)
+    return label_anchors(continent.keys, continent.geometry)
+
+class LabelLayer(object):
+    """Pre-rendered, collision-culled country names for one continent
+
+    continent -- the continents.Continent to label
+    anchors -- label anchors as returned by continent_anchors
+    font -- pygame font used to render the names
+    language -- language code of the names
+    color -- text colour
+    matrix -- map to screen matrix, the continent's own placement if None
+    """
+    def __init__(self, continent, anchors, font, language, color=(255, 255, 255), matrix=None):
+        if matrix is None:
+            matrix = continent_matrix(continent.data)
+        a, b, c, d, e, f = matrix
+        # the roomiest countries get their labels placed first
+        keys = [key for key in continent.keys if key in anchors]
+        keys.sort(key=lambda k: -anchors[k][2])
+
+        self.labels = []
+        placed = []
+        for key in keys:
+            x, y, radius = anchors[key]
+            image = font.render(continent.name(key, language), 1, color)
+            rect = image.get_rect()
+            rect.center = (int(a * x + c * y + e), int(b * x + d * y + f))
+            if rect.collidelist(placed) != -1:
+                continue
+            placed.append(rect)
+            self.labels.append((image, rect))
+
+    def draw(self, surface):
+        """Blit the labels onto surface, returning the rectangles drawn"""
+        rects = []
+        for image, rect in self.labels:
+            surface.blit(image, rect)
+            rects.append(rect)
+        return rects
+
+def benchmark():
+    """Time computing the label anchors of each continent"""
+    import time
+    import mapbundle
+    from continents import ContinentRegistry
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        start = time.time()
+        anchors = label_anchors(continent.keys, continent.geometry)
+        elapsed = time.time() - start
+        print "%s: %d anchors in %.0f ms" % (key, len(anchors), elapsed * 1000)
+        for country in ('af_moza', 'sa_chil'):
+            if country in anchors:
+                print "  %s at %.1f,%.1f, radius %.1f" % ((country,) + anchors[country])
+
+if __name__ == '__main__':
+    benchmark()
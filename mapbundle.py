@@ -0,0 +1,535 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Compact binary map bundle
+
+setup.py compiles mapdata into BUNDLE_FILENAME, and at runtime the file is
+opened with mmap so that only the index is read up front.  A country's
+geometry is paged in and decoded the first time it is asked for.
+
+Layout (all values little-endian):
+
+    header
+    language table   -- one string reference per language code
+    continent table  -- key, names, svg_scale, svg_translate_*, outline,
+                        arc table
+    country table    -- key, names, continent index, z_order, neighbours,
+                        label anchor, rings
+    string table     -- utf-8 text for all of the above
+    geometry data    -- per continent outline: command codes, then
+                        coordinates quantized to 16 bits within its bbox;
+                        per continent: the vertex count of each of its
+                        topology arcs, then all the arc coordinates
+                        quantized to 16 bits within the continent's bbox;
+                        per country: its rings as signed 16-bit arc
+                        references (see topology), and its adjacency
+                        ranking as 16-bit country indices
+
+Borders shared by two countries are stored once, as an arc, and country
+outlines are joined back up from the arcs when they are decoded.
+
+Remember to re-run setup.py after editing mapdata, or delete the bundle
+so that load() falls back to mapdata.
+"""
+
+import os
+import sys
+import mmap
+import logging
+import struct
+from array import array
+
+from geometry import parse_geometry, polyline_geometry, CountryGeometry
+
+log = logging.getLogger('mapbundle')
+
+BUNDLE_FILENAME = "geoquiz.map"
+
+MAGIC = "GQMB"
+VERSION = 4
+
+# magic, version, language count, continent count, country count,
+# string table offset, string table size, geometry data offset
+_header = struct.Struct('<4sHHHHIII')
+# offset into the string table, length in bytes
+_string_ref = struct.Struct('<IH')
+# bbox, command offset, command count, coordinate offset, coordinate count
+_geometry_ref = struct.Struct('<4fIIII')
+# bbox, arc vertex count offset, arc count, coordinate offset, coordinate count
+_arc_table_ref = struct.Struct('<4fIIII')
+# arc reference offset, number of 16-bit values: the ring count, then for
+# each ring its arc count followed by its arc references
+_rings_ref = struct.Struct('<II')
+# svg_scale, svg_translate_x, svg_translate_y
+_continent_fields = struct.Struct('<3d')
+# continent index, z_order, neighbour ranking offset, ranking length,
+# number of bordering countries at the start of the ranking,
+# label anchor x, y and radius
+_country_fields = struct.Struct('<HHIHH3f')
+
+QUANTIZE_STEPS = 65535
+
+big_endian = struct.pack('=i', 1) == struct.pack('>i', 1)
+
+class MapBundleError(Exception):
+    pass
+
+def _quantize(coords, bbox):
+    """Map x,y values to 16-bit steps within bbox, in file byte order"""
+    min_x, min_y, max_x, max_y = bbox
+    span_x = (max_x - min_x) or 1.0
+    span_y = (max_y - min_y) or 1.0
+    quantized = array('H')
+    for i in range(0, len(coords), 2):
+        quantized.append(int(round((coords[i] - min_x) / span_x * QUANTIZE_STEPS)))
+        quantized.append(int(round((coords[i + 1] - min_y) / span_y * QUANTIZE_STEPS)))
+    if big_endian:
+        quantized.byteswap()
+    return quantized
+
+class _Writer(object):
+    """Accumulates the string table and geometry data while compiling"""
+    def __init__(self):
+        self.strings = []
+        self.strings_size = 0
+        self.string_refs = {}
+        self.data = []
+        self.data_size = 0
+
+    def string(self, text):
+        if isinstance(text, unicode):
+            text = text.encode('utf-8')
+        if text not in self.string_refs:
+            self.string_refs[text] = _string_ref.pack(self.strings_size, len(text))
+            self.strings.append(text)
+            self.strings_size += len(text)
+        return self.string_refs[text]
+
+    def _append(self, data):
+        # keep coordinate runs two-byte aligned
+        if self.data_size % 2:
+            self.data.append('\0')
+            self.data_size += 1
+        offset = self.data_size
+        self.data.append(data)
+        self.data_size += len(data)
+        return offset
+
+    def indices(self, values, typecode='H'):
+        """Store a list of 16-bit values, returning the data offset"""
+        data = array(typecode, values)
+        if big_endian:
+            data.byteswap()
+        return self._append(data.tostring())
+
+    def arcs(self, arcs):
+        """Store a continent's topology arcs, returning the arc table reference"""
+        coords = array('f')
+        lengths = []
+        for arc in arcs:
+            if len(arc) // 2 > 0xffff:
+                raise MapBundleError("An arc has more than 65535 vertices")
+            lengths.append(len(arc) // 2)
+            coords.extend(arc)
+        if coords:
+            min_x, min_y = min(coords[0::2]), min(coords[1::2])
+            max_x, max_y = max(coords[0::2]), max(coords[1::2])
+        else:
+            min_x = min_y = max_x = max_y = 0.0
+        quantized = _quantize(coords, (min_x, min_y, max_x, max_y))
+        lengths_offset = self.indices(lengths)
+        coord_offset = self._append(quantized.tostring())
+        return _arc_table_ref.pack(min_x, min_y, max_x, max_y,
+            lengths_offset, len(lengths), coord_offset, len(quantized))
+
+    def rings(self, rings):
+        """Store a country's rings of arc references, returning their reference"""
+        values = [len(rings)]
+        for ring in rings:
+            values.append(len(ring))
+            values.extend(ring)
+        return _rings_ref.pack(self.indices(values, 'h'), len(values))
+
+    def geometry(self, geometry):
+        min_x, min_y, max_x, max_y = geometry.bbox
+        quantized = _quantize(geometry.coords, geometry.bbox)
+        command_offset = self._append(geometry.commands.tostring())
+        coord_offset = self._append(quantized.tostring())
+        return _geometry_ref.pack(min_x, min_y, max_x, max_y,
+            command_offset, len(geometry.commands), coord_offset, len(quantized))
+
+def compile_bundle(filename, continents_data, countries_data):
+    """Write continents_data and countries_data out as a map bundle"""
+    # only compiling needs the builders; opening a bundle stays cheap
+    from topology import build_topology, FLATTEN_TOLERANCE
+    from adjacency import build_adjacency, continent_shapes
+    from labels import label_anchors
+
+    languages = set()
+    for record in continents_data.values() + countries_data.values():
+        for field in record:
+            if field.startswith("lang_"):
+                languages.add(field[5:])
+    languages = sorted(languages)
+    continent_keys = sorted(continents_data)
+    country_keys = sorted(countries_data)
+
+    writer = _Writer()
+
+    def names(record):
+        return ''.join([writer.string(record.get("lang_" + language, "")) for language in languages])
+
+    tables = [writer.string(language) for language in languages]
+
+    geometries = dict([(key, parse_geometry(countries_data[key]["svg_path"])) for key in country_keys])
+    adjacency = {}
+    topologies = {}
+    for continent in continent_keys:
+        keys = [key for key in country_keys if key.split("_", 1)[0] == continent]
+        graph = build_adjacency(continent_shapes(keys, geometries))
+        for key in keys:
+            adjacency[key] = (graph.ranked[key], graph.bordering[key])
+        topologies[continent] = build_topology(dict([(key, geometries[key].flatten(FLATTEN_TOLERANCE))
+                                                     for key in keys]))
+        if len(topologies[continent].arcs) > 0x7fff:
+            raise MapBundleError("Continent %s has too many arcs" % continent)
+    anchors = label_anchors(country_keys, geometries)
+
+    for key in continent_keys:
+        record = continents_data[key]
+        tables.append(writer.string(key))
+        tables.append(names(record))
+        tables.append(_continent_fields.pack(record["svg_scale"],
+            record["svg_translate_x"], record["svg_translate_y"]))
+        outline = record.get("svg_outline_path")
+        if outline:
+            outline = parse_geometry(outline)
+        else:
+            outline = CountryGeometry(array('B'), array('f'))
+        tables.append(writer.geometry(outline))
+        tables.append(writer.arcs(topologies[key].arcs))
+
+    for key in country_keys:
+        record = countries_data[key]
+        continent = key.split("_", 1)[0]
+        if continent not in continents_data:
+            raise MapBundleError("Country %s is not in a known continent" % key)
+        tables.append(writer.string(key))
+        tables.append(names(record))
+        ranked, bordering = adjacency[key]
+        ranking = writer.indices([country_keys.index(other) for other in ranked])
+        anchor_x, anchor_y, radius = anchors.get(key, (0.0, 0.0, 0.0))
+        tables.append(_country_fields.pack(continent_keys.index(continent), record["z_order"],
+            ranking, len(ranked), bordering, anchor_x, anchor_y, radius))
+        tables.append(writer.rings(topologies[continent].objects.get(key, [])))
+
+    tables = ''.join(tables)
+    strings = ''.join(writer.strings)
+    strings_offset = _header.size + len(tables)
+    data_offset = strings_offset + len(strings)
+    data_offset += data_offset % 2
+
+    header = _header.pack(MAGIC, VERSION, len(languages), len(continent_keys),
+        len(country_keys), strings_offset, len(strings), data_offset)
+
+    temp_filename = filename + ".tmp"
+    fh = open(temp_filename, 'wb')
+    try:
+        fh.write(header)
+        fh.write(tables)
+        fh.write(strings)
+        fh.write('\0' * (data_offset - strings_offset - len(strings)))
+        fh.write(''.join(writer.data))
+    finally:
+        fh.close()
+    os.rename(temp_filename, filename)
+
+class MapBundle(object):
+    """A compiled map bundle, opened with mmap
+
+    continents_data and countries_data are built from the index and look
+    like their mapdata counterparts minus the path strings.  The bundle is
+    also a geometry store: index it by country key to get the country's
+    CountryGeometry, decoded from the mapped file on first use.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        fh = open(filename, 'rb')
+        try:
+            if os.fstat(fh.fileno()).st_size < _header.size:
+                raise MapBundleError("%s is too short to be a map bundle" % filename)
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            fh.close()
+
+        (magic, version, num_languages, num_continents, num_countries,
+            self._strings_offset, strings_size, self._data_offset) = \
+            _header.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise MapBundleError("%s is not a map bundle" % filename)
+        if version != VERSION:
+            self._map.close()
+            raise MapBundleError("%s is map bundle version %d, expected %d" % (filename, version, VERSION))
+
+        offset = _header.size
+        self.languages = []
+        for i in range(num_languages):
+            self.languages.append(str(self._read_string(offset)))
+            offset += _string_ref.size
+
+        self.continents_data = {}
+        self._outline_refs = {}
+        self._arc_table_refs = {}
+        continent_keys = []
+        for i in range(num_continents):
+            key, record, offset = self._read_names(offset)
+            (record["svg_scale"], record["svg_translate_x"], record["svg_translate_y"]) = \
+                _continent_fields.unpack_from(self._map, offset)
+            offset += _continent_fields.size
+            self._outline_refs[key] = offset
+            offset += _geometry_ref.size
+            self._arc_table_refs[key] = offset
+            offset += _arc_table_ref.size
+            self.continents_data[key] = record
+            continent_keys.append(key)
+
+        self.countries_data = {}
+        self._rings_refs = {}
+        self._adjacency_refs = {}
+        self._label_anchors = {}
+        for i in range(num_countries):
+            key, record, offset = self._read_names(offset)
+            (continent, record["z_order"], ranking, ranked, bordering,
+                anchor_x, anchor_y, radius) = _country_fields.unpack_from(self._map, offset)
+            offset += _country_fields.size
+            record["continent"] = continent_keys[continent]
+            self._adjacency_refs[key] = (ranking, ranked, bordering)
+            self._label_anchors[key] = (anchor_x, anchor_y, radius)
+            self._rings_refs[key] = _rings_ref.unpack_from(self._map, offset)
+            offset += _rings_ref.size
+            self.countries_data[key] = record
+
+        self._keys = sorted(self.countries_data)
+        self._parsed = {}
+        self._topologies = {}
+
+    def _read_string(self, offset):
+        start, length = _string_ref.unpack_from(self._map, offset)
+        start += self._strings_offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def _read_names(self, offset):
+        key = str(self._read_string(offset))
+        offset += _string_ref.size
+        record = {}
+        for language in self.languages:
+            record["lang_" + language] = self._read_string(offset)
+            offset += _string_ref.size
+        return key, record, offset
+
+    def _read_values(self, offset, count, typecode='H'):
+        start = self._data_offset + offset
+        values = array(typecode, self._map[start:start + count * 2])
+        if big_endian:
+            values.byteswap()
+        return values
+
+    def _read_coords(self, bbox, offset, count):
+        min_x, min_y, max_x, max_y = bbox
+        quantized = self._read_values(offset, count)
+        scale_x = (max_x - min_x) / QUANTIZE_STEPS
+        scale_y = (max_y - min_y) / QUANTIZE_STEPS
+        coords = array('f', [0.0]) * count
+        coords[0::2] = array('f', [min_x + q * scale_x for q in quantized[0::2]])
+        coords[1::2] = array('f', [min_y + q * scale_y for q in quantized[1::2]])
+        return coords
+
+    def _read_geometry(self, offset):
+        (min_x, min_y, max_x, max_y, command_offset, num_commands,
+            coord_offset, num_coords) = _geometry_ref.unpack_from(self._map, offset)
+        start = self._data_offset + command_offset
+        commands = array('B', self._map[start:start + num_commands])
+        coords = self._read_coords((min_x, min_y, max_x, max_y), coord_offset, num_coords)
+        return CountryGeometry(commands, coords)
+
+    def topology(self, continent):
+        """Return the stored topology.Topology of a continent"""
+        try:
+            return self._topologies[continent]
+        except KeyError:
+            pass
+        from topology import Topology
+        (min_x, min_y, max_x, max_y, lengths_offset, num_arcs,
+            coord_offset, num_coords) = _arc_table_ref.unpack_from(self._map, self._arc_table_refs[continent])
+        coords = self._read_coords((min_x, min_y, max_x, max_y), coord_offset, num_coords)
+        arcs = []
+        start = 0
+        for length in self._read_values(lengths_offset, num_arcs):
+            arcs.append(coords[start:start + length * 2])
+            start += length * 2
+
+        objects = {}
+        for key in self._keys:
+            if self.countries_data[key]["continent"] != continent:
+                continue
+            values = self._read_values(self._rings_refs[key][0], self._rings_refs[key][1], 'h')
+            rings = []
+            position = 1
+            for i in range(values[0]):
+                count = values[position]
+                rings.append(list(values[position + 1:position + 1 + count]))
+                position += 1 + count
+            objects[key] = rings
+        topology = self._topologies[continent] = Topology(arcs, objects)
+        return topology
+
+    def __getitem__(self, key):
+        try:
+            return self._parsed[key]
+        except KeyError:
+            topology = self.topology(self.countries_data[key]["continent"])
+            geometry = polyline_geometry(topology.rings(key))
+            self._parsed[key] = geometry
+            return geometry
+
+    def __contains__(self, key):
+        return key in self._rings_refs
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return list(self._keys)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def discard(self, keys):
+        """Drop decoded geometry; it will be decoded again if needed"""
+        for key in keys:
+            self._parsed.pop(key, None)
+            self._topologies.pop(self.countries_data[key]["continent"], None)
+
+    def adjacency(self, continent):
+        """Return the stored adjacency.AdjacencyGraph of a continent"""
+        from adjacency import AdjacencyGraph
+        ranked = {}
+        bordering = {}
+        for key in self._keys:
+            if self.countries_data[key]["continent"] != continent:
+                continue
+            offset, count, bordering[key] = self._adjacency_refs[key]
+            start = self._data_offset + offset
+            indices = array('H', self._map[start:start + count * 2])
+            if big_endian:
+                indices.byteswap()
+            ranked[key] = [self._keys[i] for i in indices]
+        return AdjacencyGraph(ranked, bordering)
+
+    def label_anchors(self, continent):
+        """Return the stored label anchors of a continent, as labels.label_anchors"""
+        return dict([(key, anchor) for key, anchor in self._label_anchors.items()
+                     if self.countries_data[key]["continent"] == continent])
+
+    def continent_outline(self, continent):
+        """Return the CountryGeometry of a continent's svg_outline_path"""
+        return self._read_geometry(self._outline_refs[continent])
+
+    def close(self):
+        self._map.close()
+
+def load(directory):
+    """Load the map, preferring a compiled bundle in directory
+
+    returns continents_data, countries_data, geometry store
+    """
+    filename = os.path.join(directory, BUNDLE_FILENAME)
+    if os.path.exists(filename):
+        try:
+            bundle = MapBundle(filename)
+        except MapBundleError, error:
+            # left over from an older setup.py, say; the map still loads
+            log.warn("Ignoring the map bundle: %s", error)
+        else:
+            return bundle.continents_data, bundle.countries_data, bundle
+
+    from mapdata import continents_data, countries_data
+    from geometry import GeometryStore
+    # the store owns the path data from here on
+    paths = dict([(key, countries_data[key].pop("svg_path")) for key in countries_data])
+    for key in countries_data:
+        countries_data[key]["continent"] = key.split("_", 1)[0]
+    return continents_data, countries_data, GeometryStore(paths)
+
+_startup_script = """
+import sys, time
+sys.path.insert(0, %(directory)r)
+from geometry import rss_kb
+before = rss_kb()
+start = time.time()
+%(body)s
+elapsed = time.time() - start
+print elapsed, rss_kb() - before
+"""
+
+def _measure(body):
+    import subprocess
+    directory = os.path.dirname(os.path.abspath(__file__))
+    script = _startup_script % {'directory': directory, 'body': body}
+    process = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE)
+    output = process.communicate()[0].split()
+    return float(output[0]), int(output[1])
+
+def benchmark(repeat=5):
+    """Compare startup time and RSS of the bundle with importing mapdata"""
+    import tempfile
+    from mapdata import continents_data, countries_data
+
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, BUNDLE_FILENAME)
+    try:
+        compile_bundle(filename, continents_data, countries_data)
+        print "bundle size: %d bytes" % os.path.getsize(filename)
+
+        cases = [
+            ("import mapdata", "import mapdata"),
+            ("import mapdata, parse one continent",
+             "import mapbundle\n"
+             "c, countries, store = mapbundle.load(%r)\n"
+             "[store[k] for k in store.keys() if k.startswith('sa_')]" % os.path.join(directory, 'missing')),
+            ("open bundle", "import mapbundle\nmapbundle.MapBundle(%r)" % filename),
+            ("open bundle, decode one continent",
+             "import mapbundle\n"
+             "store = mapbundle.MapBundle(%r)\n"
+             "[store[k] for k in store.keys() if k.startswith('sa_')]" % filename),
+        ]
+        for name, body in cases:
+            results = [_measure(body) for i in range(repeat)]
+            print "%-40s %7.2f ms  %5d kB RSS" % (name,
+                min([r[0] for r in results]) * 1000, min([r[1] for r in results]))
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rmdir(directory)
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,93 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight 
+# This file is part of Geoquiz.activity
+# 
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+# 
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+# 
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+# Map data for Geoquiz.  The svg_path values are in the coordinate space
+# of the 1200x1230 quiz map; each continent's svg_scale and svg_translate_*
+# values place its countries on screen.
+
+continents_data = {
+    "af":{"lang_eng":"Africa", "svg_scale":0.64, "svg_translate_x": -60, "svg_translate_y": -40, "svg_outline_path":"M 290.08333,732.28379 C 276.67455,720.17787 267.99866,710.35554 262.08681,693.72917 C 246.21207,684.72978 278.38172,676.17092 265.81392,662.46418 C 266.6034,645.46631 247.80129,641.38096 253.05443,621.3943 C 241.99622,599.14163 263.36274,575.05358 252.76958,551.7406 C 247.75888,525.43014 253.65107,498.45223 248.79781,472.06825 C 253.18221,445.55023 239.88409,420.64149 211.8594,417.21895 C 186.39781,412.09568 179.8983,385.13336 163.63785,368.35632 C 155.90699,345.78508 120.86011,342.00148 130.30406,315.44911 C 144.2331,305.01638 117.91566,299.67755 129.75727,282.56303 C 136.49471,265.76533 143.9092,258.21347 154.64367,242.95796 C 152.3358,231.88433 146.93058,209.40784 149.3221,195.18801 C 167.40383,194.57668 165.52329,163.22343 188.09131,163.84848 C 195.14088,152.30855 217.28023,152.46992 202.28797,165.58953 C 223.24557,153.8986 242.76002,167.98692 264.72947,166.27201 C 278.0865,152.93327 295.9696,163.1095 305.39532,172.42347 C 320.33563,175.18693 336.43659,199.81663 355.65631,194.98756 C 384.36061,190.22 401.66168,212.46288 413.90472,232.79318 C 421.23893,240.18318 388.52878,257.51033 406.91171,256.07004 C 416.68633,275.8478 436.13166,236.91196 452.18615,255.52782 C 470.54289,271.44553 496.68389,264.82157 517.51269,276.58876 C 536.16059,290.44138 567.41319,298.38027 553.17229,329.18734 C 539.18639,351.47116 511.79289,366.64593 518.17179,396.08244 C 514.84649,418.69626 505.42259,441.77981 490.59199,458.01817 C 471.43869,458.63531 452.59517,466.62026 438.48017,481.14378 C 438.76207,507.18492 422.79284,527.90853 406.65564,547.09309 C 404.25207,568.10593 373.41289,571.78376 368.28951,570.02213 C 384.21329,586.2698 365.69171,609.84816 344.26215,609.83036 C 330.54562,610.52044 344.96641,639.81954 321.60391,630.7043 C 311.63736,634.19863 338.63846,648.13072 322.72281,651.84933 C 325.11969,667.4211 296.53817,678.2685 322.49181,685.72777 C 323.52306,702.05324 296.10801,720.31 317.89931,734.16898 C 308.63001,733.78356 299.10462,734.89018 290.08333,732.28379 z M 410.42977,538.97501 C 409.98857,531.74052 406.52783,545.79871 410.42977,538.97501 z"},
+    "sa":{"lang_eng":"South America", "svg_scale":1.3, "svg_translate_x": 40, "svg_translate_y": 30, "svg_outline_path":"M 2.8588938,17.10143 C 2.8696634,16.623164 3.2827367,15.253871 3.4676448,14.514237 C 3.6521467,13.77623 3.9242081,13.238624 3.9242081,12.383608 C 3.9242081,11.504065 3.8664253,10.825109 4.2285837,10.100792 C 4.3965232,9.7649132 5.6929012,9.2452262 6.0548369,8.8832912 C 6.6057694,8.3323572 6.9019721,7.4274042 7.4245271,6.9048502 C 8.4119461,5.9174302 9.2279741,6.9960742 9.5551561,5.6873471 C 9.8441001,4.5315675 9.7943551,4.5948213 10.772657,3.8610939 C 11.472578,3.336154 12.749901,3.100554 13.664225,2.7957794 C 14.64049,2.470358 15.95385,2.6435916 17.012356,2.6435916 C 18.041179,2.6435916 19.05071,2.5402965 20.056112,2.3392161 C 21.212942,2.1078502 21.121426,2.3187453 21.121426,3.4045305 C 21.121426,4.2219956 22.219303,4.2877507 22.947679,4.469845 C 23.690141,4.6554602 24.277426,4.7642346 24.926121,4.9264082 C 25.766989,5.1366255 26.463608,5.2151742 27.056749,4.6220328 C 27.67909,3.9996917 27.797342,3.8940542 28.883003,4.1654694 C 30.234798,4.5034182 31.144246,5.5351593 32.687697,5.5351593 C 33.510649,5.5351593 34.046082,6.8822392 34.361763,7.5136012 C 34.916151,8.6223792 35.579265,9.6053392 35.579265,10.861731 C 35.579265,11.876212 36.487666,12.570299 37.253331,13.144547 C 38.179305,13.839029 38.880179,14.490629 39.840522,14.970801 C 40.29,15.19554 40.766435,16.505465 41.210212,16.949242 C 41.710719,17.44975 42.582384,18.167365 43.188653,18.318932 C 43.922415,18.502373 45.118638,18.292999 45.623657,18.166744 C 46.612631,17.919501 46.232408,19.866303 46.232408,20.601748 C 46.232408,21.648642 45.601695,22.449965 44.862718,23.188941 C 44.227703,23.823957 43.391093,23.899628 42.732089,24.558631 C 42.060212,25.230509 41.36054,25.777992 40.753648,26.384884 C 40.013085,27.125447 39.734162,27.829811 39.536146,28.819888 C 39.300159,29.999825 39.536146,31.410893 39.536146,32.624583 C 39.536146,33.48698 39.536146,34.349377 39.536146,35.211775 C 39.536146,36.318845 39.688265,37.038097 39.079583,37.646779 C 38.349148,38.377214 37.276991,36.990707 36.644579,38.255529 C 36.276673,38.991342 36.354591,40.480797 36.188016,41.147097 C 35.969851,42.019755 34.519102,38.890041 35.274889,42.668975 C 35.3594,43.09153 34.235461,43.682517 34.057387,44.038665 C 33.764677,44.624085 33.133689,45.418927 32.687697,45.864918 C 32.086078,46.466538 31.335605,46.923194 30.557068,47.234608 C 29.874156,47.507773 28.718409,47.386796 27.817688,47.386796 C 27.021801,47.386796 26.085198,47.538984 25.230496,47.538984 C 24.706444,47.538984 24.579945,45.697721 24.469557,45.256167 C 24.233541,44.312105 23.672894,43.815028 23.252055,42.973351 C 22.786819,42.042878 22.698652,41.728217 22.491116,40.690534 C 22.32355,39.8527 22.115071,39.276016 21.577989,38.559905 C 21.294287,38.181635 21.237705,37.046581 21.121426,36.581465 C 20.933732,35.83069 21.196895,34.756461 21.425802,34.298648 C 21.807495,33.53526 22.186741,33.625727 22.186741,32.472395 C 22.186741,31.609997 22.186741,30.7476 22.186741,29.885203 C 22.186741,29.391887 20.564289,28.173754 20.208299,27.906762 C 19.376257,27.282729 19.183629,26.740294 18.990797,25.776133 C 18.824478,24.944535 18.990797,23.890194 18.990797,23.036753 C 18.990797,21.987517 18.438645,22.123626 17.468919,22.123626 C 16.344268,22.123626 15.694438,21.908287 14.729539,21.667063 C 13.755754,21.423616 12.943297,21.923389 12.142347,22.123626 C 11.578484,22.264593 10.783126,22.275814 10.011719,22.275814 C 9.2340991,22.275814 8.4531081,22.284997 7.8810911,22.428002 C 7.0464041,22.636674 6.4321519,22.271608 5.7504615,21.362687 C 5.1486322,20.560248 4.5213073,19.876003 3.9242081,19.079871 C 3.3909651,18.36888 3.1034635,18.079709 2.8588938,17.10143 z "},
+}
+
+countries_data = {
+    "af_alge":{"lang_eng":"Algeria", "z_order": 1, "svg_path":"M 312.52674,230.56608 L 328.55624,222.57921 L 331.86552,223.76254 L 337.3565,218.99246 L 346.57378,219.83764 L 347.07296,215.57706 C 366.15216,216.50916 370.11309,211.40706 373.48242,206.29125 L 389.45618,199.70942 L 395.35385,199.89439 L 392.26628,195.80847 L 393.07967,192.57805 L 392.95044,187.22992 C 399.19785,186.41211 406.90248,187.41478 406.94894,180.88014 L 432.79234,181.23976 L 436.37909,173.80781 C 431.42566,171.9898 430.53937,164.8269 431.20297,157.21584 C 431.69573,151.56422 431.24866,138.70707 431.24866,138.70707 C 429.53867,136.64351 427.40875,134.70035 426.91614,131.73714 C 428.29767,131.12313 434.78348,132.18654 438.72143,126.91174 C 440.75104,124.19313 443.34321,118.70626 446.72865,119.7783 C 450.67985,121.02948 458.2498,121.81955 458.71261,119.31228 C 459.2078,116.62955 466.54263,110.72566 477.13472,110.75988 C 496.5355,110.82255 521.6013,103.44227 529.79227,105.84167 C 537.98324,108.24107 548.65085,102.65392 553.38639,102.95732 C 558.15504,103.26284 559.59333,108.46533 566.09867,104.03956 C 568.53027,102.38527 577.31223,109.26482 585.68082,106.82899 C 585.68082,106.82899 580.68358,109.04793 580.40182,114.17744 C 579.9678,122.07883 579.23576,146.67185 579.23576,146.67185 C 578.40478,145.34229 572.45633,146.3399 571.52134,150.3533 C 570.25083,155.8069 564.11195,154.39633 563.62469,157.15155 C 562.64378,162.69808 567.48343,167.79172 573.18372,172.76695 C 574.64533,174.04265 572.64562,181.1061 574.09345,182.39786 C 578.50854,186.33703 586.3341,189.01869 586.3341,189.01869 C 588.15156,207.09191 591.36972,219.57297 591.36972,219.57297 C 583.08716,220.12643 587.51312,227.81446 593.09003,236.0198 C 593.09003,236.0198 593.43832,283.02958 593.43832,283.02958 C 593.43832,283.02958 585.95678,284.54661 586.47356,286.47526 C 587.63361,290.80464 587.90507,294.00461 593.37149,298.87027 C 596.88087,301.99397 596.94626,307.26366 596.64399,310.72456 C 596.2952,314.718 600.32502,316.52837 601.37859,316.5029 C 609.58675,316.30444 616.5252,312.30947 624.30049,333.7477 C 624.30049,333.7477 525.97251,398.36584 525.97251,398.36584 C 511.37919,404.65088 487.3431,408.41083 486.51587,408.04694 C 481.0335,405.63522 487.38829,399.59897 485.54948,395.56184 C 483.70829,391.51951 481.48887,388.47896 475.2408,389.1561 C 471.91658,389.51637 470.17213,385.24099 468.85719,385.45869 C 463.53667,386.33956 462.18185,380.29482 461.00627,379.21942 C 456.34006,374.95084 451.70794,373.70998 452.76853,369.82927 C 452.76853,369.82927 309.07256,260.29215 309.07256,260.29215 L 312.52674,230.56608 z"},
+    "af_ango":{"lang_eng":"Angola", "z_order": 1, "svg_path":"M 620.67562,1020.4599 C 624.26528,1019.5068 628.14794,1014.7446 631.36995,1018.5709 C 634.56898,1014.6149 643.45136,1006.7861 657.80993,1021.4438 L 729.95896,1020.457 L 737.68879,1027.1955 L 783.16635,1033.0777 L 811.93211,1026.6009 L 792.48765,1009.2482 L 793.97567,947.7921 L 828.67107,948.82186 L 824.90065,944.79936 L 828.98705,912.30027 C 828.51998,912.41732 827.98431,912.17904 827.52952,912.34471 C 819.16655,915.39129 810.27588,914.68733 801.30463,914.86655 L 798.18708,920.97994 L 792.49941,916.18813 L 798.84146,907.74014 L 790.28017,890.39367 L 788.97191,851.46454 L 774.14994,852.51651 L 774.15521,845.48687 L 767.57016,844.52444 L 765.84048,847.65102 L 753.73689,847.02854 L 749.13933,864.65 C 743.12999,863.56737 737.58166,862.089 728.58049,866.63805 C 720.62835,864.0819 713.42874,870.0412 702.1736,830.10892 L 697.9149,827.5644 L 652.33246,826.82994 L 631.59454,833.94945 C 636.78885,848.88861 647.75814,857.37286 647.38696,879.46765 L 643.82055,882.88724 C 646.76484,892.86494 649.39074,903.30254 655.94477,908.06617 C 656.59037,910.86048 655.1764,912.89157 654.99269,914.99002 C 654.32056,922.66775 650.28503,944.43163 648.51232,940.55169 C 648.51232,940.55169 641.20335,942.14803 640.54823,948.03423 C 640.22915,950.90121 636.69084,951.3065 635.37611,954.83982 C 631.70031,964.71852 627.8271,980.38798 625.03416,994.6339 C 624.71061,996.28425 622.55782,995.55974 622.29201,997.13389 C 621.52606,1001.67 622.37869,1004.892 622.09276,1009.7062 C 622.00727,1011.1456 620.17868,1008.7341 619.82464,1010.5149 C 619.38683,1012.7171 621.15848,1018.9523 620.67562,1020.4599 z"},
+    "af_beni":{"lang_eng":"Benin", "z_order": 1, "svg_path":"M 470.90458,622.05946 L 455.59402,624.1084 L 447.68614,562.11368 C 446.67557,557.38773 441.98164,555.29274 438.39877,552.40415 L 440.29846,542.27247 L 450.21906,534.46264 L 460.56182,534.88479 L 468.16058,522.64234 L 485.25779,525.38634 L 485.36417,538.94237 C 490.21403,544.1527 489.33372,551.14757 485.67581,553.33962 C 486.00973,559.86672 484.81878,565.27915 480.48065,565.13242 C 477.85371,572.1924 475.61285,580.66801 471.86958,583.63477 L 470.90458,622.05946 z"},
+    "af_bots":{"lang_eng":"Botswana", "z_order": 1, "svg_path":"M 841.52619,1028.0287 L 830.89729,1034.0009 C 820.40588,1034.061 819.75843,1040.2366 815.82885,1043.5559 L 812.87255,1035.2454 L 773.14434,1038.7267 L 770.87924,1100.2668 L 754.60725,1099.8841 L 753.51123,1144.301 C 757.95587,1149.7552 763.95999,1155.6969 766.96851,1159.6707 C 769.89835,1163.5407 768.02612,1171.0988 765.17999,1178.1579 C 773.05168,1181.4887 780.68783,1181.6518 788.26583,1179.6828 C 789.39287,1176.6921 790.93815,1174.5378 792.9805,1173.3778 C 796.26582,1171.4915 798.9726,1169.0845 799.98232,1165.1501 L 809.88102,1156.8941 C 815.98234,1157.4263 820.67579,1159.8475 825.43899,1163.3388 C 835.52834,1163.4779 841.52973,1161.642 845.7176,1159.5113 L 847.67429,1150.2113 L 905.76755,1103.7868 C 898.45534,1098.4708 894.80559,1099.682 890.62968,1098.7049 C 886.4224,1097.7205 881.23351,1090.2446 882.62972,1077.3919 C 878.60107,1076.598 876.02231,1074.3543 873.80906,1071.745 C 871.28058,1067.5084 867.97801,1067.9163 865.04087,1066.1316 C 860.48763,1059.8002 852.11357,1051.6708 851.46968,1046.783 C 851.15729,1044.4116 849.91004,1044.5389 848.13302,1041.8987 C 846.08142,1038.8506 843.38082,1031.7695 841.52619,1028.0287 z"},
+    "af_burk":{"lang_eng":"Burkina Faso", "z_order": 1, "svg_path":"M 381.25395,567.43989 C 378.07106,567.00979 376.94848,562.73091 374.34447,560.26358 C 369.21115,555.39969 359.51663,559.0141 351.78627,563.78363 C 342.37078,559.07867 341.09471,554.84173 339.35961,550.93576 C 341.24408,545.85453 339.96081,539.17774 342.51594,533.77781 C 344.79787,528.95526 348.76613,524.49105 355.72691,520.66275 L 364.22777,502.83976 C 371.52389,500.42724 378.15016,499.50919 383.86128,497.49742 C 389.3548,495.5623 394.30205,492.39602 397.31351,488.35156 C 408.19692,481.6299 421.70811,473.01033 430.05443,475.14293 C 429.93862,477.88123 429.92611,480.59888 431.61482,482.97628 C 434.44537,484.89796 433.84282,488.08447 433.26527,491.26176 L 450.08577,513.87582 L 456.49164,516.00606 C 457.4278,514.93717 461.99955,509.29194 464.25507,521.73986 L 468.06968,522.55669 L 460.71045,534.96741 L 450.28488,534.41569 L 440.24975,542.25026 L 425.14086,540.45606 C 416.45677,540.30565 415.66045,541.99573 411.963,543.00887 L 378.43269,542.05078 L 381.25395,567.43989 z"},
+    "af_buru":{"lang_eng":"Burundi", "z_order": 1, "svg_path":"M 915.19477,774.40661 L 917.62527,772.1234 L 920.57135,772.27071 L 922.04439,776.39521 L 930.2934,774.77487 L 930.7353,769.61924 L 941.04656,769.03002 C 937.6387,774.95491 942.71626,778.18718 944.87646,781.18258 C 937.96944,797.31969 932.08895,802.98957 926.74965,803.25349 C 919.67277,803.28539 920.59931,805.8763 919.83483,808.13916 C 919.32133,800.96471 919.69393,794.27218 920.145,788.39849 C 920.69666,781.21504 918.30729,775.92435 915.19477,774.40661 z"},
+    "af_came":{"lang_eng":"Cameroon", "z_order": 1, "svg_path":"M 694.49608,701.79687 C 690.02001,699.82698 684.66404,695.36405 681.50471,697.12491 L 670.21612,693.09707 L 647.62756,692.89027 L 612.16241,692.89027 L 588.00862,693.15493 L 590.45986,674.62837 L 584.10789,666.42374 L 586.48988,663.51243 L 584.90189,661.13044 L 580.66725,662.45376 C 575.43567,661.80475 573.56313,658.10207 572.3359,653.81274 C 569.5114,652.75074 565.5591,653.13232 565.58133,648.42651 C 571.52304,638.14225 572.81363,624.10132 584.41072,618.38487 L 584.81523,613.85108 L 601.3724,613.06756 C 607.55622,617.03769 605.58191,621.6004 616.08402,620.26859 C 623.35565,607.14295 628.62969,583.03056 638.09961,581.99553 C 643.83402,567.88005 645.53543,547.84949 655.30285,539.64908 C 660.11668,537.92948 664.22223,535.88795 666.00318,532.78977 C 667.04264,530.9815 667.29021,525.13263 666.42453,522.45839 C 665.80235,520.53635 664.6051,522.03357 662.71348,519.53452 L 659.87141,508.69463 L 662.17276,506.83059 L 670.9181,514.24122 C 672.16064,520.30675 675.18297,525.92734 674.59651,532.45012 C 673.96217,541.93715 670.0467,543.29376 679.50593,554.11799 C 681.11802,556.80229 681.4842,559.64232 681.13665,562.57157 L 663.50747,560.82231 C 661.54183,565.63316 657.18298,576.56263 674.55416,580.41892 L 682.7474,605.03279 L 667.47745,630.42927 L 669.60616,648.96722 C 676.05028,660.84756 683.51637,673.2201 693.94398,682.83299 L 694.49608,701.79687 z"},
+    "af_cent":{"lang_eng":"Central African Republic", "z_order": 1, "svg_path":"M 682.90677,605.00184 L 667.52465,630.23454 L 669.58703,648.57933 C 676.16019,661.48994 683.82316,673.41973 694.03899,683.05195 C 700.37945,675.99492 703.16697,670.55362 715.72458,667.30206 L 726.65068,672.05234 L 738.9044,668.60377 C 741.94232,665.07563 741.69581,659.49472 741.93357,654.21648 C 746.145,647.34754 750.68234,643.73785 755.25366,640.46784 C 758.64128,643.08884 764.63987,641.0681 765.09218,648.9074 C 769.10587,653.42283 772.89164,656.1149 775.81717,651.92506 C 779.20804,656.93925 793.62379,655.3385 803.54101,656.43688 C 804.11359,654.57631 805.16503,652.11716 807.19618,648.43337 C 810.51672,647.92986 813.50246,646.62284 818.5689,650.3095 L 839.51497,642.98123 L 840.87982,646.07288 L 849.25682,644.7278 L 849.11114,641.60748 L 867.61749,640.07058 L 871.73902,645.36096 L 873.64826,642.49948 L 876.8091,644.8067 L 879.47262,641.74561 L 888.09847,641.40907 C 886.33403,636.52103 887.08643,630.7252 874.01544,627.64474 L 867.29477,613.91551 C 860.55579,607.4657 848.61348,604.48478 847.74217,594.1232 L 842.57738,589.13212 C 838.20054,589.33631 834.3892,591.23318 829.51233,583.31972 C 821.63011,582.12226 816.28099,580.88723 821.45813,564.92463 C 817.40927,555.14998 811.22264,550.52192 805.85344,543.05788 C 794.554,545.21806 790.01811,544.64187 789.61983,556.32404 C 786.03049,559.18282 780.75905,560.63985 779.11914,565.12317 C 777.69776,568.43676 776.52324,570.988 771.49539,571.41642 C 770.0618,572.30162 768.32307,574.10225 766.52796,576.07202 L 745.11375,578.30554 C 746.23542,582.33359 745.80111,585.96517 741.19301,590.46114 C 739.9628,591.66142 739.08083,593.13294 737.93186,594.42438 L 722.51201,595.8589 C 704.6871,603.72398 695.73935,602.05499 682.90677,605.00184 z"},
+    "af_chad":{"lang_eng":"Chad", "z_order": 1, "svg_path":"M 823.90409,400.76353 L 693.72482,336.65374 L 676.48198,341.86452 C 677.66198,352.04951 676.7938,359.93497 676.97667,366.16886 C 677.24478,375.30835 683.60529,381.71681 692.32504,384.80607 L 688.46467,394.19965 L 682.91651,444.50015 L 655.74764,474.39784 C 654.88508,476.09423 654.40603,477.79063 654.50703,479.48702 C 653.64704,481.43285 652.54286,482.2798 651.3635,482.78849 C 649.4661,483.967 650.40315,485.95769 650.18262,487.43713 C 648.60284,498.03518 670.76016,513.73114 670.76016,513.73114 C 671.90068,518.51887 673.58803,522.77247 674.43369,527.82547 C 675.34568,533.27484 672.67801,539.8516 673.44584,544.57279 C 674.56068,551.42758 682.16607,552.11478 681.12683,562.57776 L 663.68217,560.97242 C 658.61915,571.07957 662.16252,577.66594 674.59515,580.61579 L 682.80656,605.13098 C 695.99968,602.11964 705.28934,603.72146 722.52404,595.93371 L 738.20322,594.38042 C 741.09514,589.44823 747.21624,586.8226 745.11758,578.32571 L 766.81513,575.9564 C 768.5115,574.37696 769.32489,571.91455 772.07911,571.39295 C 776.33212,571.26158 777.5763,568.49747 778.71448,565.64061 C 780.69653,560.9428 785.69428,559.26069 789.44851,556.33506 C 790.12545,540.84233 801.83528,545.27817 808.97215,542.34641 L 808.1173,536.97008 C 804.03332,532.51762 800.51072,527.46391 799.23401,513.29358 L 791.62045,514.72446 L 791.45266,507.83808 C 793.78404,505.3374 795.45764,499.40715 794.86071,495.19168 L 798.40586,493.52778 L 797.53256,484.57372 L 808.01316,471.17711 L 807.68786,464.61534 L 825.75282,463.6647 L 823.90409,400.76353 z"},
+    "af_cote":{"lang_eng":"Cote d' Ivoire", "z_order": 1, "svg_path":"M 296.32757,654.11917 L 302.72577,654.72265 L 353.57011,640.33233 L 371.81388,642.37701 L 374.45597,631.56909 C 373.90516,622.92301 366.56495,614.07725 376.49266,605.73936 C 377.41566,599.43426 376.90492,592.57159 383.69683,588.54884 L 381.37522,567.28568 C 378.58115,567.34509 377.41362,564.44515 375.94938,561.92792 C 372.69261,556.32908 361.7739,556.98943 351.68492,563.87699 C 346.88174,560.47883 341.28411,558.13992 339.40438,550.84382 C 332.66283,548.35773 327.41353,549.70888 323.07539,553.40302 L 323.8601,546.12874 C 322.80314,543.36396 319.00812,544.15867 314.54317,545.82429 C 313.41853,545.95081 314.20714,547.71726 315.46831,549.88876 C 313.83238,550.50738 312.19646,550.59699 310.56053,550.90989 C 309.42161,552.3116 307.77873,553.79541 305.95924,554.17626 C 301.38728,546.16463 298.73741,547.67226 293.30354,552.07741 C 291.44208,553.58646 290.22443,557.23565 289.46384,560.42159 C 288.60686,564.01126 290.14299,567.47595 294.06027,566.97433 C 294.06027,566.97433 293.69558,571.80999 293.69558,571.80999 C 296.49018,573.06022 295.88807,573.55755 293.28655,576.29591 C 292.11248,577.53174 296.5814,583.19446 296.05036,584.53032 C 296.05036,584.53032 287.4669,582.82268 287.4669,582.82268 C 287.23832,584.17689 286.93559,586.12379 286.81105,587.6188 C 286.81105,587.6188 290.85069,589.34748 290.85069,589.34748 C 290.85069,589.34748 287.69523,597.74658 287.69523,597.74658 C 288.10679,598.40507 283.87921,597.98056 282.84271,598.12219 C 282.84271,598.12219 282.9061,603.38187 282.9061,603.38187 C 287.29142,604.56253 284.89628,614.83642 280.77855,616.50904 C 280.77855,616.50904 286.8163,620.29925 286.8163,620.29925 C 288.14554,619.25856 291.87412,620.16843 294.29456,626.77478 C 294.29456,626.77478 300.3138,630.55796 300.18341,635.3222 C 300.07998,639.10157 297.52624,639.70305 296.83612,642.63197 C 296.83612,642.63197 296.32757,654.11917 296.32757,654.11917 z"},
+    "af_demo":{"lang_eng":"Democratic Republic of the Congo", "z_order": 1, "svg_path":"M 739.54996,668.85779 C 736.62672,677.57668 733.14013,683.7646 729.49746,693.24886 C 724.71945,705.68915 725.78211,724.86508 723.34531,741.82744 C 710.70903,747.55572 706.70989,756.73886 700.24255,764.93472 L 695.20051,789.06146 C 686.07839,797.98857 677.59104,809.45482 666.60201,810.91432 C 665.93421,797.45609 654.27585,803.92359 652.99379,809.22236 C 647.44161,812.89085 645.62975,809.07871 642.49281,807.91673 C 638.48071,810.80411 635.5739,814.24413 635.53362,819.11741 C 636.09867,826.90076 632.56226,826.4812 630.00381,828.01756 L 631.49923,833.95052 L 652.3415,826.82027 L 697.922,827.63875 L 702.15293,830.11115 C 712.51415,868.52697 720.91788,864.73952 728.35098,866.61356 C 739.93106,861.76702 743.02744,864.46155 749.1851,864.43493 L 753.66044,846.96404 L 765.82835,847.64948 L 767.38401,844.46208 L 774.14248,845.5144 L 774.24419,852.57627 L 788.91323,851.50191 L 790.43897,890.18431 L 798.80425,907.59467 L 792.4225,916.24238 L 798.23741,921.15897 L 801.34588,914.93852 L 820.58454,914.59746 L 827.5602,912.25897 L 833.59546,912.14983 L 835.78108,920.74793 L 846.99657,917.04213 C 847.59861,919.62495 848.70905,921.51449 850.18991,922.8989 C 853.8296,926.30156 860.6353,930.98503 866.70169,931.07856 C 870.97766,931.14448 874.4192,926.75016 878.16555,927.53828 C 883.27418,934.62101 889.32594,936.6737 895.66397,937.19967 C 900.37428,944.5068 903.53982,953.35872 916.93354,951.98244 L 922.18016,955.62894 L 921.80744,936.93067 C 912.50434,939.92098 906.86045,935.59285 902.05324,929.59139 C 903.00268,922.2118 905.98639,915.51031 909.3856,908.94731 C 909.6817,901.35781 908.66,894.36775 906.79653,886.76796 C 906.38857,885.10418 908.55885,878.90287 911.32916,875.27259 L 941.49693,867.88593 C 938.37346,850.97965 927.38699,847.54618 924.23607,835.57937 C 920.37867,820.92944 918.49381,803.36645 920.54863,786.23269 C 919.97748,778.21047 916.30459,773.96427 910.99933,771.70532 L 920.00015,758.80865 L 927.29208,750.80656 L 928.42306,722.77753 L 938.6485,707.25145 L 955.10292,692.44246 L 945.17997,685.98789 L 945.23027,668.30931 L 924.6749,650.87812 C 922.84062,651.05003 921.99206,652.8648 920.70636,653.95101 C 916.5654,655.23927 912.75249,653.24698 908.79439,652.70656 C 906.664,657.47491 897.88656,654.97123 896.84896,652.25054 C 896.54675,651.45812 897.23529,649.85984 896.03692,649.41347 C 893.44648,645.91698 890.77869,643.55319 888.18826,641.34943 L 879.62913,641.76415 L 876.84172,644.97105 L 873.69275,642.36128 L 871.73147,645.42512 L 867.63718,640.07139 L 849.15701,641.67546 L 849.16337,644.65353 L 840.93916,646.16612 L 839.63864,643.00444 L 818.67758,650.43238 C 812.80848,646.17542 810.65219,648.48734 807.21454,648.34516 L 803.52364,656.37725 C 786.11296,655.7182 778.84073,655.71135 775.97085,651.83177 C 770.45878,657.90432 769.118,650.42016 765.74068,649.55473 C 763.83329,640.67888 758.78753,643.31039 755.27605,640.3162 C 748.77703,644.67836 745.22878,649.04051 742.18903,653.40266 C 742.22716,659.4722 741.26142,664.53785 739.54996,668.85779 z"},
+    "af_djib":{"lang_eng":"Djibouti", "z_order": 1, "svg_path":"M 1141.4036,506.4383 L 1131.5603,513.78406 C 1129.8548,518.74013 1130.791,522.73071 1129.3973,525.08755 C 1123.7499,534.63812 1124.4651,535.37962 1126.2184,537.49701 C 1128.5802,540.34918 1134.8025,538.31585 1138.0245,536.409 L 1143.1666,538.61273 L 1148.8963,529.94473 C 1145.3703,526.95089 1141.8443,528.49988 1138.3184,528.32866 C 1139.2801,524.01096 1144.1277,523.02401 1147.574,520.83599 C 1150.1159,512.97097 1144.7127,507.95408 1141.4036,506.4383 z"},
+    "af_egyp":{"lang_eng":"Egypt", "z_order": 1, "svg_path":"M 838.03386,357.61748 L 970.00575,353.67998 L 974.25665,357.88236 L 982.96812,356.78282 L 983.86994,349.42884 L 993.53414,346.7603 L 995.57964,337.70712 L 999.82306,339.10462 L 1005.1607,333.53553 L 1002.2732,319.27699 L 1006.8914,319.4405 L 995.65801,309.43978 L 964.84572,258.54873 L 964.7073,252.37157 C 957.4161,247.59093 952.02157,241.54585 948.76514,234.07537 L 948.47936,229.33273 L 943.82903,225.94918 L 945.04242,218.42184 L 958.85541,236.88171 C 960.09266,238.30495 958.7023,239.32949 959.81783,240.87445 C 963.42775,245.87402 969.64388,250.9154 973.30784,253.84338 C 975.17946,253.21407 977.37382,253.66057 978.30179,249.88574 L 981.90471,225.91219 L 965.70709,192.9118 C 954.77054,200.56536 943.83398,203.62359 932.89743,192.232 L 919.53077,193.25631 C 916.47653,194.56864 913.22571,196.56899 911.46231,193.36337 L 889.89671,205.9648 L 854.18427,198.00873 C 848.81753,196.90593 843.09337,195.08828 838.66498,195.86218 C 834.12176,198.6343 830.88913,196.49174 827.65898,194.33988 C 825.82122,197.5331 823.88319,200.76277 825.64563,202.64682 L 827.09036,215.65101 C 823.92875,220.74595 821.01222,225.96955 831.00225,237.96911 L 838.03386,357.61748 z"},
+    "af_equa":{"lang_eng":"Equatorial Guinea", "z_order": 1, "svg_path":"M 612.76541,710.96881 L 585.62916,712.27883 L 580.2019,708.72305 L 588.34279,693.0963 L 612.57827,692.81559 L 612.76541,710.96881 z"},
+    "af_erit":{"lang_eng":"Eritrea", "z_order": 1, "svg_path":"M 1053.9891,474.55771 C 1057.0606,476.65937 1060.1321,476.39346 1063.2036,481.20615 L 1071.3641,479.57241 L 1072.9521,477.01345 L 1074.2987,476.65549 L 1076.1045,480.02105 C 1080.2257,477.8374 1083.9418,477.7465 1086.5585,479.81193 C 1088.1524,481.07 1090.5002,479.3211 1092.2109,478.68545 C 1095.3928,481.2638 1098.5499,484.08938 1101.9995,483.99011 C 1113.202,493.24701 1122.8596,503.2763 1131.8541,513.63715 L 1141.5505,506.87905 C 1140.1541,503.17664 1138.3012,499.78658 1131.7269,499.627 C 1131.4012,496.6477 1130.1413,494.00205 1125.9616,492.39917 C 1125.0737,488.82061 1121.9969,488.8902 1119.5727,487.87198 C 1117.5287,482.18459 1112.5462,479.06834 1108.4575,475.16996 C 1103.8469,476.25304 1101.7186,473.19891 1099.5361,470.23514 L 1096.0322,469.55165 L 1093.524,471.09249 C 1090.9014,468.93644 1090.187,465.96253 1089.4554,462.99604 L 1085.6994,461.99399 L 1086.6541,467.20037 C 1084.3815,468.59024 1083.1374,464.83739 1081.9518,460.7925 L 1074.3022,449.68618 C 1069.3142,426.4406 1064.9637,423.59131 1060.5037,417.24297 C 1059.2726,420.13461 1059.0599,423.65024 1057.0399,425.22712 L 1045.7842,431.08552 C 1043.966,434.24371 1041.1514,435.17786 1038.1598,435.14633 C 1033.9435,455.26449 1031.7163,468.24877 1031.9172,484.58135 L 1040.5934,484.57021 L 1041.4341,481.76341 L 1045.4405,481.98795 L 1048.7431,487.21557 L 1053.9891,474.55771 z"},
+    "af_ethi":{"lang_eng":"Ethiopia", "z_order": 1, "svg_path":"M 1231.5511,587.09474 L 1183.3476,642.1 L 1164.5141,641.76139 C 1162.1888,642.4073 1153.4718,647.76947 1148.4667,652.17701 C 1144.3614,655.79213 1138.0359,657.89889 1131.5603,660.84616 C 1127.7206,660.86719 1123.0577,662.26026 1120.3694,660.36224 C 1114.0664,654.25277 1106.8532,657.24495 1099.7168,659.46917 C 1097.3593,663.81249 1094.1388,667.29289 1088.7766,668.63144 L 1063.0147,664.62615 C 1057.1828,659.67666 1050.7569,655.08354 1042.7797,651.42125 L 1028.4629,650.42993 L 1028.4706,638.79466 L 1017.2093,634.67338 L 1009.0698,616.08592 L 997.38874,606.74172 C 999.56654,603.25437 993.849,600.37436 990.94147,597.27819 C 986.98735,598.16873 983.03323,597.36233 979.07911,595.23631 L 982.55816,591.05455 L 982.34642,585.67269 L 992.60922,585.85805 C 994.8501,584.45049 997.32814,583.91252 998.96877,580.30404 L 998.67575,550.1453 L 1003.5588,542.46446 L 1008.6933,542.65254 L 1011.0357,529.78296 C 1017.214,522.1823 1019.4016,512.90131 1029.5932,506.99044 L 1032.2675,484.68011 L 1040.4306,484.44498 L 1041.5626,481.78858 L 1045.5255,481.85846 L 1048.9206,487.50129 L 1053.8095,474.53203 C 1057.0399,476.61039 1061.2593,476.69041 1063.1488,481.25917 L 1071.3891,479.64752 L 1072.7805,477.01058 L 1074.2579,476.69437 L 1076.2478,480.19797 C 1078.8602,478.64427 1082.1056,476.98944 1086.2955,479.70162 C 1087.508,480.21956 1088.9219,480.4912 1092.0454,478.67347 C 1095.3469,480.45661 1097.3502,484.09426 1102.0243,483.91658 C 1112.5746,493.1296 1122.801,502.71293 1131.8541,513.63715 C 1131.0373,514.40918 1130.6681,517.32523 1130.0668,523.91382 L 1126.161,530.9218 C 1123.013,536.09041 1126.8227,540.64943 1132.8164,538.50241 L 1138.0806,536.47893 L 1143.3648,538.64222 C 1136.986,545.99576 1152.1718,558.80072 1165.8598,571.58903 L 1215.2743,587.37813 L 1231.5511,587.09474 z"},
+    "af_gabo":{"lang_eng":"Gabon", "z_order": 1, "svg_path":"M 609.21898,792.93374 L 579.11136,761.78075 L 571.93329,743.44133 L 578.54992,737.08937 L 580.40258,726.76742 L 588.87187,728.62008 C 589.35866,728.11359 590.1195,727.74412 589.66586,726.76742 L 582.3167,723.00065 L 584.63722,712.4755 L 612.83073,711.02924 L 612.95641,692.89027 L 647.89222,692.89027 L 645.18411,696.70521 L 644.87128,708.53763 C 648.02482,709.74135 650.12915,707.13849 652.17227,703.39936 C 657.54275,702.56323 667.39945,707.41356 664.72117,716.67803 C 660.24725,721.70855 658.21134,726.39463 659.80781,730.67395 C 660.98338,733.82504 662.3976,736.88545 663.30427,741.55657 L 660.59615,766.20255 L 654.97672,770.2661 C 652.45189,766.09414 647.79243,764.59048 641.27559,765.40855 C 639.27157,762.89918 637.30541,759.69316 633.50673,764.75629 L 618.93408,773.7228 L 620.19594,785.77172 L 609.21898,792.93374 z"},
+    "af_gamb":{"lang_eng":"Gambia", "z_order": 2, "svg_path":"M 153.04389,488.96347 L 171.39416,488.96347 C 175.35272,483.67664 181.1828,485.40804 187.82383,490.18048 L 198.4191,490.96531 L 200.75459,493.96808 L 193.08084,496.63721 C 187.82848,495.51522 183.08961,493.49463 178.73427,490.80285 C 175.65849,492.62595 172.14234,493.71512 167.72411,493.3008 L 165.72226,496.63721 L 149.777,497.3045 C 149.777,497.3045 153.04389,488.96347 153.04389,488.96347 z"},
+    "af_ghan":{"lang_eng":"Ghana", "z_order": 1, "svg_path":"M 443.45742,627.41871 C 441.85643,629.55274 441.65691,634.02254 437.22518,631.43866 C 415.22174,634.11035 406.53868,643.44223 391.19543,649.44402 L 371.78939,642.34333 L 374.43147,631.53541 C 373.88066,622.88933 366.54046,614.04357 376.46817,605.70568 C 377.39116,599.40058 376.88042,592.53791 383.67234,588.51516 L 378.51427,541.98175 L 412.02342,543.01864 C 416.48226,540.65776 421.22819,540.30654 426.02695,540.32507 C 423.39648,545.58143 424.79889,550.58573 431.17212,555.27935 C 436.32277,576.28137 435.6823,596.45608 437.29684,616.95294 L 443.45742,627.41871 z"},
+    "af_guin":{"lang_eng":"Guinea", "z_order": 1, "svg_path":"M 175.19282,537.32485 C 174.61596,539.12246 174.7631,540.01458 177.10069,540.01868 C 178.04493,541.15006 181.37247,533.15922 180.85979,541.2232 L 183.83399,541.54155 C 182.82628,546.02143 185.87656,551.52217 188.78721,552.51489 C 192.53294,553.79243 194.60441,558.129 196.66268,560.0431 L 201.74599,569.39746 C 205.24565,571.78243 210.0691,570.04896 217.59997,559.89237 C 216.78024,556.50771 221.45686,554.70533 235.43634,555.58105 C 246.88723,563.83223 250.32024,573.45791 246.05096,584.40398 C 251.17212,583.16717 254.03806,579.67513 262.57684,581.85594 C 266.83346,587.22016 269.4681,593.14049 265.92827,601.17777 C 270.64311,602.93856 272.34456,608.11515 278.92745,599.39491 C 278.47852,597.39628 280.10448,596.67568 282.17459,598.21122 C 283.42767,599.14072 285.52123,597.7293 287.49754,598.21951 L 290.97481,589.25923 L 286.7129,587.53895 L 287.52649,582.83077 L 296.23948,584.60288 C 295.57281,581.39121 291.23141,577.21251 294.44774,575.02269 C 295.88952,573.53869 295.22305,572.37904 293.75937,571.34203 L 293.94009,567.23476 C 285.49031,566.22459 290.31324,556.87492 293.22876,552.13652 L 288.05012,547.42934 L 287.4561,537.0709 L 283.18593,540.21938 L 281.58903,537.83353 L 287.29181,532.61668 L 279.59154,526.76599 C 280.86431,522.6702 279.14706,517.7562 277.75202,512.64552 L 272.33019,511.46632 C 272.41356,513.8006 271.60543,515.56755 269.22288,516.3326 C 267.19003,515.7219 265.94417,517.02247 265.48335,520.22955 L 255.87421,516.25266 L 248.2451,521.78372 C 249.21199,519.30473 246.73458,517.83419 245.17643,515.98646 L 240.96941,518.81194 C 237.68255,519.91882 237.2705,518.15089 237.30953,515.93189 C 237.9854,515.21066 238.82947,514.65765 239.08895,513.52003 C 227.22122,511.67706 214.79186,512.41756 203.94326,505.8866 L 200.54055,505.86817 L 199.06347,524.27669 L 189.79931,524.52337 C 180.74518,527.80989 176.28819,536.24068 175.19282,537.32485 z"},
+    "af_guib":{"lang_eng":"Guinea-Bissau", "z_order": 1, "svg_path":"M 148.96,510.46929 L 150.08412,513.55625 C 152.40961,515.14879 156.78899,512.00159 156.52651,519.56637 C 158.64235,520.67215 161.259,518.43916 162.77729,523.52859 C 165.37322,524.83979 171.94773,512.62382 169.56724,530.85486 L 175.40381,537.24998 C 178.86509,531.85455 184.06836,526.44503 189.45399,524.51343 C 189.45399,524.51343 198.98429,524.28071 198.98429,524.28071 L 200.58438,505.92163 L 175.99332,505.83742 C 170.99501,508.26771 165.85926,509.59847 160.41337,508.44811 C 156.94387,509.69054 153.32755,510.34943 148.96,510.46929 z"},
+    "af_keny":{"lang_eng":"Kenya", "z_order": 1, "svg_path":"M 1127.1198,757.11759 C 1124.9221,760.54994 1122.5147,763.7202 1117.6848,763.86233 C 1115.8862,768.62649 1113.5636,772.97709 1107.5825,774.43933 C 1100.996,786.3374 1095.9864,800.00956 1087.7583,810.061 L 1064.7466,794.64132 L 1061.131,781.23233 L 991.02451,737.20812 L 1014.0987,701.92979 L 1014.5914,682.16359 L 1006.6659,675.63017 C 1005.6815,668.00205 1003.8974,661.107 997.62029,658.33056 L 1005.7811,651.19795 L 1028.5924,650.1664 L 1042.7844,651.3821 C 1047.6494,653.89491 1050.2315,653.98332 1063.1038,664.71422 L 1088.9461,668.59874 C 1093.0699,667.17852 1096.9004,665.07058 1099.7721,659.32701 C 1106.0108,658.42552 1112.6292,653.02666 1120.7272,660.72779 C 1123.3787,661.66889 1127.6215,661.26972 1131.8252,660.65861 C 1127.0057,668.36281 1121.9378,674.57616 1116.9045,680.99704 L 1117.3314,745.11066 L 1127.1198,757.11759 z"},
+    "af_leso":{"lang_eng":"Lesotho", "z_order": 2, "svg_path":"M 889.64535,1240.4064 C 888.43784,1240.5207 886.33191,1240.8739 884.81954,1241.4788 C 883.70674,1241.924 882.70059,1242.3913 881.87043,1243.2215 C 881.19675,1243.8952 881.01667,1244.8939 880.79803,1245.7685 C 880.56953,1246.6824 878.71655,1247.8639 877.98297,1248.0473 C 876.95513,1248.3043 875.56937,1248.0473 874.49766,1248.0473 C 872.35293,1248.0473 871.33157,1247.5793 870.074,1245.9025 C 868.53907,1243.8559 866.61391,1242.2805 865.24819,1240.0043 C 864.28216,1238.3943 863.40113,1237.4122 862.83528,1235.7147 C 862.41065,1234.4408 862.56718,1233.0266 862.56718,1231.6932 C 862.56718,1229.9795 863.3557,1228.4168 864.84604,1227.6717 C 865.02477,1227.5823 865.2035,1227.4929 865.38224,1227.4036 C 867.1343,1226.5275 867.57018,1224.5454 868.86755,1223.248 C 870.2962,1221.8194 872.14836,1220.5508 873.69336,1219.2265 C 874.67528,1218.3848 876.07615,1217.6329 877.17867,1217.0817 C 878.8714,1216.2353 880.48533,1215.7858 882.27258,1215.339 C 883.61343,1215.0038 885.17601,1214.5462 886.29409,1214.2666 C 886.51513,1214.2114 886.74092,1214.1773 886.96434,1214.1326 C 887.18776,1214.0879 887.41118,1214.0432 887.63459,1213.9985 C 889.214,1213.6827 891.20661,1214.4716 892.05825,1215.6071 C 893.22526,1217.1631 894.68563,1218.6635 895.81166,1220.1648 C 896.40025,1220.9496 896.36442,1222.879 896.88407,1223.9182 C 897.62578,1225.4017 898.5063,1226.5061 899.02887,1228.0738 C 899.56407,1229.6794 898.79346,1231.3597 898.09052,1232.7656 C 897.25399,1234.4386 896.12343,1235.4029 894.87331,1236.653 C 893.85012,1237.6762 892.75735,1238.5081 891.6561,1239.334 C 891.07433,1239.7704 890.29084,1240.0192 889.64535,1240.4064 z"},
+    "af_libe":{"lang_eng":"Liberia", "z_order": 1, "svg_path":"M 296.24246,654.07194 L 281.91761,649.03219 L 231.45202,607.69007 L 247.42513,594.32394 L 247.14555,589.54499 L 254.97314,581.98094 C 257.30289,580.40703 260.13382,581.5061 262.81352,581.7986 C 269.53587,591.59178 267.73396,596.19715 265.89882,601.16623 C 269.71332,602.13546 272.59455,608.48463 278.90632,599.41902 C 278.72987,596.89777 280.2707,596.87439 282.87029,598.39102 L 282.87029,603.20066 C 284.9246,604.06412 286.42852,608.15123 284.43584,611.88823 C 283.37836,613.87139 282.6528,615.90445 280.38362,616.31141 L 286.97641,620.35153 C 288.84865,620.03328 290.46407,618.64247 294.40473,626.96295 C 295.25183,628.1286 305.10123,632.25945 296.92866,642.06369 L 296.24246,654.07194 z"},
+    "af_liby":{"lang_eng":"Libya", "z_order": 1, "svg_path":"M 621.97168,171.57528 C 621.97168,171.57528 624.46973,181.24846 617.00006,186.55343 C 613.24278,189.22185 600.95639,198.23154 600.95639,198.23154 C 601.99824,203.73136 603.28448,217.48554 591.35157,219.35956 C 583.15105,220.64742 587.44873,227.27735 592.93315,236.26883 C 592.93315,236.26883 593.28144,283.09363 593.28144,283.09363 C 593.28144,283.09363 585.98487,284.51817 586.50165,286.44683 C 587.6617,290.77621 587.74819,293.88369 593.21461,298.74935 C 596.72399,301.87305 596.78938,307.51268 596.48711,310.97359 C 596.13832,314.96702 600.63058,316.68491 601.68415,316.65944 C 609.89231,316.46098 616.36832,312.5585 624.14361,333.99673 C 624.14361,333.99673 662.71055,335.18528 662.71055,335.18528 C 667.20484,336.13646 671.96322,343.02028 671.96322,343.02028 C 671.96322,343.02028 694.05,336.74506 694.05,336.74506 C 694.05,336.74506 824.09552,401.04468 824.09552,401.04468 C 824.09552,401.04468 823.86055,390.60024 823.86055,390.60024 C 838.2373,391.77168 839.88944,390.1161 839.88944,390.1161 C 839.88944,390.1161 831.00207,238.18925 831.00207,238.18925 C 825.77997,231.0221 820.63164,223.99561 826.91056,216.04723 C 826.91056,216.04723 826.95274,207.61716 825.38076,202.83467 C 823.74469,197.85722 828.23207,194.47257 828.23207,194.47257 C 828.16143,188.03077 815.79694,188.52039 809.29094,188.18633 C 800.75445,187.748 795.0182,186.57786 796.50456,180.18363 C 796.50456,180.18363 774.18773,172.17047 765.55083,177.45319 C 760.96236,180.2597 751.28647,184.74381 749.52472,190.49363 C 748.34029,194.35928 749.40049,196.98011 751.70463,200.90578 C 755.73902,207.77938 742.11783,231.37686 726.54707,212.49222 C 726.54707,212.49222 706.09478,206.86148 694.54371,204.33679 C 683.23771,201.86566 675.43577,191.95159 680.12869,185.95123 C 680.587,185.36524 649.44348,176.35549 649.44348,176.35549 C 635.06118,178.58141 624.52968,174.37558 621.97168,171.57528 z"},
+    "af_mada":{"lang_eng":"Madagascar", "z_order": 1, "svg_path":"M 1181.5369,1171.4884 L 1229.5284,1069.349 C 1233.1989,1057.8241 1235.3743,1046.2992 1240.791,1034.7744 C 1244.4656,1029.9158 1249.126,1025.4094 1246.193,1018.191 L 1247.2358,1008.2841 C 1247.7743,1005.2894 1249.4245,1005.3519 1251.9286,1007.7627 L 1253.398,1013.7458 C 1255.1816,1013.1797 1256.9321,1012.5722 1256.7932,1009.6029 L 1251.9286,956.66352 L 1242.7536,946.7195 L 1237.45,951.11226 L 1236.07,964.7008 L 1233.0048,967.39736 C 1231.3942,966.90669 1229.0386,964.47905 1229.7335,969.98283 L 1225.1835,974.97647 C 1220.0074,965.37622 1219.2416,973.89366 1220.6434,978.04173 C 1220.5064,979.85342 1221.0149,982.95611 1218.5577,980.12741 L 1214.8499,986.11064 L 1220.122,990.03438 L 1216.9935,990.03438 L 1210.215,994.94314 L 1211.2579,988.99154 L 1204.4794,995.77 L 1206.0437,1004.1127 L 1201.472,1004.297 L 1202.3675,1000.5577 C 1198.1449,997.78094 1194.7093,1003.6608 1190.9225,1005.677 L 1195.0939,1012.4554 L 1189.8797,1012.9768 L 1187.794,1006.7198 L 1179.388,1008.0998 C 1179.6514,1011.0557 1176.2532,1011.9194 1173.1942,1012.9768 L 1172.6728,1008.8055 L 1167.98,1013.4983 L 1159.79,1013.8985 L 1158.1942,1020.9509 L 1147.1233,1036.9622 C 1155.5803,1044.3957 1152.1542,1061.1659 1154.4231,1073.4615 C 1151.3092,1083.3802 1145.263,1090.953 1139.8234,1099.0111 C 1133.4974,1103.1882 1130.6416,1107.3653 1129.6802,1111.5424 C 1128.7577,1115.5504 1126.814,1123.4297 1127.9877,1127.4376 C 1129.3571,1132.1142 1131.9433,1130.523 1132.06,1135.1996 L 1133.599,1142.8707 C 1125.8609,1172.6645 1145.1179,1172.2189 1149.2668,1179.494 C 1151.1541,1178.6351 1153.552,1180.0953 1155.395,1179.1013 C 1159.4881,1176.8938 1164.7211,1171.4391 1170.1901,1173.2515 C 1174.7661,1174.768 1178.1978,1173.033 1181.5369,1171.4884 z"},
+    "af_mala":{"lang_eng":"Malawi", "z_order": 1, "svg_path":"M 994.31306,894.7296 L 1004.2719,927.55968 L 1001.3329,956.70687 C 1007.2428,962.03118 1013.1223,966.35113 1021.4162,980.19017 C 1022.4574,981.92751 1023.547,986.26917 1023.1803,989.75058 L 1019.5711,1005.1603 L 1010.555,1009.0862 L 1011.2548,1022.566 L 1006.4668,1022.6396 C 1008.9333,1016.3108 1006.5726,1017.4918 1005.5094,1017.1078 C 998.97266,1012.9802 996.52431,1006.904 995.32217,1001.4551 C 1000.6689,993.22423 1000.3524,986.61128 999.7419,980.24857 L 990.89512,978.61326 C 984.06486,980.282 982.73657,977.77619 982.07749,975.49778 C 978.37129,966.81709 976.66808,970.16216 975.30904,969.57516 L 970.03297,962.31289 L 979.28655,945.15698 L 986.50504,944.34681 L 981.59207,937.94582 L 985.89382,915.6342 L 989.98929,912.61416 L 978.15976,889.23474 C 981.59967,892.24973 985.40308,893.27736 994.31306,894.7296 z"},
+    "af_mali":{"lang_eng":"Mali", "z_order": 1, "svg_path":"M 360.40972,299.17817 L 334.92601,299.86375 L 336.13057,446.91532 L 342.85092,449.28878 L 338.14022,463.66571 L 263.03713,459.41727 L 254.39367,465.47572 L 249.67092,463.73101 L 246.39976,454.02212 L 242.10651,452.87506 C 233.64871,471.36384 232.35159,469.21301 229.21106,472.37555 C 229.72354,474.26645 228.49064,476.0709 229.09878,477.80273 C 231.0015,483.22121 232.19536,488.71816 229.33041,491.06279 C 233.24276,494.54548 238.29067,497.31844 239.74234,502.33905 C 240.02089,508.74225 239.6716,513.68049 237.94915,515.41468 C 236.24199,517.12469 238.26961,521.11221 241.81802,518.12614 L 245.26877,516.02865 C 246.40322,517.83625 248.90511,518.82337 248.53954,521.53098 L 256.14565,516.33043 L 265.43234,520.18963 C 266.37604,518.76637 265.19193,516.63383 268.80484,516.1003 C 270.70182,516.15232 272.03564,514.79643 272.59504,511.50447 L 277.69353,512.74179 C 279.06497,517.54392 280.73746,522.38907 279.85602,526.86936 L 287.3794,532.54961 L 281.63388,537.80949 L 283.22445,540.21155 L 287.4157,537.41762 L 288.03742,547.48004 L 293.33184,552.34484 C 295.50252,550.19007 298.96713,547.4742 301.5888,548.83616 C 304.06047,550.1202 305.21193,555.1451 307.54296,553.57627 C 309.98067,551.93564 310.43839,550.40038 314.21596,550.40517 C 317.06132,550.40877 311.77654,545.48993 315.32035,545.59246 C 316.96622,545.64007 319.53768,543.70209 322.38251,544.45003 C 325.10982,545.16706 321.71825,555.32645 323.71713,553.14544 C 328.67316,547.73785 338.54822,549.83321 339.50221,551.04094 C 342.26729,541.14098 336.86418,532.01159 355.83086,520.58317 L 364.20174,502.95148 C 375.36147,498.26967 387.3387,500.40025 397.5991,488.22399 C 410.49902,479.60746 423.3892,473.12729 430.35538,475.05963 L 443.37786,475.07327 L 450.69643,468.828 L 485.72553,469.26587 C 486.61286,467.54558 487.10088,466.28141 491.94057,463.9024 C 491.97797,459.67232 495.77096,459.44002 498.40732,458.1078 L 499.7816,406.19763 L 486.63194,408.09449 C 481.43849,404.71836 485.80669,403.64217 485.85396,396.1338 C 482.89371,389.46686 479.12874,388.4636 475.43071,389.12105 C 472.18269,389.69849 470.7207,385.09254 469.01633,385.43971 C 466.08162,386.03751 462.86675,383.22111 460.92049,379.07628 C 460.25918,377.66792 458.44225,377.02573 457.21268,376.18148 C 454.48024,374.30533 451.98899,372.8633 452.69563,369.93739 C 452.69563,369.93739 390.14552,322.16092 360.40972,299.17817 z"},
+    "af_maur":{"lang_eng":"Mauritania", "z_order": 1, "svg_path":"M 228.04591,355.64762 C 230.09938,340.95095 220.96327,320.29619 249.51065,319.70667 L 255.50081,275.27966 L 306.41715,279.77228 C 306.41715,279.77228 309.17293,259.80703 309.17293,259.80703 C 309.17293,259.80703 360.48767,299.21147 360.48767,299.21147 C 360.48767,299.21147 334.92877,299.83244 334.92877,299.83244 C 334.92877,299.83244 336.22477,446.99039 336.22477,446.99039 C 336.22477,446.99039 342.69331,449.29556 342.69331,449.29556 C 342.69331,449.29556 338.33311,463.59012 338.33311,463.59012 C 338.33311,463.59012 262.99987,459.44016 262.99987,459.44016 C 262.99987,459.44016 254.41259,465.51241 254.41259,465.51241 C 254.41259,465.51241 249.77755,463.99185 249.77755,463.99185 C 249.77755,463.99185 246.50297,454.01445 246.50297,454.01445 C 246.50297,454.01445 241.94802,452.88715 241.94802,452.88715 C 241.94802,452.88715 233.63513,473.39605 228.34211,471.32176 C 228.34211,471.32176 225.98944,468.76809 223.32702,466.01688 C 220.9815,463.59315 218.42499,461.19248 216.61214,457.77301 C 214.09136,453.01823 212.34629,445.385 208.87228,445.93061 C 201.48006,447.0916 195.84678,437.28835 195.84678,437.28835 C 195.84678,437.28835 187.23279,434.8984 181.05934,436.61285 C 173.07863,438.82919 164.06555,436.52862 162.45676,437.57292 L 169.78222,417.22342 L 170.52872,393.5024 L 166.06777,386.37668 C 168.45328,382.15989 175.73946,378.27132 170.97738,365.6456 C 170.43265,364.20136 167.83888,364.98037 167.83888,364.98037 L 164.76197,355.69881 L 168.54282,351.90909 L 228.04591,355.64762 z"},
+    "af_moro":{"lang_eng":"Morocco", "z_order": 1, "svg_path":"M 310.47681,250.4575 L 313.05357,230.71349 L 328.52815,222.72661 L 332.02241,223.72497 L 337.51338,219.23235 L 346.63818,219.89256 L 347.13736,215.5395 C 366.21655,216.47159 370.085,211.3695 373.45433,206.25368 L 389.42809,199.76434 L 395.41825,199.76434 L 392.42317,195.7709 L 393.42153,192.07804 L 392.92235,187.28484 C 399.16976,186.46703 406.8744,187.4697 406.92085,180.93506 L 432.85674,181.29469 L 436.351,173.30781 C 431.39757,171.4898 430.51128,164.3269 431.17488,156.71584 C 431.66764,151.06422 431.22057,138.20707 431.22057,138.20707 C 429.51058,136.14351 427.38067,134.20035 426.88805,131.23714 C 422.72878,130.46995 417.62417,130.37801 415.88462,127.88244 C 409.84666,126.84517 403.86463,126.29409 398.46505,126.83731 C 388.5809,127.8317 384.51232,124.2702 380.44285,114.90376 C 370.92362,114.28307 360.82943,134.73952 353.48714,144.85456 C 335.7301,149.79256 322.87941,157.79703 314.05193,168.31601 C 315.23106,172.59208 313.15882,174.23888 308.84958,177.06231 C 306.06383,178.88754 296.26651,194.5265 299.57571,203.2586 C 299.61658,210.0808 294.29927,221.45095 279.019,229.01621 C 279.019,229.01621 271.89441,235.67546 260.6259,239.35204 C 255.87143,240.90329 244.84944,242.13942 241.51467,245.21481 L 310.47681,250.4575 z"},
+    "af_moza":{"lang_eng":"Mozambique", "z_order": 1, "svg_path":"M 924.81155,986.01116 L 928.34469,995.25167 L 928.07291,999.87193 L 940.303,1000.7912 L 968.95592,1011.941 C 971.88861,1027.954 970.01008,1041.3428 965.35845,1053.219 C 965.23267,1055.5442 964.45721,1057.765 964.73903,1059.8949 C 965.26762,1063.8897 967.23689,1069.3953 965.00123,1073.9787 C 959.24609,1085.7776 953.8701,1097.5888 952.48419,1098.3558 C 947.73225,1100.9857 941.82585,1108.6756 941.6619,1114.8348 L 944.52198,1185.5759 L 955.35481,1186.2745 L 958.24047,1176.257 L 953.89199,1177.8877 C 954.55727,1173.9249 953.64351,1169.962 957.80584,1165.9992 L 992.56915,1152.2589 C 996.87312,1149.0989 999.54641,1144.3083 1002.5406,1139.8385 L 998.4819,1138.4359 L 1005.6804,1111.268 L 1001.9821,1110.0121 L 998.99086,1087.1473 C 989.14345,1081.1079 994.84028,1071.7216 998.814,1069.5259 L 1019.8262,1051.6702 L 1021.56,1055.2287 L 1029.354,1046.6184 L 1027.6353,1043.9635 L 1032.7019,1043.0359 L 1034.2066,1038.6759 L 1059.9559,1026.0043 L 1066.3859,1026.0711 C 1071.2625,1022.3782 1075.1782,1018.4109 1082.2871,1015.3558 L 1081.8329,1011.5387 L 1090.4119,1004.9012 C 1092.4705,1002.7882 1094.2386,999.6587 1096.9324,999.76927 L 1097.3079,995.51542 L 1095.6761,993.70707 L 1100.3705,986.66777 L 1101.5592,981.96984 L 1100.8097,978.89856 L 1097.9351,974.52739 L 1098.9301,957.31308 C 1096.7369,955.18233 1097.9475,953.73234 1099.1212,952.27496 L 1098.554,933.27151 L 1105.4564,921.64376 C 1105.6338,918.4582 1105.8922,915.27263 1104.7298,912.08706 C 1094.1386,918.38944 1076.4151,929.36258 1067.4588,923.73382 C 1063.5342,924.21387 1059.1303,924.2061 1055.3339,929.14371 C 1052.1102,928.8423 1049.1974,928.22986 1045.3415,928.56053 L 1032.6643,930.8559 C 1030.3633,928.1067 1028.052,925.37694 1022.7165,928.35951 L 1004.222,927.75672 L 1001.3335,956.6685 C 1010.4551,964.00911 1018.4862,973.45341 1022.4956,983.12865 C 1024.9371,989.02024 1020.5158,997.51319 1019.6627,1005.0358 L 1010.487,1009.0061 L 1010.9658,1021.8861 L 1006.4465,1022.5713 C 1007.5461,1019.8807 1008.7632,1017.1353 1004.8187,1016.7986 C 999.82609,1012.5666 996.00184,1007.7954 995.4743,1001.5026 C 999.29594,995.28353 1000.8353,988.24936 999.82278,980.30379 L 990.92483,978.67331 C 987.46185,979.51368 983.44466,979.44239 982.54081,976.68333 C 980.13871,969.35068 977.81314,968.96339 975.09081,969.70437 L 924.81155,986.01116 z"},
+    "af_nami":{"lang_eng":"Namibia", "z_order": 1, "svg_path":"M 620.73312,1020.4579 C 621.44368,1029.7769 622.31403,1039.0399 630.85845,1045.6171 L 666.15479,1108.4726 L 667.05272,1137.3176 L 673.3514,1150.6666 C 673.70568,1155.865 671.7879,1161.0634 674.98224,1166.2618 L 679.36698,1190.813 L 698.53448,1212.1577 C 710.44263,1199.3686 714.77616,1209.6984 717.75952,1217.8901 C 725.04745,1217.1996 732.33538,1216.5278 739.6233,1217.7937 C 743.03739,1214.7086 746.52809,1211.6543 751.904,1209.354 L 754.70766,1099.7988 L 770.91627,1100.3245 L 773.24431,1038.6316 L 812.82087,1035.1395 L 815.86233,1043.4128 C 818.71159,1040.2848 822.60903,1034.5261 828.43263,1034.261 C 833.69335,1034.0215 836.26653,1030.611 841.44566,1027.855 L 837.65322,1022.3353 L 812.17001,1026.5784 L 783.72045,1033.1995 L 737.67296,1027.054 L 729.96292,1020.5705 L 657.44344,1021.4091 C 653.98041,1016.822 640.85979,1006.3773 631.37531,1018.6935 C 628.1678,1014.8631 624.29658,1019.6609 620.73312,1020.4579 z"},
+    "af_nigr":{"lang_eng":"Niger", "z_order": 1, "svg_path":"M 499.75205,406.34817 L 498.31762,458.29795 C 496.02145,459.63173 492.82738,458.2718 491.95412,463.87433 C 489.39968,465.35596 486.25297,466.3934 485.68692,469.36633 L 450.57838,469.02722 L 443.44496,475.02144 L 430.16316,475.09356 C 429.77934,477.95407 429.8469,481.53202 432.10796,483.30183 C 434.11419,484.87218 433.81884,488.1785 433.31057,491.09129 L 450.1075,513.50128 L 456.20076,515.77867 C 459.57846,512.81545 462.65724,511.94465 464.1883,521.90791 L 484.99077,524.86016 C 486.44196,521.53464 486.0927,516.92309 489.86199,515.25336 C 495.52156,512.05327 494.59625,506.45868 496.61531,501.93477 C 501.2354,499.73173 498.28073,496.59846 522.6937,496.82612 C 529.00703,500.79442 535.10038,502.12309 541.74805,510.10341 C 541.74805,510.10341 546.64417,510.30332 546.64417,510.30332 C 546.78406,508.6296 551.72219,505.18893 554.74083,504.61462 C 558.01187,502.83544 563.8271,505.93261 571.57705,512.73801 L 585.38274,513.9742 L 598.64189,504.46531 L 621.8213,503.87118 C 625.31796,505.23751 627.90739,508.36349 633.06639,507.07007 C 636.77327,502.89778 643.86168,498.91568 652.00412,495.48265 C 650.74104,491.7917 649.31858,488.18906 650.49706,483.45173 C 652.48389,481.7819 654.9253,481.518 655.16523,475.30622 L 683.17063,444.22968 L 688.36439,394.67345 L 692.31964,384.7081 C 684.31357,381.42983 678.83075,378.32361 677.07364,367.27212 C 676.1166,361.25279 677.48226,353.48217 676.88742,342.24203 L 671.90095,343.0976 C 669.16362,339.87576 666.51323,336.4221 663.01219,335.23684 L 623.74681,333.80701 L 524.26314,399.3946 L 499.75205,406.34817 z"},
+    "af_nige":{"lang_eng":"Nigeria", "z_order": 1, "svg_path":"M 565.5474,648.6129 L 562.18337,648.45591 L 561.07917,654.34495 C 555.31282,654.48411 549.54647,653.87496 543.78012,651.7685 C 530.00534,660.34378 519.09536,658.94161 513.46546,639.15022 C 509.18554,628.1033 502.25829,624.51704 494.92227,622.08274 L 470.95471,622.2204 L 472.00214,583.96652 C 475.80582,579.12682 478.17233,572.37089 480.30854,565.30789 C 486.71709,563.73043 485.34919,558.09569 485.64198,553.3274 C 492.04806,549.08393 487.84922,542.42661 485.21195,537.96645 L 485.62586,525.52222 C 486.17067,521.99387 485.36837,518.17735 490.429,514.93737 C 492.3991,512.51591 494.36919,513.69512 496.33929,501.85096 C 499.85112,499.1522 503.56016,496.4957 522.4739,497.09735 C 529.08518,500.55404 537.50222,503.36009 542.0915,510.483 L 546.34834,510.27916 C 549.09497,508.34415 549.94355,504.93287 554.93749,504.74577 C 557.78537,504.68586 557.95318,501.94588 571.46678,512.55169 L 585.55555,513.86842 L 598.63933,504.43682 L 622.09205,503.97935 C 625.51402,505.40522 628.31767,508.53149 632.75342,507.1695 C 638.61597,501.33248 645.72697,498.31413 652.41336,495.49788 C 655.08571,499.78183 658.80498,503.96871 662.14005,506.64009 L 659.91418,508.41896 L 662.73392,519.76445 C 664.04415,520.75612 666.42957,521.10268 666.48978,522.84437 C 669.00735,533.97294 662.77124,537.41566 655.39354,539.87268 C 646.0002,547.18255 643.63979,567.23959 638.24303,581.79327 C 627.74835,584.89272 624.2538,604.29897 616.22944,620.25534 C 608.48814,621.76643 606.52867,617.99834 601.67174,612.75617 L 584.80421,613.84877 L 584.3624,618.35909 C 573.59223,623.98709 571.11274,636.7413 565.5474,648.6129 z"},
+    "af_repu":{"lang_eng":"Republic of the Congo", "z_order": 1, "svg_path":"M 625.92501,814.62964 L 609.11876,792.93374 L 620.36704,785.78778 L 619.04371,773.61317 L 632.8063,765.27622 C 635.15533,763.42962 636.91889,758.94843 641.14326,765.54088 C 648.45317,764.67432 652.71306,766.55278 655.03818,770.17253 L 660.86082,766.20255 L 663.24281,741.98568 C 663.13127,733.64306 653.79459,728.19461 664.96313,716.31315 C 666.84115,708.50403 659.85505,703.1564 652.12687,703.47688 C 650.23638,705.89403 649.52582,709.78609 644.86852,708.74473 L 645.11324,697.12491 L 647.89222,692.89027 L 670.38877,693.15493 L 681.25722,697.01961 C 685.31206,694.94738 690.74167,701.10215 694.51482,701.73385 L 693.94398,683.09766 C 702.46935,672.23661 708.75067,668.99412 715.77886,667.35007 L 726.4978,672.24638 L 739.73107,668.54107 C 736.48195,677.23504 732.93924,684.37223 729.64792,692.90276 C 724.00676,707.52368 725.89073,725.3454 723.32182,741.72101 C 711.1026,747.07757 706.67205,756.48424 700.29594,764.87922 L 695.02535,789.13485 C 683.52268,801.45919 673.37134,811.3368 666.81579,810.79864 C 666.77154,803.8707 659.25327,797.72662 653.11466,809.11708 C 648.83405,811.95128 645.75444,810.48028 642.46658,807.35799 C 637.70909,801.0737 636.14436,806.39946 633.9973,809.60765 L 625.92501,814.62964 z"},
+    "af_rwan":{"lang_eng":"Rwanda", "z_order": 1, "svg_path":"M 938.76335,746.86082 L 931.39817,752.75296 L 928.89401,752.75296 L 927.42097,750.69071 C 920.88957,757.20844 916.00815,764.55115 910.99661,771.8288 C 912.80271,772.25946 914.24782,773.14137 915.26842,774.55391 L 917.69893,772.27071 L 920.4977,772.49166 L 921.89708,776.24791 L 930.36705,774.55391 L 930.7353,769.47194 L 941.26752,768.88272 C 942.81337,766.77137 944.18668,764.66001 946.4968,762.54866 L 938.76335,746.86082 z"},
+    "af_sene":{"lang_eng":"Senegal", "z_order": 1, "svg_path":"M 162.69518,437.05251 C 159.70478,442.19179 157.67283,444.87482 157.58633,449.04736 C 157.38861,458.58431 147.86993,461.62401 143.10602,468.55709 C 147.53828,475.01882 152.36351,481.36497 153.11525,488.90921 L 171.46552,488.90921 C 175.42408,483.62238 181.25416,485.35378 187.89519,490.12622 L 198.49046,490.91105 L 200.82595,493.91382 L 193.1522,496.58295 C 187.89984,495.46096 183.16097,493.44037 178.80563,490.74859 C 175.72985,492.57169 172.2137,493.66086 167.79547,493.24654 L 165.79362,496.58295 L 149.77884,497.25024 C 148.83459,501.58757 147.96342,505.92491 148.77792,510.26224 C 152.63281,509.90651 156.38536,510.47185 160.44539,508.26986 C 165.91712,509.67145 171.11236,508.4464 176.13592,505.59049 L 203.81117,505.92176 C 214.21214,511.87057 227.18516,512.4836 239.19468,513.26501 C 239.76128,506.99734 243.26465,500.76254 229.60904,491.24469 C 231.70479,488.54631 230.9203,482.33963 229.08626,477.85672 C 228.04838,475.31986 230.03875,474.52263 229.0955,471.81517 C 227.79824,471.09297 226.23465,469.04218 224.04969,466.97981 C 221.60496,464.67225 216.64299,458.04343 216.64299,458.04343 C 213.73933,449.33128 209.99252,445.76681 209.99252,445.76681 C 201.07801,447.22563 195.57227,437.19027 195.57227,437.19027 C 187.96183,435.13426 183.98231,436.6487 180.66979,436.82219 C 172.02377,437.27503 170.26449,438.34216 162.69518,437.05251 z"},
+    "af_sier":{"lang_eng":"Sierra Leone", "z_order": 1, "svg_path":"M 231.42879,607.77067 L 218.30093,601.10293 C 216.84031,597.03985 212.7936,594.82397 208.66477,592.66676 C 209.05298,586.92684 205.24537,585.62046 202.70127,583.54594 L 201.83512,569.8436 C 207.59183,572.08401 212.6871,566.27499 217.70278,559.80056 C 216.4534,554.7554 227.88411,555.27263 235.51739,555.41992 C 243.11981,562.03841 251.08071,568.38532 246.17696,584.47819 C 249.42953,583.25277 252.49871,581.84395 256.10642,580.97367 L 247.05309,589.44291 L 247.34513,594.26162 L 231.42879,607.77067 z"},
+    "af_soma":{"lang_eng":"Somalia", "z_order": 1, "svg_path":"M 1148.9812,529.59516 L 1143.1071,538.75165 C 1137.4003,546.98302 1153.0542,559.56565 1165.9315,571.58267 L 1215.6859,587.54454 L 1231.7253,586.87703 L 1183.4013,642.16834 L 1163.8731,641.78226 C 1157.6638,645.26805 1151.5938,648.83749 1147.1464,653.38044 C 1142.0658,656.54363 1136.3843,658.50488 1130.9843,661.02943 C 1127.6357,668.34384 1122.0581,674.32082 1117.0291,680.62701 L 1117.1844,744.79178 L 1126.9701,757.1026 L 1149.4841,731.88846 L 1187.2166,696.27309 L 1191.5564,695.75312 L 1207.368,680.79566 L 1208.0131,677.80259 C 1216.6905,671.21125 1227.4974,660.1489 1230.1892,654.68667 C 1234.9596,645.02476 1241.1065,636.83949 1247.9598,628.9977 L 1262.8164,586.09158 C 1265.7064,583.30521 1267.8729,579.55415 1269.6906,575.338 C 1270.4418,570.8374 1273.1329,569.24651 1275.1999,566.71944 L 1276.8925,545.23334 C 1281.7061,545.9086 1279.3847,536.39094 1279.6556,530.57658 C 1277.7967,528.91888 1275.7243,526.18576 1279.612,523.99034 L 1279.5765,518.63476 C 1276.0813,518.92523 1272.5632,514.93206 1269.1278,517.62876 C 1264.8263,521.67549 1259.089,524.57098 1252.5467,525.11133 C 1245.2708,525.71228 1239.3415,529.92153 1236.2922,528.88903 C 1231.3625,532.97839 1225.0816,534.36549 1216.9277,532.00628 C 1211.4855,536.84833 1207.9186,543.13709 1190.4407,538.69443 L 1179.3012,546.65944 C 1162.1138,551.32011 1157.6351,537.4065 1148.9812,529.59516 z"},
+    "af_sout":{"lang_eng":"South Africa", "z_order": 1, "svg_path":"M 698.53442,1212.1679 L 725.37837,1266.1835 L 725.72955,1278.5329 C 724.37272,1281.5033 722.14804,1281.5906 719.65891,1281.1102 C 718.65042,1282.5268 717.70591,1284.3616 719.9163,1285.7422 C 723.24305,1291.6477 725.64976,1298.8293 729.88669,1303.8896 C 733.3684,1308.0479 738.53258,1310.2221 742.62865,1313.8099 L 753.2876,1314.6624 C 755.48191,1313.1205 753.48719,1311.0201 761.43741,1310.2456 L 777.05079,1310.1454 C 781.97956,1308.2101 776.43411,1303.3347 792.51027,1304.5285 C 795.15099,1304.862 796.29528,1307.7609 800.43728,1305.5209 C 807.90023,1304.3179 815.02581,1307.1633 822.29732,1308.2576 C 824.4529,1306.5361 823.65,1303.607 835.75681,1305.9472 L 836.99587,1301.2379 L 851.18491,1301.4605 L 935.29878,1223.2941 C 948.63925,1217.7572 951.58818,1201.603 955.32622,1186.255 L 944.76634,1185.5472 C 944.65662,1184.2687 934.62765,1191.4428 933.35472,1191.5846 C 927.93218,1192.1885 924.80257,1190.4355 925.58154,1180.9356 C 926.16222,1173.8539 933.74806,1168.215 935.75308,1166.9042 C 938.42769,1165.1556 941.09633,1171.7433 943.75902,1170.0025 C 943.75902,1170.0025 942.81756,1139.8804 941.69138,1114.6822 C 936.02786,1111.2363 931.96654,1105.3143 921.87623,1108.7097 C 916.57961,1104.7513 911.28299,1105.1568 905.98637,1103.9204 L 847.79598,1150.0707 L 845.66048,1159.7133 C 839.0491,1163.2089 832.43771,1162.7337 825.82633,1163.4367 C 820.81928,1159.6288 815.42255,1157.3796 809.5528,1157.0225 L 799.84592,1165.5194 C 798.93843,1170.1977 796.21816,1170.6461 794.13428,1172.5795 C 790.83132,1174.4945 789.10498,1176.9351 788.38781,1179.712 C 778.60581,1182.1304 771.74413,1180.5333 765.37178,1178.2634 C 766.60005,1172.5439 770.27858,1168.8292 767.21078,1159.5948 L 753.67935,1144.4601 L 751.91952,1209.4572 C 747.82666,1211.2292 743.7338,1213.9201 739.64093,1217.8482 C 732.8188,1217.2647 727.14994,1216.3168 717.68833,1218.0251 C 716.15491,1210.8507 709.59881,1198.9836 698.53442,1212.1679 z"},
+    "af_suda":{"lang_eng":"Sudan", "z_order": 1, "svg_path":"M 838.22722,357.58652 L 839.81049,390.70284 C 834.19454,391.12832 828.4121,391.12643 823.85105,390.49701 L 824.10694,401.03721 L 825.64258,463.63351 L 807.74187,464.60195 L 807.9475,471.2767 L 797.70254,484.24276 L 798.36504,493.46491 L 794.93287,495.05339 C 794.60502,500.80991 793.91657,505.84527 791.49875,507.42186 L 791.65297,514.88041 L 799.10589,513.32929 C 800.60923,521.7132 800.96709,530.51366 808.00465,536.88513 L 808.90926,542.48385 L 805.577,542.94246 C 811.21734,549.96321 817.71758,556.55401 821.41116,564.54815 C 814.95196,584.55685 824.67435,580.96741 830.01681,583.76536 C 832.11233,586.69959 832.97605,590.29078 842.66146,589.17707 L 848.27922,594.30391 C 847.07118,602.79377 859.61455,607.46378 866.9673,613.57563 L 873.83904,627.06919 C 879.72841,629.93023 886.78962,631.15069 887.6657,641.03035 C 891.5866,643.25766 893.12064,646.54281 896.00155,649.42571 C 897.32598,650.75105 896.1165,652.00743 897.43151,653.03986 C 901.16036,655.96742 907.86077,656.69842 908.78383,652.49124 C 908.78383,652.49124 915.0059,654.8281 919.50367,654.28512 C 922.29528,653.94812 922.04873,651.31555 924.82524,650.72582 L 944.81979,668.21459 L 948.38847,665.61917 C 962.1154,668.8032 975.84233,666.97792 989.56925,664.99455 L 1005.9386,650.99122 L 1028.6056,650.15996 L 1028.826,638.3879 L 1017.1761,634.35669 L 1009.1142,616.50587 L 997.42462,606.6341 C 999.46727,603.48837 993.87163,600.34263 991.15806,597.19689 C 987.47962,598.19716 983.49876,597.38294 979.29269,595.21744 L 982.29919,591.38233 L 982.24667,585.84829 L 992.94749,585.67915 C 995.03121,584.36854 997.29963,583.79677 998.89194,580.52058 L 998.52765,550.04151 L 1003.5455,542.57416 L 1008.6343,542.63348 L 1011.1303,529.71523 C 1017.1644,522.29074 1019.5571,512.78554 1029.2468,507.44997 L 1032.2836,483.05465 C 1030.5196,465.82751 1035.7521,450.93254 1038.25,435.12603 C 1040.7453,434.09849 1043.6077,436.00736 1045.635,431.23542 L 1056.7999,425.55844 C 1059.001,424.09287 1059.7344,420.67023 1060.382,417.13313 C 1058.87,413.75363 1056.6927,414.36607 1054.6874,413.94663 C 1051.394,407.62051 1045.938,407.06134 1041.1952,404.60028 L 1034.5658,364.51692 L 1029.3275,358.93423 C 1030.6679,344.56644 1013.7581,342.04466 1005.4593,333.4604 L 1000.0105,338.98911 L 995.55306,337.96737 L 993.43466,347.01701 L 983.78594,349.55452 L 982.9294,356.89021 L 974.37972,357.85333 L 970.3193,353.61107 L 838.22722,357.58652 z"},
+    "af_swas":{"lang_eng":"Swasiland", "z_order": 2, "svg_path":"M 943.84924,1170.5465 L 944.60549,1185.259 C 940.2076,1187.459 936.93884,1189.659 933.19298,1191.859 C 929.08262,1191.7568 926.45075,1190.6785 925.79982,1187.3884 C 924.76298,1182.1477 925.35381,1178.5777 928.26274,1174.1726 C 930.37767,1170.9699 934.19935,1166.9278 936.76431,1166.499 C 938.08322,1166.2785 940.03103,1168.2578 941.16798,1169.9278 L 943.84924,1170.5465 z"},
+    "af_tanz":{"lang_eng":"Tanzania", "z_order": 1, "svg_path":"M 991.02639,737.11753 L 984.96122,746.1541 L 938.93866,746.93743 L 946.48171,762.43669 C 934.60126,774.42463 942.15629,776.69485 944.98163,781.3299 C 939.77071,791.03416 935.76199,802.88519 925.33877,803.28178 C 922.7182,803.94075 920.79943,803.28472 920.30867,806.50567 C 919.16017,814.04353 922.46637,829.65748 925.49597,838.67623 C 928.60229,845.63867 934.09146,850.34939 937.0705,856.18021 C 939.81557,860.22518 940.48871,864.27015 941.7865,868.31512 L 948.16791,875.51426 C 950.8621,874.7143 953.86125,875.43915 958.10915,882.40776 L 977.2634,888.73107 C 981.39304,892.55926 987.91957,893.59107 994.33248,894.75545 L 1004.3731,927.88954 L 1023.1385,928.3692 C 1026.3822,926.32818 1029.6258,926.50195 1032.8695,930.71835 C 1039.8547,929.61763 1046.0963,927.77342 1055.2823,928.87344 C 1058.1882,925.75635 1061.7997,923.43295 1067.8184,923.81766 C 1075.0276,929.56504 1095.5885,917.87925 1104.4447,912.15921 C 1102.286,908.26221 1098.3482,906.14423 1094.6918,903.74482 C 1094.9869,899.31489 1093.1983,894.46821 1091.6015,889.65991 C 1089.7373,886.72157 1088.2998,883.88995 1089.5313,881.72553 L 1085.1791,872.21367 L 1087.911,871.32329 C 1087.2005,864.07011 1087.249,857.22558 1091.5734,852.68352 C 1088.6053,846.54157 1078.4981,841.67005 1079.0786,834.3838 L 1087.7103,810.07946 L 1064.8054,794.90903 L 1061.0115,781.39369 L 991.02639,737.11753 z"},
+    "af_togo":{"lang_eng":"Togo", "z_order": 1, "svg_path":"M 443.42514,627.47282 L 455.34347,624.03377 L 447.4356,562.03905 C 446.42502,557.3131 441.7311,555.21811 438.14823,552.32952 L 440.04792,542.19784 L 425.99467,540.37918 C 423.3642,545.63554 424.76662,550.63984 431.13984,555.33346 C 436.29049,576.33548 435.65003,596.51019 437.26457,617.00705 L 443.42514,627.47282 z"},
+    "af_tuni":{"lang_eng":"Tunisia", "z_order": 1, "svg_path":"M 607.06412,103.19425 C 604.04864,103.29682 592.22674,97.13507 585.58615,106.7959 C 585.58615,106.79591 580.58666,109.01014 580.3049,114.13965 C 579.87088,122.04104 579.1174,146.63965 579.1174,146.63965 C 578.28642,145.31009 572.36489,146.31375 571.4299,150.32715 C 570.15939,155.78075 564.01091,154.35318 563.52365,157.1084 C 562.54274,162.65493 567.38586,167.75817 573.08615,172.7334 C 574.54776,174.0091 572.54457,181.06664 573.9924,182.3584 C 578.40749,186.29757 586.2424,188.9834 586.2424,188.9834 C 588.05986,207.05662 591.27365,219.5459 591.27365,219.5459 C 592.46497,220.29036 605.09313,215.95504 600.73861,198.20013 C 600.2343,196.14387 626.62148,187.59692 621.88446,171.08208 C 621.39177,169.36441 617.09652,171.39764 616.39887,168.28178 C 614.83349,161.29046 615.03447,159.56918 612.37697,158.51942 C 611.04244,157.99226 605.51985,163.29407 604.39888,162.61679 C 601.89482,161.10387 598.77105,157.58201 600.12274,155.83797 C 602.4518,152.83284 619.27973,142.40156 619.44808,136.65125 C 619.69865,128.09282 616.53987,127.26711 612.34253,124.98815 C 609.95866,123.69382 610.81487,119.63901 611.58635,117.32608 C 612.05941,115.90782 621.14404,112.81589 620.09651,109.53033 C 619.38551,107.30028 618.06669,106.95897 617.58427,105.21559 C 617.22829,103.92911 610.36422,111.10059 609.93001,109.99261 C 608.78561,107.07241 608.4421,105.28441 607.06412,103.19425 z"},
+    "af_ugan":{"lang_eng":"Uganda", "z_order": 1, "svg_path":"M 945.20859,668.05686 L 948.51222,665.55283 C 961.79428,668.94023 975.63706,667.00092 989.47871,665.07226 L 997.77007,658.21332 C 1002.4766,660.98599 1005.9998,665.74126 1006.7042,675.66063 L 1014.6798,682.03927 L 1014.6843,701.4083 L 985.0015,746.09043 L 938.72471,746.94604 L 931.64268,752.6841 L 928.87891,752.73786 L 927.28877,750.61014 L 928.35037,723.00127 L 938.72244,707.26067 L 955.2649,692.42039 L 945.26461,686.09777 L 945.20859,668.05686 z"},
+    "af_west":{"lang_eng":"Western Sahara", "z_order": 1, "svg_path":"M 228.07564,355.89269 C 230.12911,341.19602 220.993,320.54126 249.54038,319.95174 L 255.53054,275.52473 L 306.44688,280.01735 L 310.31676,250.02521 C 310.31676,250.02521 242.21264,244.99478 242.21264,244.99478 C 235.89245,254.6961 232.22361,262.90847 222.68215,266.69295 C 213.67849,270.26411 210.15577,281.37597 207.60927,290.99931 L 180.80917,321.66566 C 179.84437,328.62886 175.79765,333.28061 170.38262,336.90613 C 165.48634,343.31153 162.49575,351.269 161.74376,358.34565 L 168.57255,352.15416 L 228.07564,355.89269 z"},
+    "af_zamb":{"lang_eng":"Zambia", "z_order": 1, "svg_path":"M 941.58653,867.91216 C 941.58653,867.91216 911.14363,875.41869 911.14363,875.41869 C 909.16403,879.03799 907.76185,881.12725 906.99386,885.22776 C 906.79485,886.29036 907.71173,888.47665 908.03472,891.46541 C 908.67419,897.38264 910.67806,907.7581 908.8643,910.55812 C 904.61376,917.11997 901.7395,929.23685 901.9818,929.58399 C 904.40821,933.06044 909.33413,936.60998 912.2384,937.37727 C 916.2431,938.43528 920.73937,937.93523 921.71343,936.43138 L 922.19164,955.64688 C 920.6309,954.35926 918.39229,953.45731 917.28662,952.05592 C 910.89788,951.51125 905.13493,954.93046 895.7408,937.16042 C 889.56666,936.62947 883.46421,934.82914 878.18965,927.4863 C 875.6322,926.81663 871.36326,930.31598 867.51474,931.17817 C 856.50603,930.12492 853.34215,924.90477 850.53263,923.29959 C 848.62385,921.53202 847.4161,919.47234 847.04446,917.06429 L 835.71575,920.822 L 833.68078,912.05853 L 828.99457,912.21144 L 824.96555,945.03467 L 828.67278,948.77319 L 794.11438,947.87934 L 792.44959,1009.3917 L 811.69861,1026.4039 L 837.78557,1022.3101 L 841.60278,1028.0433 L 843.25585,1031.906 L 863.67094,1032.1215 L 866.45796,1034.5703 L 870.27024,1033.5659 C 881.277,1019.1722 891.30974,1015.4929 901.44319,1010.7057 L 901.85883,1001.146 C 909.85444,996.19616 918.47744,993.41368 928.45975,995.32703 L 924.71899,985.86118 L 975.427,969.97303 L 970.02368,962.07588 L 979.16775,945.03467 L 986.23362,944.20339 L 981.66159,937.9688 L 985.81798,915.52427 L 989.97437,912.6148 L 981.66159,896.40486 L 977.8751,888.8978 L 958.43259,882.37485 C 951.82062,872.97591 950.27231,874.7445 948.21271,875.29334 L 941.58653,867.91216 z"},
+    "af_zimb":{"lang_eng":"Zimbabwe", "z_order": 1, "svg_path":"M 843.17409,1031.9474 L 848.23562,1042.2005 C 849.89747,1044.1313 852.06487,1045.9338 851.91446,1049.0728 C 855.8648,1055.8266 860.79116,1060.6282 865.29719,1066.2706 C 868.75307,1067.3538 871.81029,1068.9157 873.91054,1071.6934 C 876.03212,1074.2524 878.44489,1076.8333 882.70216,1077.4915 C 880.90594,1087.9141 885.58261,1096.89 890.47884,1098.7588 C 896.27857,1099.0221 901.76528,1100.1027 905.92301,1104.0674 C 917.72142,1105.4745 919.09997,1107.1132 921.89204,1108.7204 C 931.55634,1105.4895 936.06148,1110.8833 941.55585,1114.6023 C 942.87135,1106.7241 947.5124,1102.314 952.76648,1098.1596 C 956.91404,1092.1183 960.71968,1082.6578 964.68209,1074.7649 C 967.6205,1069.8709 965.25222,1064.6976 964.54233,1059.6115 L 965.32163,1053.1232 C 972.46115,1035.2181 970.27132,1024.5307 969.11147,1011.9336 L 940.12362,1000.7452 L 927.94391,999.87633 L 928.34729,995.74938 C 918.0211,992.40332 909.61783,996.91307 901.91777,1001.1612 L 901.56864,1010.6684 C 877.85546,1021.2472 876.59521,1026.9964 870.06706,1033.6474 L 866.52995,1034.7436 L 863.6473,1032.1927 L 843.17409,1031.9474 z"},
+    
+    "sa_arge":{"lang_eng":"Argentina", "z_order":1, "svg_path":"M 191.19925,578.30416 C 189.94562,577.27613 189.3136,575.97863 188.98873,573.76618 C 188.3255,569.24946 187.40004,568.24099 184.64443,569.03261 C 182.50917,569.64596 182.3468,569.56364 180.66243,567.01231 C 178.71106,564.0565 177.52617,559.41348 178.72321,559.41348 C 179.12569,559.41348 179.45502,559.00895 179.45502,558.51453 C 179.45502,558.02004 180.0797,556.82139 180.84319,555.85078 C 181.72624,554.72819 182.1178,553.492 181.91929,552.45356 C 181.74767,551.55573 181.86383,550.66257 182.17745,550.46876 C 183.08565,549.9075 182.83855,547.79665 181.75987,546.90145 C 180.47034,545.83121 180.49803,542.66369 181.81448,540.65452 C 182.41441,539.7389 182.67846,538.50146 182.43653,537.73914 C 182.20533,537.01075 182.33935,535.81084 182.73435,535.07283 C 183.26133,534.08813 183.24411,533.34143 182.66962,532.26796 C 182.23902,531.46344 181.92323,529.83351 181.96786,528.64605 C 182.01249,527.45866 181.76172,526.48707 181.41056,526.48707 C 181.0594,526.48707 180.77208,526.04256 180.77208,525.49928 C 180.77208,524.95599 181.03629,524.51148 181.35922,524.51148 C 181.68214,524.51148 182.13941,523.74232 182.37537,522.80214 C 182.84759,520.92073 181.9386,519.41678 179.80715,518.55279 C 178.59782,518.06265 178.63626,518.00562 180.20141,517.96795 C 181.55489,517.93535 182.01144,517.52944 182.28106,516.119 C 182.74697,513.68179 182.40643,513.3165 179.66866,513.3165 C 177.48691,513.3165 177.34892,513.19606 177.66095,511.56383 C 177.85964,510.52441 177.50746,508.94137 176.79556,507.6739 C 176.13534,506.49836 175.75733,504.91638 175.95556,504.15835 C 176.19093,503.25834 176.00369,502.77656 175.41602,502.76997 C 173.66611,502.75035 172.87129,501.68419 172.29102,498.57818 C 171.82874,496.10382 171.89782,495.36245 172.61621,495.08679 C 173.78133,494.63972 173.78407,492.90344 172.62229,491.23769 C 172.12398,490.52326 171.50356,488.3833 171.24354,486.4822 C 170.9835,484.58109 170.51351,482.86668 170.1991,482.67235 C 169.88282,482.4769 169.92238,481.54324 170.28766,480.58244 C 170.65079,479.62738 170.75235,478.37841 170.51333,477.80708 C 169.93293,476.41962 169.96159,473.09985 170.56659,471.63936 C 170.83491,470.99164 170.86801,469.29599 170.64017,467.8712 C 170.27678,465.59868 170.42863,465.14786 171.8771,464.19879 C 173.96956,462.8278 173.94828,462.3551 171.58649,457.73698 C 170.51834,455.64845 169.27009,451.71059 168.81205,448.98474 C 168.05567,444.48324 168.08274,443.95372 169.10751,443.20444 C 169.72797,442.75072 170.23563,442.13921 170.23563,441.84544 C 170.23563,441.55167 170.73633,440.75807 171.3483,440.0819 C 172.32645,439.00106 172.36396,438.43742 171.65861,435.42031 C 170.54716,430.66613 170.72778,426.51286 172.17472,423.55369 C 173.1523,421.5544 173.27182,420.57826 172.76416,418.73965 C 172.41393,417.4712 172.22032,415.63634 172.33392,414.66218 C 172.48697,413.3498 172.16288,412.72525 171.08284,412.25124 C 170.02324,411.78619 169.72191,411.22617 169.9794,410.20025 C 170.21013,409.28101 169.97217,408.65034 169.29682,408.39114 C 168.72659,408.17232 168.25062,407.46539 168.2391,406.82023 C 168.22758,406.175 167.81442,405.11477 167.32096,404.46408 C 166.82751,403.81345 166.57973,402.68465 166.77035,401.9557 C 167.02144,400.99554 166.73295,400.52994 165.72341,400.26593 C 163.82505,399.76951 162.649,395.68867 164.01162,394.32605 C 164.61807,393.71963 164.81674,392.76409 164.55404,391.71743 C 164.26744,390.57556 164.57214,389.4806 165.54125,388.16982 C 167.28015,385.81782 167.28132,385.19865 165.55564,380.58633 C 164.54154,377.87589 164.36437,376.68224 164.89711,376.14949 C 165.29797,375.74865 165.62593,373.86757 165.62593,371.96934 C 165.62593,370.07111 165.9035,368.34645 166.24276,368.13678 C 167.27951,367.49604 168.78793,363.99226 169.61168,360.31136 C 170.26485,357.39277 170.70701,356.69759 172.29038,356.09993 C 174.61907,355.22093 174.81526,353.06019 172.76455,350.8773 C 171.61769,349.65654 171.47159,349.07451 172.01004,347.87148 C 172.51506,346.74315 172.38022,345.68425 171.4567,343.52623 C 170.0908,340.33446 169.90669,338.42899 170.90461,337.81225 C 171.32856,337.55024 171.16528,336.70758 170.45887,335.51172 C 169.09045,333.19513 169.5275,332.53984 174.853,328.92336 L 178.53564,326.42252 L 179.22881,321.58416 C 179.67349,318.48032 179.69678,316.30434 179.2938,315.51439 C 178.82579,314.59698 179.01816,313.80614 180.04811,312.41305 C 180.80848,311.3846 181.43061,310.2669 181.43061,309.92931 C 181.43061,309.59169 182.15091,309.13472 183.03127,308.91376 C 183.93727,308.68638 184.7232,307.94219 184.84223,307.19901 C 185.03136,306.01809 185.21817,305.97204 186.69883,306.74115 C 187.77456,307.29992 189.98695,307.50211 193.08217,307.32452 L 197.81918,307.05272 L 199.24608,310.08833 C 200.78097,313.35364 202.50351,314.13082 202.50351,311.55799 C 202.50351,310.69674 202.94625,308.93249 203.48737,307.63741 C 204.49781,305.21905 204.55584,305.19296 210.9296,304.28989 C 212.60289,304.05282 214.26329,305.30876 220.64943,311.64221 C 222.93196,313.9059 225.25314,315.75801 225.80761,315.75801 C 226.36211,315.75801 227.51737,316.51466 228.37489,317.43945 C 229.56521,318.72314 231.09978,319.32333 234.8623,319.97671 C 238.48883,320.60648 240.98665,321.5539 244.3186,323.56349 C 246.80899,325.06554 249.51459,326.29446 250.33101,326.29446 C 251.14741,326.29446 251.97779,326.55721 252.17627,326.87834 C 252.37474,327.19946 253.56906,327.6558 254.83031,327.89242 C 256.09157,328.12902 257.54405,328.92304 258.05806,329.65688 C 258.86986,330.8159 258.85802,331.26652 257.96782,333.08787 C 257.4042,334.24107 256.39947,335.89132 255.73514,336.75509 C 255.07079,337.61884 254.52725,339.25401 254.52725,340.38876 C 254.52725,341.52351 253.81096,343.50605 252.93548,344.79442 C 250.2694,348.71793 250.00259,348.63075 267.59073,349.58326 C 270.76876,349.75536 271.85081,349.58325 272.12776,348.86155 C 272.3917,348.17368 273.09729,348.02748 274.70104,348.32834 C 276.74215,348.71125 276.99553,348.56487 278.02369,346.4088 C 278.63584,345.12506 279.47092,344.07473 279.87934,344.07473 C 281.81824,344.07473 284.21009,340.27317 284.87711,336.13152 C 285.24997,333.81636 285.9081,331.69763 286.3397,331.42323 C 289.19567,329.60743 291.40484,333.12884 291.40484,339.49712 L 291.40484,343.31953 L 287.6183,345.4671 C 282.36002,348.44942 275.70343,354.55335 272.61929,359.22088 C 271.54233,360.85073 270.44154,362.28217 270.17307,362.40184 C 269.90458,362.52153 269.19827,363.64501 268.60345,364.89849 C 268.00864,366.15199 266.67252,367.97929 265.63431,368.9592 C 264.59611,369.9391 263.74665,371.12153 263.74665,371.58681 C 263.74665,372.0521 263.30214,372.60335 262.75885,372.81183 C 262.21557,373.02031 261.77106,373.54441 261.77106,373.97651 C 261.77106,374.40861 261.40705,375.12616 260.96214,375.57107 C 260.51724,376.01598 260.07883,378.07552 259.98791,380.14784 C 259.73853,385.83156 259.49734,387.78614 258.93632,388.66906 C 258.38749,389.53286 258.77293,397.05566 259.45605,398.81223 C 259.70504,399.45249 259.47917,400.0301 258.89163,400.25556 C 257.38951,400.83199 256.81839,406.14076 258.00301,408.51541 C 258.54141,409.59467 258.73018,410.72945 258.42248,411.03711 C 257.06033,412.39928 258.73442,414.51157 262.76442,416.51561 C 268.07774,419.15775 269.58226,420.7213 268.49175,422.46752 C 266.71698,425.30933 268.40855,429.68341 271.28232,429.68341 C 274.6129,429.68341 273.57738,435.58435 269.24912,441.26982 C 268.3959,442.39057 267.69782,443.90696 267.69782,444.63957 C 267.69782,447.03648 260.47279,450.81723 250.24682,453.77152 C 243.35148,455.76356 236.49712,456.55999 235.81045,455.44892 C 235.55842,455.04116 234.90739,454.70748 234.36373,454.70748 C 233.1339,454.70748 233.56965,458.56705 234.89435,459.40707 C 235.37,459.70874 235.47767,459.9601 235.13359,459.96563 C 234.78952,459.97117 234.8636,460.33131 235.29822,460.76594 C 236.20938,461.67708 236.36483,463.92688 235.51664,463.92688 C 235.20215,463.92688 234.77626,465.18355 234.57025,466.7195 C 234.29962,468.7373 234.48042,469.82683 235.22193,470.64617 C 236.56147,472.12635 235.97902,473.4893 233.31183,475.1162 C 229.91387,477.18872 227.51575,477.35012 222.61359,475.83597 C 217.18604,474.15955 217.19994,474.15975 216.34892,475.7499 C 215.84092,476.6991 215.93044,477.71152 216.69028,479.61052 C 217.56138,481.78762 218.03548,483.86949 218.26282,486.51572 C 218.28779,486.80619 219.18855,487.3508 220.26454,487.72589 C 222.40015,488.47043 222.56602,489.46388 220.77767,490.79925 C 219.00981,492.11933 219.40214,493.40702 221.72783,493.91784 L 223.8304,494.37966 L 222.06447,495.66597 C 219.56991,497.48318 218.00233,500.97805 218.91606,502.68542 C 219.95157,504.62031 219.78251,507.98506 218.58983,509.17778 C 217.94049,509.82709 217.69962,510.79177 217.94384,511.76488 C 218.28871,513.1389 218.10497,513.3165 216.33871,513.3165 C 215.15904,513.3165 213.88339,513.85459 213.21643,514.63356 C 212.59622,515.35794 211.69645,515.95062 211.217,515.95062 C 210.17502,515.95062 207.12878,522.22514 207.11965,524.39012 C 207.10984,526.7138 208.1696,528.22005 211.35754,530.41341 C 213.53052,531.90847 215.00752,532.41382 217.20397,532.41382 C 219.27638,532.41382 220.26072,532.72096 220.54259,533.45548 C 221.32867,535.50397 220.91645,537.01009 219.27543,538.08533 C 218.35864,538.68604 217.75882,539.32778 217.94247,539.51144 C 218.1261,539.69504 218.70165,539.49234 219.22145,539.06094 C 219.74502,538.62645 220.32978,538.54077 220.53254,538.86885 C 220.9617,539.56327 219.03204,542.16577 215.19205,546.0715 C 212.06335,549.25378 210.87886,552.51929 211.75066,555.55905 C 212.7467,559.032 210.42904,561.49259 208.43027,559.08422 C 207.97938,558.54093 207.30103,558.09643 206.92282,558.09643 C 206.54463,558.09643 206.42813,558.28938 206.66396,558.5252 C 206.89978,558.76101 206.57876,559.37792 205.95055,559.89605 C 204.87539,560.78276 204.87946,560.81549 206.02021,560.45291 C 208.07989,559.79826 208.61638,560.77684 207.08914,562.40248 C 205.68432,563.89786 204.60518,569.94994 205.74338,569.94994 C 206.18299,569.94994 207.77174,572.81111 207.77174,573.60286 C 207.77174,573.7669 207.19656,573.90111 206.49355,573.90111 C 205.79054,573.90111 205.03221,574.19745 204.80836,574.55964 C 204.57312,574.94027 205.19948,575.21816 206.29261,575.21816 C 207.54815,575.21816 208.83398,575.90066 210.11802,577.24867 L 212.05217,579.27911 L 209.41806,578.86411 C 207.9693,578.63579 205.86203,578.30903 204.73524,578.13801 C 203.60843,577.96686 201.08957,578.14262 199.13775,578.52852 C 197.1859,578.91442 194.99629,579.34569 194.27191,579.48694 C 193.54753,579.6282 192.16484,579.09597 191.19926,578.30416 L 191.19925,578.30416 z"},
+    "sa_boli":{"lang_eng":"Bolivia", "z_order":1, "svg_path":"M 172.65748,315.32625 C 172.41203,315.08079 172.21121,314.31801 172.21121,313.63117 C 172.21121,312.52905 170.30928,307.96636 167.14342,301.47367 C 166.57981,300.31778 165.71148,299.21584 165.21378,299.02486 C 164.71607,298.83386 164.30887,298.06633 164.30887,297.31921 C 164.30887,296.5721 163.88181,295.79694 163.35985,295.59665 C 162.61483,295.31077 162.46361,294.1234 162.65635,290.0739 L 162.9019,284.91534 L 160.73001,283.42714 C 158.69146,282.03029 156.18702,277.04742 156.18702,274.38834 C 156.18701,273.86208 155.64374,273.28942 154.97972,273.11577 C 154.31572,272.94214 153.77242,272.40484 153.77242,271.92179 C 153.77242,271.43876 153.37517,270.80655 152.88964,270.51691 C 151.1139,269.4576 151.15288,266.97452 152.98959,264.14986 C 153.96252,262.65361 154.76674,261.13308 154.77677,260.77089 C 154.78681,260.4087 155.0357,259.72775 155.32986,259.25767 C 156.12853,257.98139 155.30967,256.49046 153.80999,256.49046 C 153.00418,256.49046 152.08494,255.70874 151.45244,254.48561 C 150.57142,252.78186 150.54257,252.12988 151.2605,250.14449 C 152.01373,248.06148 151.97503,247.71296 150.90355,246.92947 C 149.61107,245.98439 149.86346,243.87891 151.49415,242.00284 C 152.85428,240.43807 153.36037,237.49582 152.45672,236.40699 C 151.16758,234.85366 150.98051,227.53342 152.16608,225.03398 C 153.32596,222.58869 153.28622,222.50758 147.01049,214.50928 L 143.78111,210.39348 L 146.34022,210.39348 C 147.74771,210.39348 149.22086,210.71503 149.61388,211.10805 C 150.62097,212.11516 154.2819,210.12404 155.22373,208.05695 C 155.62951,207.16637 156.52146,206.44231 157.21276,206.44231 C 157.9021,206.44231 159.26214,205.71058 160.23506,204.81624 C 167.91442,197.75714 169.65223,196.78588 176.67292,195.629 L 178.82978,195.27361 L 178.73195,199.37627 C 178.67814,201.63273 178.90996,204.81245 179.24709,206.44231 C 179.87908,209.49765 181.79612,213.02759 182.8234,213.02759 C 183.14395,213.02759 183.40619,213.4721 183.40619,214.01538 C 183.40619,214.55867 183.93135,215.00318 184.57321,215.00318 C 185.21506,215.00318 186.82687,215.89889 188.155,216.99364 C 190.2326,218.70618 191.05815,218.96849 194.06717,218.87225 C 198.02019,218.74581 202.06504,219.68813 203.70408,221.11729 C 204.31143,221.64685 205.99371,222.29083 207.44248,222.5483 C 208.89124,222.80579 210.9757,223.69859 212.07461,224.53235 C 213.40124,225.53887 214.72895,225.96914 216.02578,225.8128 C 220.20043,225.30953 221.35674,225.40705 223.77776,226.46667 C 225.64174,227.2825 226.19093,227.85661 225.92098,228.70716 C 225.72135,229.33616 226.14934,230.95405 226.87206,232.30251 C 228.47832,235.29945 228.52865,236.66821 227.07172,237.73354 C 226.04623,238.48341 226.09353,238.71028 227.66469,240.5775 C 228.76723,241.8878 229.53764,243.81052 229.83948,246.00519 L 230.30692,249.40381 L 238.11674,249.12535 C 245.86249,248.84919 245.92358,248.85862 245.56799,250.2754 C 245.37081,251.06108 245.5315,252.89983 245.92509,254.36154 C 246.50846,256.52803 247.15005,257.27117 249.39675,258.38275 C 253.28079,260.30441 254.70763,263.37818 253.82469,267.92176 C 252.87311,272.81849 251.05777,278.22189 250.36419,278.22189 C 250.03549,278.22189 248.32926,277.43964 246.57261,276.48355 C 243.7969,274.97284 242.83675,274.78895 239.23969,275.07926 C 235.65339,275.36871 229.97719,276.87925 221.67342,279.75395 C 219.8854,280.37296 219.2856,281.05369 218.65943,283.17465 C 218.22946,284.63101 217.34552,286.63474 216.69511,287.62741 C 215.85741,288.90587 215.63753,290.0542 215.94113,291.56478 C 216.17687,292.73769 216.00774,295.65976 215.56528,298.05831 L 214.76085,302.41931 L 209.49134,302.85879 C 203.63971,303.34679 202.77939,303.78342 202.16591,306.57656 C 201.60031,309.15167 200.65994,309.60568 199.92045,307.66068 C 199.21609,305.80805 196.56238,305.16228 191.8408,305.69447 C 189.65403,305.94095 188.36304,305.73667 187.27024,304.97124 C 185.02617,303.39944 183.40619,303.59809 183.40619,305.44511 C 183.40619,306.45395 182.83155,307.24756 181.74139,307.74426 C 180.82576,308.16148 179.87759,309.02396 179.63438,309.66092 C 179.39118,310.29791 178.95487,311.11538 178.66483,311.47757 C 178.37482,311.83976 177.61902,312.77711 176.98531,313.56056 C 175.74757,315.09081 173.38566,316.05441 172.65748,315.32623 L 172.65748,315.32625 z"},
+    "sa_braz":{"lang_eng":"Brazil", "z_order":1, "svg_path":"M 297.12391,403.63662 C 296.92572,403.39784 296.71871,402.29714 296.66389,401.19062 C 296.5657,399.20953 296.58836,399.1505 298.14443,397.32911 C 300.05498,395.09275 299.98643,394.49075 297.68846,393.32631 C 296.36818,392.65724 295.91695,392.18383 295.19564,390.7107 C 294.26938,388.81908 292.45636,387.24223 291.20772,387.24223 C 290.77009,387.24223 289.94015,386.57518 288.98117,385.45268 C 287.9456,384.24056 287.11401,383.59125 286.40389,383.44045 C 285.82728,383.31796 285.09404,382.98708 284.77449,382.70514 C 284.45494,382.42319 283.89977,382.17087 283.5408,382.14443 C 283.18184,382.11799 282.10409,381.25387 281.14584,380.22423 C 280.18758,379.19455 279.22909,378.3521 279.01592,378.3521 C 278.80273,378.3521 278.17357,378.79661 277.6178,379.33989 C 277.06204,379.88318 276.53834,380.32768 276.45402,380.32768 C 276.36973,380.32768 276.29676,379.92022 276.29189,379.42221 C 276.28702,378.92301 275.88074,378.04638 275.38641,377.46842 C 274.08397,375.94561 269.68122,372.44233 268.77525,372.20793 C 267.93484,371.99049 265.76429,372.85543 265.76429,373.4078 C 265.76429,373.59183 265.3831,373.7424 264.91723,373.7424 L 264.0702,373.7424 L 264.7526,372.87482 C 265.12792,372.39769 265.43503,371.71703 265.43503,371.36232 C 265.43503,370.99489 265.7176,370.64347 266.09171,370.54564 C 266.76868,370.3686 269.57283,366.71976 270.27791,365.09839 C 270.49667,364.59525 270.89578,364.09918 271.16478,363.99598 C 271.43376,363.89276 271.97181,363.19123 272.36047,362.43702 C 272.74914,361.6828 273.40069,360.69531 273.80835,360.24257 C 274.21604,359.78983 274.88642,358.85597 275.2981,358.16735 C 275.70975,357.47873 276.12327,356.99194 276.21698,357.08565 C 276.65645,357.52515 277.6178,356.52817 277.6178,355.63287 C 277.6178,354.96496 277.84565,354.55104 278.35865,354.28717 C 278.76611,354.07756 279.48539,353.54672 279.95706,353.10748 C 280.4287,352.66824 281.31149,352.04238 281.91878,351.71667 C 282.52611,351.39096 283.25145,350.66056 283.53073,350.0935 C 283.80998,349.52647 284.21915,349.05918 284.44002,349.05506 C 284.66089,349.05095 285.36917,348.75125 286.01404,348.38906 C 286.6589,348.02687 287.40297,347.73053 287.66757,347.73053 C 287.9322,347.73053 288.33374,347.43419 288.55994,347.072 C 288.78611,346.70981 289.13964,346.41348 289.34557,346.41348 C 289.55152,346.41348 289.9172,346.17578 290.15832,345.88527 C 290.39941,345.59476 290.93881,345.22701 291.35694,345.06804 C 292.50176,344.63275 292.82819,343.3473 292.88588,339.04711 C 292.92651,336.02167 292.82213,334.94244 292.42435,334.27278 C 292.14164,333.7969 291.73448,332.80601 291.51953,332.07076 C 291.08991,330.60129 289.99978,329.39803 288.97742,329.26487 C 288.61523,329.21766 287.67422,329.36233 286.88629,329.58633 C 286.09836,329.8103 285.3642,329.90407 285.25482,329.79472 C 285.14547,329.68534 285.25265,329.11996 285.49298,328.53832 C 285.73334,327.95667 286.04295,326.59177 286.18101,325.5052 C 286.31907,324.41863 286.60332,323.0966 286.81267,322.56738 C 287.02205,322.03812 287.11052,321.3893 287.00931,321.12553 C 286.90809,320.86175 287.00236,320.15624 287.21882,319.55767 C 287.52141,318.72071 287.52256,318.36119 287.22359,318.00094 C 287.00901,317.7424 286.91737,317.10567 287.01905,316.5799 C 287.18322,315.73139 287.0446,315.5283 285.75099,314.7218 C 283.90668,313.57191 283.3358,313.58561 280.94867,314.83691 C 278.72337,316.0034 277.72498,315.91772 277.43226,314.53521 C 277.3294,314.04928 277.05305,313.28127 276.81815,312.82853 C 276.58329,312.37579 276.37565,311.45955 276.35679,310.79243 C 276.33789,310.12534 276.02835,308.70651 275.66889,307.63949 C 275.3094,306.57245 275.10236,305.36671 275.20871,304.96004 C 275.33152,304.49051 275.16238,303.89648 274.74527,303.33232 C 274.38403,302.84373 273.99073,302.13594 273.87124,301.75946 C 273.61165,300.94167 272.36571,300.31649 270.99538,300.31649 C 269.83238,300.31649 268.73435,299.79477 268.14244,298.96098 C 267.62938,298.23824 266.84583,298.46145 265.89909,299.59998 C 265.24494,300.38663 265.0567,300.42466 262.11256,300.36467 C 260.40855,300.32999 258.51956,300.1409 257.9148,299.94449 C 257.31001,299.74812 256.42099,299.6663 255.93922,299.7627 L 255.06321,299.93794 L 255.1445,297.08154 C 255.18922,295.51049 255.30555,293.28344 255.40301,292.13257 C 255.50047,290.98166 255.44397,289.87039 255.27743,289.66309 C 255.11089,289.45575 254.87391,288.81484 254.7508,288.23879 C 254.62772,287.66274 254.31426,287.01488 254.05424,286.79911 C 253.79426,286.58331 253.58152,286.14855 253.58152,285.83295 C 253.58152,285.51732 253.26026,284.85073 252.86761,284.35156 C 252.07168,283.33967 252.27684,282.61548 253.51981,282.04928 C 254.68034,281.52068 254.64913,280.88721 253.40648,279.74898 L 252.2374,278.67814 L 253.21103,276.01038 C 253.74651,274.54314 254.40886,273.02254 254.68291,272.63127 C 255.02109,272.14847 255.09284,271.68753 254.90621,271.1967 C 254.65011,270.52313 255.49635,265.98267 256.04277,265.09853 C 256.15995,264.90894 255.81857,263.82823 255.28418,262.69698 C 254.74975,261.56572 254.06794,260.08654 253.76903,259.40987 C 253.19957,258.12073 252.41803,257.51215 251.33192,257.51215 C 250.97632,257.51215 250.0444,257.14809 249.26098,256.70309 C 247.93306,255.94881 247.79974,255.74262 247.29178,253.65739 C 246.8241,251.73765 246.81122,251.31744 247.20084,250.69151 C 247.68802,249.90875 247.82397,247.44842 247.39468,247.18307 C 247.25161,247.09466 246.02922,247.14856 244.67825,247.30286 C 243.32725,247.45712 239.83863,247.67934 236.92572,247.79659 L 231.62954,248.00979 L 231.05422,244.73437 C 230.51584,241.66948 230.39477,241.37702 229.17034,240.18384 L 227.86181,238.90873 L 228.78582,238.73501 C 229.69643,238.56379 229.70829,238.53123 229.60128,236.49542 C 229.51982,234.94594 229.20392,233.84527 228.33746,232.0921 C 227.36159,230.11744 227.2416,229.64379 227.56448,229.04045 C 227.87949,228.45186 227.82098,228.11321 227.23176,227.11455 C 226.83855,226.44809 226.36863,225.90279 226.18753,225.90279 C 225.79014,225.90279 223.89213,225.10509 222.27005,224.25634 C 221.0276,223.60621 219.95614,223.60111 216.29094,224.22773 C 214.51107,224.53203 214.34354,224.50283 213.52643,223.74555 C 213.04803,223.30217 212.5264,222.93942 212.36727,222.93942 C 212.20814,222.93942 211.93281,222.5577 211.75544,222.09117 C 211.48098,221.36932 211.24918,221.25214 210.19958,221.30459 C 208.7584,221.37663 206.88905,221.00295 206.63509,220.59203 C 206.53763,220.43434 206.06477,220.3053 205.5843,220.3053 C 205.00217,220.3053 204.24333,219.8466 203.30981,218.93041 C 202.02556,217.67003 201.83835,217.58768 201.06172,217.94153 C 200.33835,218.27113 199.96869,218.20296 198.53242,217.47515 C 197.22846,216.81439 196.58374,216.67176 195.66446,216.84073 C 195.01223,216.96061 193.5493,217.13521 192.41348,217.22872 L 190.34835,217.39876 L 189.99411,216.38255 C 189.77898,215.76546 189.41191,215.36634 189.05948,215.36634 C 188.74027,215.36634 187.93326,214.99592 187.26612,214.54318 C 186.59897,214.09044 185.76337,213.72002 185.40922,213.72002 C 185.05508,213.72002 184.76531,213.52158 184.76531,213.27903 C 184.76531,213.03647 184.24672,212.36613 183.61289,211.78936 C 182.97905,211.21259 182.46046,210.60187 182.46046,210.43222 C 182.46046,210.26257 182.12708,209.81281 181.71962,209.43275 C 181.09212,208.84744 180.97877,208.40016 180.97877,206.50917 C 180.97877,205.28126 180.81287,204.06772 180.6101,203.81241 C 180.40734,203.55708 180.07156,202.82013 179.86394,202.17471 C 179.55647,201.21893 179.58124,200.81121 179.99738,199.97703 C 180.68347,198.60172 180.34425,194.94935 179.44031,193.97909 C 178.71987,193.20577 177.76804,193.10573 177.23555,193.74734 C 177.03394,193.99027 176.2379,194.20103 175.4666,194.21568 C 174.6953,194.23032 172.51152,194.77304 170.61378,195.42172 C 167.41031,196.51671 167.00905,196.75424 165.00802,198.73993 C 163.82261,199.91626 162.66076,200.87872 162.42616,200.87872 C 161.81533,200.87872 158.8063,203.4861 158.57458,204.21619 C 158.42804,204.67788 158.05909,204.82989 157.08493,204.82989 C 155.61666,204.82989 154.68243,205.56531 153.96281,207.28761 C 153.43062,208.5613 151.00313,209.97565 150.32095,209.40949 C 149.89961,209.05981 143.81189,208.94501 143.27532,209.27662 C 143.10845,209.37977 142.11472,209.47131 141.06706,209.48005 C 139.53935,209.49281 138.85936,209.68837 137.63251,210.46788 C 136.18116,211.39003 136.03357,211.41821 134.75145,211.01806 C 133.60275,210.65955 133.4001,210.46169 133.4001,209.69865 C 133.4001,209.20494 133.16494,207.21808 132.87751,205.2834 C 132.44586,202.37785 132.42879,201.6278 132.7794,200.97268 C 133.09422,200.38443 133.11049,200.03004 132.84239,199.60074 C 132.64357,199.28239 132.55649,198.62662 132.64885,198.14347 C 132.77075,197.50582 132.65785,197.20402 132.23703,197.04254 C 131.79725,196.87377 130.96203,197.54713 128.77705,199.83207 C 127.19292,201.48866 125.54772,202.9747 125.12107,203.13436 C 124.69441,203.29402 123.45632,203.52955 122.36975,203.65777 C 121.28318,203.786 120.06984,203.9678 119.67343,204.06178 C 119.07289,204.20416 118.77867,203.92428 117.90913,202.38355 C 117.33517,201.36654 116.56863,200.37553 116.20571,200.18131 C 115.82679,199.97852 114.31433,199.87657 112.65331,199.94186 L 109.76077,200.05556 L 110.22082,199.16644 C 111.00326,197.65424 110.78424,196.86147 109.1929,195.44586 C 105.70021,192.33884 104.47484,191.08361 103.64822,189.76605 C 103.16535,188.9964 102.64451,188.36668 102.4908,188.36668 C 102.33708,188.36668 102.28051,188.00479 102.36506,187.56248 C 102.49371,186.88947 102.3117,186.66098 101.24929,186.16182 C 99.667331,185.41857 99.363519,184.27791 100.59772,183.71557 C 101.68811,183.21876 101.91933,182.52058 101.30432,181.58195 C 100.4611,180.29506 100.68364,179.21377 102.07522,177.83602 C 102.77497,177.14323 103.81852,176.33282 104.39422,176.03512 C 105.94573,175.23281 106.21864,174.1793 105.38002,172.22987 L 104.68893,170.62337 L 105.54468,168.75416 C 106.01535,167.72608 106.40044,166.47901 106.40044,165.98288 C 106.40044,165.48676 106.49647,164.38022 106.61384,163.52391 C 106.78537,162.2724 106.99449,161.89199 107.67984,161.58469 C 108.14878,161.37442 108.9788,160.68954 109.52434,160.06272 C 110.06988,159.4359 110.7385,158.73363 111.01014,158.50211 C 111.28178,158.27058 112.17079,157.50649 112.98572,156.80412 C 114.00457,155.926 115.23883,155.29105 116.93689,154.77153 C 118.29511,154.35599 119.64029,153.81787 119.9262,153.57571 C 120.2121,153.33354 120.70101,153.13542 121.01266,153.13542 C 121.81333,153.13542 123.40302,152.26296 123.91377,151.54323 C 124.92716,150.11519 126.72404,149.79384 128.01548,150.80968 C 128.95912,151.55194 131.21465,151.64481 131.77914,150.96464 C 132.27352,150.36896 132.57308,147.40185 133.40495,134.86125 C 133.78936,129.06621 134.2395,123.98964 134.40527,123.57999 C 134.77936,122.65552 134.02905,120.27213 133.00038,119.11726 C 132.60577,118.67422 132.12681,117.67608 131.93602,116.89913 C 131.59254,115.50026 130.64865,114.66615 128.24618,113.63833 C 127.26339,113.21789 127.24202,113.15541 126.9752,109.92396 C 126.75751,107.28756 126.78901,107.0315 127.35246,106.85728 C 127.99513,106.65857 129.87101,105.85287 130.83304,105.36235 C 131.16863,105.19124 131.47407,105.20591 131.59332,105.39886 C 131.93386,105.94984 134.32126,105.78197 134.6562,105.18347 C 135.08713,104.41344 134.57302,102.50492 133.67455,101.53941 C 132.95958,100.77108 132.73996,100.72415 130.513,100.86364 C 127.83109,101.03164 128.02624,101.21976 127.67387,98.126836 C 127.50825,96.672973 127.53723,96.611803 128.55809,96.261364 C 129.13861,96.062086 130.20624,95.905913 130.93062,95.914313 C 132.14521,95.928392 140.1722,95.012198 141.87865,94.664709 C 142.35729,94.567253 142.6195,94.274669 142.6195,93.838075 C 142.6195,93.223724 142.66654,93.209338 143.13691,93.679715 C 144.20817,94.750963 145.69511,94.081902 147.14941,91.874248 C 147.73936,90.978682 148.41179,90.245961 148.64369,90.245961 C 149.02326,90.245961 150.91099,92.28434 151.693,93.538602 C 151.86237,93.810245 152.0756,94.921512 152.16686,96.008084 L 152.33279,97.983669 L 153.59267,97.908287 C 154.6264,97.846435 155.28866,98.127182 157.28203,99.472292 C 160.5026,101.64551 161.83057,101.70787 164.14587,99.794621 C 166.20138,98.096053 166.82041,98.076949 166.82041,99.712088 C 166.82041,100.79839 166.9239,100.95906 167.68009,101.04681 C 168.37959,101.128 168.63965,100.9361 169.0758,100.01697 C 169.37062,99.395685 169.98391,98.643573 170.43866,98.345609 C 170.89341,98.047645 171.26548,97.590359 171.26548,97.329421 C 171.26548,96.773906 173.48043,95.184923 174.25478,95.184923 C 174.54715,95.184923 175.30268,94.683487 175.93372,94.070624 C 176.82627,93.203797 177.20653,93.026531 177.64596,93.272448 C 178.09613,93.524378 178.47244,93.299316 179.49899,92.164214 C 180.20746,91.380819 180.79523,90.443519 180.80513,90.081329 C 180.84414,88.654193 181.23936,87.929838 182.08822,87.729645 C 182.56459,87.61729 183.39886,87.197907 183.94215,86.79766 C 184.48544,86.397423 185.33092,85.971167 185.821,85.850446 C 186.50655,85.681569 186.7603,85.373777 186.92125,84.515856 C 187.0418,83.873241 186.96537,83.092318 186.74086,82.672816 C 186.37909,81.996824 186.16008,81.953232 183.67252,82.061932 L 180.99376,82.178989 L 180.79575,80.972585 C 180.68686,80.309072 180.31306,79.369394 179.9651,78.884421 C 178.60953,76.995061 178.18104,75.883801 178.18054,74.256255 C 178.1801,72.791507 178.06195,72.502238 177.20557,71.869089 C 176.66962,71.472846 176.12797,71.14864 176.0019,71.14864 C 175.87584,71.14864 175.24557,70.746572 174.60129,70.255155 L 173.42987,69.361661 L 174.24093,69.135555 C 176.13219,68.608294 177.1199,68.805181 177.87029,69.859014 C 178.42952,70.644378 178.75144,70.824255 179.29209,70.653473 C 180.98579,70.118458 182.34931,69.978583 183.02534,70.270486 C 183.55574,70.499502 183.96014,70.447709 184.50703,70.080681 C 185.22197,69.600868 185.3433,69.647403 186.95804,71.020786 C 188.85989,72.638369 190.20326,72.893042 191.17426,71.820105 C 191.63823,71.307394 191.71237,70.866852 191.53438,69.679888 C 191.33181,68.329088 191.37376,68.185262 191.97027,68.185262 C 192.3333,68.185262 192.85073,67.870565 193.12013,67.485938 C 193.54333,66.881755 193.81158,66.816847 195.09194,67.008851 C 195.90704,67.13109 196.84332,67.093442 197.17259,66.925211 C 198.82043,66.083266 200.4895,65.385414 201.22852,65.229376 C 201.68126,65.133777 202.18293,64.759614 202.34335,64.397885 C 202.67277,63.655095 204.70002,62.587772 205.78145,62.587772 C 206.49689,62.587772 207.8138,61.5384 207.8138,60.968306 C 207.8138,60.801988 208.31496,60.356164 208.92748,59.977602 C 210.31219,59.121822 210.98948,57.672938 210.4639,56.690891 C 210.13431,56.075058 210.1852,56.002488 210.94658,56.002488 C 211.41468,56.002488 212.22505,55.781483 212.7474,55.511368 C 213.64912,55.045074 213.73029,55.062403 214.35311,55.854188 C 215.0404,56.727936 215.04001,57.475294 214.35116,59.696032 C 213.90307,61.140577 214.41662,62.087567 215.49515,61.805526 C 215.85163,61.712298 216.56581,61.720519 217.08216,61.823793 C 217.84859,61.977075 218.02099,62.182388 218.02099,62.941833 C 218.02099,63.45348 218.20643,63.990595 218.4331,64.135415 C 218.65976,64.280232 219.0455,64.788027 219.2903,65.263836 C 219.67768,66.016817 219.66089,66.242624 219.16084,67.005845 C 218.84481,67.488134 218.29681,68.03765 217.94302,68.226983 C 217.41929,68.507276 217.33978,68.784174 217.51485,69.717506 C 217.6509,70.442622 217.53045,71.464289 217.18703,72.498185 C 216.24095,75.346619 217.03619,79.447229 218.80885,80.860694 C 219.49909,81.411082 219.66945,81.8331 219.67828,83.014517 C 219.69079,84.695288 220.25027,85.500836 222.04187,86.417597 C 222.70471,86.756778 223.67027,87.448105 224.18758,87.953864 C 224.72382,88.478132 225.68827,88.974389 226.43122,89.108297 C 227.1479,89.237487 228.14329,89.579158 228.64318,89.86759 C 229.60674,90.423536 229.45759,90.459331 232.50861,88.939688 C 232.78026,88.80438 233.05549,88.413234 233.12025,88.070453 C 233.34649,86.873124 233.8773,86.557024 235.30275,86.770785 C 236.46963,86.945773 236.75026,86.861329 237.36977,86.148855 C 237.764,85.695435 238.42434,85.255732 238.8372,85.17175 C 239.25,85.087771 240.00309,84.930887 240.51065,84.823128 C 241.08743,84.700662 241.6774,84.213805 242.08401,83.524702 C 242.84342,82.237532 244.02163,81.88251 245.85438,82.388556 C 246.53632,82.576852 247.47969,82.637746 247.95074,82.52388 C 249.6613,82.110367 252.13286,82.003514 253.59555,82.279813 C 255.65401,82.668654 256.5449,82.232801 256.5449,80.836879 C 256.5449,80.167913 256.23233,79.388567 255.71966,78.779304 C 254.44337,77.262509 254.83638,76.911675 257.86179,76.866928 C 259.54792,76.841986 260.75319,76.655734 261.23214,76.346094 C 262.3976,75.592669 263.86944,75.418471 264.59247,75.948412 C 264.94406,76.206061 265.49966,76.416866 265.82722,76.416866 C 266.15483,76.416866 266.42282,76.562213 266.42282,76.739858 C 266.42282,76.917499 266.83029,77.163193 267.3283,77.28584 C 267.82631,77.408478 268.53973,77.706722 268.9137,77.94859 C 269.28768,78.190448 270.25075,78.47537 271.05392,78.581729 C 272.31698,78.748998 272.72102,78.636844 274.04509,77.751522 C 275.4251,76.828822 275.70744,76.75747 276.90962,77.027576 C 277.86976,77.2433 278.47451,77.207215 279.0692,76.898692 C 279.78956,76.52497 279.91811,76.542375 280.07441,77.034862 C 280.21517,77.478341 280.62948,77.595622 282.00449,77.581223 C 283.41101,77.566489 283.96351,77.387725 284.81394,76.672158 C 285.9089,75.750778 287.49573,73.98128 287.49573,73.681596 C 287.49573,73.587687 289.13448,70.139597 291.13742,66.019152 L 294.77912,58.527437 L 295.41302,59.569812 C 296.32715,61.073005 296.45461,60.851315 295.6813,59.103133 C 294.90443,57.346914 295.07414,56.975431 296.31685,57.7119 C 297.67295,58.515577 298.68462,60.196609 298.73555,61.730987 C 298.76094,62.496144 298.84253,62.758393 298.92373,62.335941 C 299.14075,61.207029 299.67741,61.80329 299.68654,63.183417 C 299.69944,65.131117 300.26532,67.195428 301.4638,69.666951 C 303.78097,74.445456 304.28227,75.7199 304.06624,76.282928 C 303.92522,76.650367 303.97415,76.775593 304.20335,76.633947 C 304.39929,76.512827 305.01301,76.986161 305.56713,77.685791 C 306.49924,78.862657 306.72903,78.971847 308.63801,79.144948 C 311.08632,79.366951 312.19054,80.313082 312.19054,82.188893 C 312.19054,83.106546 312.00806,83.408873 311.20275,83.82531 C 310.65946,84.106254 310.21495,84.41817 310.21495,84.518457 C 310.21495,84.618734 310.65946,84.603163 311.20275,84.483838 C 311.74603,84.364513 312.19054,84.330826 312.19054,84.408977 C 312.19054,84.487127 311.1473,85.627962 309.87222,86.944159 C 308.59711,88.260363 307.244,89.944628 306.86528,90.686981 C 305.86376,92.650142 304.89309,93.867867 304.32975,93.867867 C 303.78884,93.867867 299.6785,97.947071 299.6785,98.483867 C 299.6785,98.667195 299.01174,99.733533 298.19681,100.85348 C 297.06997,102.40212 296.71512,103.18367 296.71512,104.11704 C 296.71512,105.03396 296.50696,105.50806 295.89196,105.99181 C 295.43923,106.34794 295.0688,106.93323 295.0688,107.29245 C 295.0688,108.2283 294.24169,108.79647 293.24392,108.54605 C 292.68585,108.40598 291.98465,108.55947 291.18174,108.99748 C 290.51264,109.3625 289.55774,109.80822 289.05973,109.98796 C 288.56172,110.16771 288.15426,110.47333 288.15426,110.66711 C 288.15426,110.99596 289.10606,110.93613 291.39198,110.46359 C 291.95021,110.34818 292.2048,110.47537 292.32343,110.92899 C 292.47545,111.51026 292.57831,111.52163 293.81908,111.09415 C 294.55189,110.84167 295.7626,110.22689 296.5095,109.72797 C 297.25643,109.22904 298.23797,108.63618 298.69071,108.4105 C 300.8441,107.33704 303.62967,105.10616 303.62967,104.45505 C 303.62967,104.24606 304.00009,104.07506 304.45283,104.07506 C 305.24017,104.07506 305.27599,104.16177 305.27599,106.06699 C 305.27599,108.04614 305.94651,110.00181 306.62505,110.00181 C 306.81448,110.00181 306.92179,110.40305 306.86357,110.89344 C 306.76953,111.68492 306.8992,111.81871 308.01758,112.08453 C 308.71055,112.24923 309.35472,112.58517 309.44905,112.83107 C 309.59218,113.20411 309.77321,113.19926 310.54175,112.80183 C 311.04835,112.53985 312.07036,112.22836 312.81282,112.10963 C 314.10251,111.9034 314.18282,111.9415 314.61257,112.96354 L 315.06235,114.03333 L 315.27904,113.16999 C 315.40811,112.6558 315.72621,112.30578 316.06568,112.30449 C 316.37917,112.3033 317.08011,112.00793 317.6234,111.64813 C 318.16668,111.28833 318.8693,110.99296 319.18474,110.99177 C 319.71037,110.98978 319.71959,111.09273 319.2951,112.22434 C 318.3544,114.73217 317.89675,118.35934 318.54827,118.14392 C 318.69472,118.09549 319.19405,116.9475 319.65786,115.59284 C 320.58957,112.87142 321.0947,112.12791 322.2003,111.85041 C 322.60836,111.74799 323.44943,110.92003 324.06934,110.01048 C 324.68927,109.10093 325.41873,108.35904 325.69037,108.36181 C 325.96201,108.36459 326.55469,108.75881 327.00743,109.23785 L 327.83059,110.10884 L 327.93114,109.26967 C 328.00704,108.63632 328.28971,108.36555 329.08357,108.16567 L 330.13544,107.90084 L 328.73606,107.77996 C 327.79233,107.69845 327.33669,107.50444 327.33669,107.18413 C 327.33669,106.9229 327.61696,106.70917 327.95953,106.70917 C 328.3578,106.70917 328.67406,106.38272 328.83669,105.80369 C 329.11834,104.8011 329.11824,104.7908 328.82414,104.03595 C 328.68878,103.68859 329.02328,103.07161 329.78451,102.26448 C 330.70552,101.28788 331.04835,101.10554 331.40577,101.40216 C 331.75209,101.68962 331.9565,101.66089 332.27229,101.28037 C 332.74001,100.71683 333.92197,100.60426 333.92197,101.12326 C 333.92197,101.34858 334.1572,101.33823 334.61586,101.09276 C 335.11766,100.82419 335.40933,100.82099 335.66951,101.08118 C 335.86737,101.27905 336.24658,101.44094 336.5122,101.44094 C 336.77778,101.44094 336.8976,101.34345 336.77844,101.22429 C 336.48171,100.92755 337.19038,100.12389 337.74881,100.12389 C 337.9983,100.12389 338.20241,100.34614 338.20241,100.61778 C 338.20241,100.88942 338.41231,101.11168 338.66888,101.11168 C 338.92541,101.11168 339.21005,101.29689 339.30139,101.52326 C 339.40162,101.77151 339.47778,101.78963 339.49349,101.56892 C 339.50853,101.35697 339.87385,101.27075 340.36172,101.36401 C 340.96085,101.47853 341.14685,101.67388 341.00609,102.04073 C 340.82803,102.50477 340.86734,102.50424 341.39857,102.03549 C 341.94512,101.55321 342.07449,101.59722 343.14137,102.62849 C 344.15238,103.60574 344.50594,103.74265 346.02243,103.74412 C 347.37182,103.74542 347.75107,103.85902 347.75107,104.26188 C 347.75107,104.62812 347.94227,104.71728 348.4096,104.56895 C 348.81295,104.44093 349.06812,104.50978 349.06812,104.74662 C 349.06812,104.95929 349.2808,105.05169 349.54075,104.95194 C 349.8007,104.8522 350.06988,104.94006 350.13892,105.1472 C 350.20797,105.35435 350.8102,105.52382 351.47725,105.52382 C 352.45079,105.52381 352.69003,105.64767 352.69003,106.15172 C 352.69003,106.52427 352.8574,106.71119 353.10161,106.61135 C 354.6827,105.96493 354.66562,105.96266 354.66562,106.81914 C 354.66562,107.846 355.17031,108.23235 355.48726,107.44812 C 355.68982,106.94692 355.75798,106.97419 356.02268,107.66237 C 356.18952,108.09607 356.23492,108.73791 356.1236,109.08867 C 355.95752,109.61202 356.05959,109.70681 356.6928,109.61716 C 357.11715,109.55707 357.48431,109.28566 357.50871,109.01402 C 357.53311,108.74237 357.57012,108.33491 357.59103,108.10854 C 357.64048,107.57297 359.16257,107.57297 359.41252,108.10854 C 359.56247,108.42986 359.64603,108.4319 359.79354,108.11784 C 360.01695,107.64224 361.58016,109.18316 361.58016,109.87898 C 361.58016,110.12074 361.95059,110.4115 362.40332,110.52513 C 362.85606,110.63876 363.22648,110.86383 363.22648,111.0253 C 363.22648,111.18676 363.44874,111.31887 363.72038,111.31887 C 363.99202,111.31887 364.21428,111.44427 364.21428,111.59754 C 364.21428,112.28427 363.09392,114.02324 362.51307,114.23812 C 361.88328,114.47109 361.88391,114.48636 362.54912,115.08836 C 363.0983,115.58534 363.22648,115.60789 363.22648,115.20747 C 363.22648,114.64965 364.24207,113.62372 364.79424,113.62372 C 364.99414,113.62372 365.25054,113.91622 365.364,114.27373 C 365.512,114.74005 365.25903,115.23501 364.46896,116.02511 C 363.86318,116.63085 363.34512,117.41257 363.31766,117.76225 C 363.2902,118.11195 363.20716,119.25685 363.13314,120.30649 C 363.05909,121.35615 362.82758,122.38592 362.61863,122.59488 C 362.40968,122.80385 362.23869,123.25755 362.23869,123.6031 C 362.23869,124.06682 362.64836,123.77851 363.8027,122.50237 C 365.42149,120.71279 365.66485,120.23379 366.01305,118.15192 C 366.16671,117.233 366.46361,116.7917 367.17607,116.42328 C 369.15044,115.4023 369.415,116.11655 367.67155,117.76084 C 366.36878,118.9895 366.2488,119.42029 367.13126,119.70038 C 367.99732,119.97527 368.82397,119.58293 368.82397,118.89703 C 368.82397,118.23636 369.59485,117.46773 369.92569,117.79855 C 370.04558,117.91843 370.49858,117.68305 370.93238,117.27549 C 371.36622,116.86795 371.99535,116.5619 372.33047,116.59542 C 373.15268,116.67764 374.42147,116.24969 374.42147,115.89016 C 374.42147,114.96362 378.55004,116.14128 382.45663,118.18216 C 383.52572,118.74066 384.53234,119.1161 384.69358,119.01644 C 384.85486,118.91679 385.16549,118.97562 385.38392,119.14717 C 385.60235,119.31873 386.33671,119.54442 387.01582,119.64871 C 387.95781,119.79339 388.25056,119.72614 388.25056,119.36514 C 388.25056,118.69982 389.00346,118.77704 389.9761,119.54212 C 390.43072,119.89972 391.30267,120.22362 391.91379,120.26192 C 392.5249,120.30021 393.31714,120.52622 393.67436,120.76417 C 394.4971,121.3122 394.83584,121.31221 394.83584,120.76418 C 394.83584,120.19447 401.99625,119.40351 404.24743,119.72454 C 405.25774,119.8686 406.93284,120.55996 408.70402,121.56388 C 410.2648,122.44855 411.65844,123.17238 411.80095,123.17238 C 411.94345,123.17238 412.54571,123.5428 413.13928,123.99554 C 413.73284,124.44828 414.36042,124.8187 414.53387,124.8187 C 414.70736,124.8187 415.5648,125.40998 416.43933,126.13266 C 417.31382,126.85533 418.52133,127.68004 419.12253,127.96535 C 419.72377,128.25066 420.83945,129.17753 421.60183,130.02507 C 422.95777,131.53255 423.77006,132.33828 426.77447,135.15597 C 427.58939,135.92025 428.92291,136.79589 429.73784,137.10183 C 430.70144,137.46358 431.41567,138.00382 431.78043,138.64684 C 432.21786,139.41792 432.56981,139.63558 433.37921,139.63558 C 434.00593,139.63558 434.80469,139.9617 435.39539,140.45875 C 436.18806,141.12573 436.7593,141.29061 438.40628,141.32781 C 439.52423,141.35307 441.5502,141.4013 442.90841,141.43502 C 446.32489,141.51983 447.80934,142.10991 448.73566,143.75139 C 449.80962,145.65449 451.24452,150.35618 451.0546,151.34974 C 450.95826,151.85372 451.05743,152.26295 451.29832,152.35539 C 451.92277,152.59501 453.17424,157.63565 453.15034,159.81483 C 453.14477,160.32082 453.28237,160.64429 453.45718,160.53624 C 453.63149,160.4285 453.79484,160.6084 453.82016,160.93601 C 453.90787,162.07117 453.70251,164.16654 453.48754,164.3304 C 453.17773,164.56649 453.25214,167.01533 453.59142,167.74897 C 453.76461,168.12352 453.74377,168.58384 453.5387,168.9122 C 453.35204,169.21108 453.08758,169.96447 452.95097,170.58642 C 452.81436,171.20836 452.59036,171.94434 452.45315,172.22193 C 452.31591,172.49952 451.8751,173.76381 451.47346,175.03148 C 450.59511,177.80374 449.88581,179.03487 447.71484,181.55522 C 446.69093,182.74394 445.86968,183.41787 445.54766,183.33366 C 444.92449,183.17069 444.10631,183.95634 444.40162,184.43415 C 444.66408,184.85885 443.85956,186.10207 442.07504,188.02929 C 441.31632,188.84868 440.5247,189.84642 440.31592,190.24648 C 440.10716,190.64652 439.23445,191.28301 438.37665,191.66086 C 437.51885,192.03871 436.27575,192.78107 435.61419,193.31053 C 434.57842,194.13949 434.35561,194.20599 434.00988,193.78941 C 433.49228,193.16573 433.03049,193.17051 433.03049,193.79954 C 433.03049,194.07118 433.18896,194.29343 433.38267,194.29343 C 434.09427,194.29343 433.53548,195.77355 432.78354,195.88034 C 431.98175,195.9942 431.78995,196.45915 432.45348,196.68034 C 432.75713,196.78155 432.69464,197.13234 432.21398,198.02484 C 431.48354,199.38125 431.02915,199.61023 431.28792,198.49155 L 431.45927,197.75071 L 430.94051,198.44678 C 430.65521,198.82962 430.36532,199.65496 430.29634,200.28086 C 430.04873,202.52777 426.84424,208.14786 423.7855,211.69963 C 422.11034,213.64484 421.17698,213.90452 421.17698,212.42538 C 421.17698,211.73562 420.90395,211.2656 420.22066,210.77906 C 419.11259,209.99002 418.87404,209.94256 418.86709,210.50969 C 418.86432,210.73606 418.72745,211.134 418.56291,211.394 C 418.31501,211.78576 418.17491,211.79296 417.74479,211.436 C 417.40167,211.15123 417.22581,211.12956 417.22581,211.37206 C 417.22581,211.5738 417.52214,211.92392 417.88433,212.15011 C 418.6638,212.63689 418.7526,213.66021 418.03915,213.93398 C 417.72125,214.05598 417.60798,214.35581 417.73208,214.7468 C 417.84021,215.08755 417.77337,215.36634 417.58352,215.36634 C 417.3937,215.36634 417.14787,215.7269 417.03727,216.16758 C 416.91906,216.63846 416.66161,216.90184 416.41279,216.80636 C 415.97984,216.64021 415.34884,218.86734 415.72288,219.2414 C 415.82512,219.34362 415.90875,219.2544 415.90875,219.04313 C 415.90875,218.83184 416.06676,218.65898 416.25988,218.65898 C 416.45302,218.65898 416.56415,219.06645 416.50682,219.56446 C 416.44242,220.12421 416.23008,220.43335 415.95066,220.37415 C 415.67115,220.31492 415.56954,220.46302 415.68442,220.76235 C 415.78656,221.02853 415.96917,221.77415 416.09017,222.41925 C 416.21121,223.06437 416.44216,223.51066 416.60336,223.41099 C 416.98399,223.17576 416.9753,223.26196 416.28451,226.56452 C 415.96219,228.1056 415.79637,229.73546 415.91603,230.18642 C 416.03568,230.63745 416.23515,232.58854 416.35928,234.52224 C 416.48341,236.45597 416.74139,238.48681 416.9326,239.0352 C 417.21645,239.84947 417.12531,240.52426 416.43547,242.71601 C 415.97088,244.19204 415.42196,246.30996 415.21565,247.42245 C 415.00933,248.53496 414.62287,250.20153 414.35683,251.12598 C 413.98545,252.41643 413.94535,253.28411 414.18423,254.8622 C 414.47632,256.79212 414.44619,256.97601 413.69106,257.87342 C 413.24879,258.39909 412.71479,258.82951 412.50452,258.82984 C 411.98603,258.83069 410.14831,261.64995 409.60742,263.27428 C 409.33509,264.0921 409.16479,266.21385 409.15814,268.87177 C 409.14642,273.56579 408.89713,274.46425 407.36204,275.3453 C 406.42077,275.88549 405.76251,277.01684 405.0459,279.3259 C 404.7755,280.19714 404.47449,280.56064 404.02343,280.56064 C 403.52282,280.56064 403.42493,280.7231 403.57218,281.30972 C 403.82456,282.31546 402.60513,284.07965 400.83645,285.26751 C 400.07147,285.78133 399.44554,286.45523 399.44554,286.76517 C 399.44554,287.0751 399.18625,287.69501 398.86933,288.14277 C 397.50288,290.07338 397.12248,292.28462 397.64124,295.28218 C 397.8087,296.24979 397.71542,296.39469 396.5389,296.99491 C 395.83203,297.35555 394.55482,297.82657 393.70077,298.04164 C 392.6357,298.30979 391.61333,298.92469 390.44619,299.99905 C 388.80122,301.51317 388.75723,301.59954 389.12742,302.5873 C 389.33809,303.14932 389.38511,303.60914 389.23193,303.60914 C 389.07879,303.60914 388.87099,303.86843 388.77017,304.18535 C 388.60877,304.69281 388.10532,304.76156 384.54986,304.76156 C 382.3295,304.76156 380.3282,304.64204 380.10249,304.49591 C 379.77984,304.28709 379.79743,304.02661 380.18481,303.27753 C 380.82417,302.04111 380.81989,302.02692 379.86437,302.20957 C 378.69976,302.43221 378.2433,303.08149 378.67905,303.89569 C 379.18371,304.83861 379.18174,304.84075 377.51586,305.19606 C 376.17071,305.48294 375.87484,305.43392 374.88135,304.75975 C 373.72267,303.97343 372.84936,303.98321 371.65594,304.7958 C 371.13989,305.14719 370.86986,305.13847 370.11064,304.74582 C 369.60463,304.48419 369.10951,304.40128 369.0104,304.56166 C 368.9113,304.72202 368.42217,304.95566 367.92344,305.08081 C 366.48021,305.44304 366.15071,305.84685 366.61619,306.68292 C 366.83446,307.07494 367.15095,307.49505 367.3195,307.61654 C 367.70059,307.89115 365.36232,308.35673 364.93339,308.09164 C 364.76211,307.98581 364.04869,308.35597 363.34802,308.91424 C 362.64734,309.47247 361.66659,310.14091 361.16858,310.39958 C 360.5361,310.72809 360.26311,311.1261 360.26311,311.7198 C 360.26311,312.39479 360.14451,312.52376 359.68689,312.34649 C 357.42422,311.46986 354.58327,311.96994 353.67509,313.40474 C 353.41388,313.81738 353.26124,313.8641 353.13737,313.56938 C 352.91248,313.03419 352.0315,313.03465 352.0315,313.56994 C 352.0315,313.79663 351.3277,314.35056 350.4675,314.80092 C 349.60729,315.25122 348.05788,316.45251 347.02435,317.47037 C 345.99082,318.48819 344.32484,319.73607 343.3222,320.24336 C 341.22578,321.30405 339.12962,323.25162 339.25944,324.01808 C 339.30827,324.30622 339.05336,324.91249 338.69298,325.3654 C 338.1247,326.0796 337.82994,326.17186 336.4713,326.06064 C 335.1716,325.95425 334.93765,326.0179 335.09748,326.43439 C 335.37265,327.15152 334.04663,327.82951 333.40704,327.29867 C 333.0213,326.97859 332.93418,327.03506 332.93418,327.60512 C 332.93418,328.11482 333.13912,328.30395 333.69149,328.30395 C 334.10801,328.30395 334.61899,328.47414 334.82705,328.68221 C 335.35638,329.21153 334.50918,330.78024 333.52356,331.09575 C 332.89003,331.29857 332.86161,331.36172 333.34576,331.49099 C 333.98216,331.66096 334.14465,333.36872 333.60558,334.22115 C 333.27398,334.74554 333.22864,334.72292 332.63455,333.73681 C 332.29742,333.17719 332.26976,333.2761 332.45036,334.39533 C 332.56725,335.11972 332.87946,335.83501 333.14415,335.98486 C 333.5074,336.19052 333.57272,336.60861 333.41056,337.69012 C 333.29239,338.47814 333.30322,339.29689 333.43463,339.50953 C 333.66732,339.88604 334.01361,342.45994 333.96478,343.4501 C 333.95138,343.72174 333.88151,345.87019 333.80956,348.22443 C 333.71299,351.38322 333.52567,352.85 333.09473,353.82192 C 332.7736,354.5463 332.44552,354.95377 332.36577,354.7274 C 332.06901,353.88504 331.67317,354.35098 331.92871,355.2419 C 332.17661,356.10632 332.04899,356.27625 330.01246,357.7937 C 326.39361,360.49011 323.28984,365.14172 321.38076,370.72996 C 320.00266,374.76394 316.06581,381.27201 313.97245,382.97675 C 313.44299,383.40792 313.40687,383.39554 313.61059,382.85255 C 313.73505,382.52081 313.83686,381.75294 313.83686,381.1461 C 313.83686,380.31698 314.00748,379.98864 314.52334,379.82493 C 314.90088,379.70508 315.3578,379.18257 315.53866,378.66375 C 315.71953,378.14496 316.15992,377.62765 316.51737,377.51422 C 317.28995,377.26898 317.78803,376.10484 317.78803,374.54413 C 317.78803,373.81494 317.93426,373.44238 318.19961,373.49545 C 318.43125,373.54178 318.65683,373.1811 318.71557,372.67042 C 318.84042,371.5849 317.90867,371.03536 317.31646,371.84521 C 316.47008,373.00274 313.81714,372.27299 313.33361,370.74955 C 313.2238,370.40356 312.99575,370.1205 312.82688,370.1205 C 312.34757,370.1205 312.46633,371.54394 313.01044,372.32074 C 313.44441,372.94038 313.44464,373.12934 313.01245,373.95804 C 312.74374,374.47327 312.52293,375.08004 312.52184,375.30641 C 312.52073,375.53277 312.37163,375.71799 312.19054,375.71799 C 312.00944,375.71799 311.86127,376.23658 311.86127,376.87041 C 311.86127,377.50424 311.71311,378.02284 311.53201,378.02284 C 311.35092,378.02284 311.20275,378.38805 311.20275,378.83441 C 311.20275,379.30901 310.92929,379.79233 310.54422,379.99842 C 310.18203,380.19226 309.88569,380.56788 309.88569,380.83317 C 309.88569,381.09843 309.62231,381.31548 309.30042,381.31548 C 308.2638,381.31548 307.25158,382.27838 307.25158,383.26446 C 307.25158,383.79523 306.8313,384.71717 306.26378,385.43128 C 305.19315,386.77846 305.09239,387.08988 305.62126,387.41674 C 305.86007,387.56435 305.85523,387.76418 305.60555,388.06503 C 305.33216,388.39446 305.41711,388.62079 305.95576,388.99807 L 306.66687,389.49621 L 305.84707,390.38032 C 305.35528,390.91073 304.66995,392.46881 304.13417,394.27462 C 303.00693,398.07403 302.22269,399.40749 299.59362,401.99481 C 297.92533,403.63662 297.40885,403.97995 297.12391,403.63662 z"},
+    "sa_chil":{"lang_eng":"Chile", "z_order":1, "svg_path":"M 174.80505,561.39098 C 174.16652,561.02655 173.8297,560.04238 173.91615,558.79355 C 173.99269,557.68768 173.78859,556.94776 173.46255,557.14927 C 173.1365,557.35084 172.86974,558.44644 172.86974,559.58404 C 172.86974,561.98543 172.06648,561.40178 171.00789,558.23123 C 170.39545,556.39703 170.45054,555.99704 171.36376,555.64657 C 172.31224,555.28267 172.28922,555.17408 171.17527,554.75776 C 169.99472,554.31661 170.01687,554.24061 171.4934,553.66703 L 173.08044,553.05045 L 171.53436,551.96757 C 169.44617,550.50491 169.15877,548.60545 171.10766,549.14742 C 175.09503,550.25625 175.50385,550.29893 175.50385,549.60694 C 175.50385,549.20551 175.19002,548.87703 174.80646,548.87703 C 174.42289,548.87703 174.28039,548.59986 174.48979,548.26104 C 174.69919,547.92223 174.14859,546.92311 173.26627,546.04082 C 171.7763,544.55083 171.63909,544.52429 171.33975,545.66901 C 171.16249,546.34683 170.51351,546.90145 169.89756,546.90145 C 169.17264,546.90145 168.91135,546.55309 169.15671,545.91365 C 169.38317,545.32355 169.16207,544.92586 168.6075,544.92586 C 167.03989,544.92586 166.67097,543.46077 167.9948,542.49273 C 168.68396,541.98883 169.25017,541.21887 169.25303,540.78174 C 169.26185,539.4342 166.25494,538.28645 163.88208,538.73161 C 161.88779,539.10579 161.67274,538.99562 161.65382,537.59071 C 161.63393,536.11416 161.58622,536.0973 160.70776,537.25697 C 160.19895,537.9286 159.42783,538.35987 158.99419,538.21533 C 158.44059,538.03081 158.52623,537.632 159.28171,536.87654 C 159.87349,536.28465 160.3577,535.48303 160.3577,535.09496 C 160.3577,534.70689 160.65404,534.38941 161.01623,534.38941 C 161.37842,534.38941 161.67476,533.77922 161.67476,533.0335 C 161.67476,532.28772 161.37842,531.86073 161.01623,532.08456 C 160.65404,532.30839 160.3577,532.14317 160.3577,531.71736 C 160.3577,531.24671 161.00309,531.06661 162.00402,531.25797 C 163.10799,531.46897 163.65034,531.27734 163.65034,530.67617 C 163.65034,530.18312 163.94668,529.77971 164.30887,529.77971 C 164.67106,529.77971 164.9674,530.22422 164.9674,530.7675 C 164.9674,531.31079 165.30002,531.7553 165.70656,531.7553 C 166.21725,531.7553 166.19233,532.06059 165.62593,532.74309 C 164.93398,533.57685 165.06583,533.73088 166.47144,533.73088 C 167.81253,533.73088 168.06969,533.98731 167.79232,535.04794 C 167.29644,536.94424 168.56749,536.67154 169.47139,534.68766 C 170.40968,532.62837 170.46647,530.87636 169.5771,531.42603 C 168.50489,532.08871 168.82748,529.30636 169.9534,528.18041 C 170.89417,527.2397 170.88976,527.1456 169.90511,527.1456 C 169.22682,527.1456 168.90614,526.71485 169.04713,525.99317 C 169.21206,525.14894 169.79728,524.8908 171.23563,525.0279 L 173.199,525.21506 L 171.10654,524.14567 C 169.08287,523.11132 167.66487,521.21884 168.91358,521.21884 C 170.09396,521.21884 172.21121,518.3204 172.21121,516.7045 C 172.21121,515.80692 172.02547,515.2583 171.79846,515.48537 C 171.57143,515.71236 170.55107,515.46647 169.53095,514.93898 C 168.17792,514.23936 167.74959,513.59881 167.94748,512.57125 C 168.09669,511.79655 168.37724,511.00421 168.57097,510.81047 C 168.76467,510.61673 168.46582,509.76025 167.90681,508.90706 C 167.10119,507.67759 167.02973,506.8514 167.56213,504.92316 C 168.00086,503.33427 168.00997,502.26659 167.58841,501.84501 C 167.23344,501.48999 166.94298,500.61678 166.94298,499.90445 C 166.94298,499.19219 167.12273,498.7891 167.34242,499.00879 C 167.5621,499.22847 168.10765,499.06654 168.55475,498.6489 C 169.85952,497.43003 168.39802,493.42809 166.8299,493.92581 C 165.21275,494.43913 165.294,493.12056 166.94298,492.09075 C 167.66737,491.63841 168.26004,490.69019 168.26004,489.98372 C 168.26004,488.72488 168.24167,488.72436 167.34351,489.95264 C 166.57624,491.00194 166.2592,491.06687 165.39677,490.35112 C 164.2254,489.37893 162.99181,489.87382 162.99181,491.31586 C 162.99181,492.32565 160.42006,493.63731 159.50256,493.09547 C 159.21334,492.92465 159.30435,492.39005 159.70483,491.90748 C 160.27552,491.21985 160.16724,491.09967 159.204,491.35155 C 157.34441,491.83781 156.24028,488.80318 155.9858,482.50633 C 155.82828,478.60831 155.99795,476.95988 156.5798,476.73585 C 157.02778,476.56338 157.47723,475.21807 157.57856,473.74626 C 157.71643,471.74348 157.25988,470.19126 155.76381,467.57638 C 154.66437,465.65479 153.65827,463.1674 153.52804,462.04889 C 153.3978,460.93038 152.8457,459.33522 152.30114,458.5041 C 150.96529,456.46536 150.07017,452.40099 151.09673,453.03548 C 152.35513,453.81314 153.80263,452.09378 153.36325,450.34315 C 153.14522,449.47442 153.26643,448.39707 153.63263,447.94901 C 153.99884,447.50094 154.45101,444.7637 154.63748,441.86618 C 154.82392,438.96866 155.44648,434.83158 156.02088,432.67266 C 156.5953,430.51374 157.02763,427.08255 156.98163,425.04776 C 156.93565,423.01298 157.25012,420.69015 157.68049,419.88602 C 158.24689,418.82763 158.27497,417.84188 157.78214,416.31594 C 157.35112,414.98143 157.31746,413.27255 157.69039,411.65863 C 158.25988,409.19396 158.18773,408.46786 157.09303,405.64712 C 156.8119,404.92274 156.27058,403.14472 155.89008,401.69595 C 155.50958,400.24719 154.53474,396.91388 153.72377,394.2886 C 152.30637,389.70028 152.29475,389.46509 153.42337,388.21798 C 155.01507,386.45916 154.5665,379.86897 152.76544,378.552 C 151.65782,377.7421 151.62142,377.31286 152.34097,373.54709 C 152.77384,371.28164 153.29169,366.31652 153.49173,362.51352 C 153.69178,358.71052 153.93986,354.59292 154.04301,353.36331 C 154.14618,352.1337 153.94213,349.77526 153.5896,348.12236 C 153.13388,345.98565 153.17584,344.48877 153.73478,342.94307 C 154.39138,341.12732 154.33908,340.41742 153.41756,338.63535 C 152.71813,337.28272 152.24191,334.51804 152.1167,331.08293 C 151.97549,327.20867 151.6202,325.36522 150.87022,324.61524 C 149.55121,323.29625 149.52502,321.93935 150.80904,321.44662 C 152.14005,320.93586 152.21694,306.5946 150.90883,302.83487 C 150.42042,301.43112 149.83529,298.45919 149.60854,296.2306 C 149.38177,294.00199 148.44786,289.9492 147.53317,287.22436 C 145.79346,282.04183 145.41284,278.88042 146.52861,278.88042 C 147.97623,278.88042 149.82125,276.17439 149.82125,274.05122 C 149.82125,272.8439 150.02452,271.65285 150.27296,271.40441 C 151.18395,270.49343 154.48186,275.14073 155.78343,279.16952 C 156.87836,282.55863 157.52481,283.53032 159.33236,284.50375 C 161.29488,285.56062 161.46529,285.86347 160.85329,287.20666 C 160.35413,288.3022 160.38117,288.98094 160.95139,289.66801 C 161.48768,290.31421 161.51855,290.75275 161.04821,291.04343 C 159.61391,291.92989 160.46083,296.66069 162.05381,296.66069 C 162.55879,296.66069 162.79338,297.07009 162.59083,297.59791 C 162.3855,298.13295 163.07648,299.28831 164.20106,300.2903 C 165.28447,301.25563 166.35227,302.76798 166.57391,303.65104 C 166.79556,304.53412 167.75805,306.95267 168.71281,309.02563 C 169.66755,311.09859 170.638,313.68364 170.86933,314.77022 C 171.24065,316.51415 171.5563,316.74074 173.56153,316.70265 C 174.81088,316.67891 176.27762,316.53076 176.82091,316.37339 C 177.62742,316.13976 177.77782,316.75196 177.64043,319.70918 C 177.38359,325.23762 177.09216,325.81547 173.48913,327.94078 C 171.64708,329.02735 169.53981,330.88725 168.80632,332.07388 C 167.60854,334.01168 167.57066,334.38089 168.43445,335.6992 C 169.12351,336.75085 169.2245,337.63112 168.79064,338.80396 C 168.3321,340.0435 168.52488,341.12128 169.5847,343.24339 C 170.53784,345.15183 170.82372,346.51922 170.48087,347.52977 C 169.80843,349.51176 170.09403,350.71342 171.63168,352.37212 C 173.15342,354.01364 172.30177,355.26971 169.66708,355.26971 C 169.35437,355.26971 168.71175,357.12182 168.23901,359.38551 C 167.76625,361.6492 167.20718,363.64948 166.9966,363.83057 C 165.67426,364.96775 164.16701,368.99036 164.03853,371.72523 C 163.95562,373.48991 163.53594,375.35772 163.10589,375.8759 C 162.49894,376.60725 162.52737,377.31739 163.23297,379.0498 C 164.81604,382.9366 165.10798,385.94259 163.99234,386.8685 C 163.37995,387.37673 162.99181,388.80214 162.99181,390.54274 C 162.99181,392.10688 162.69548,393.56977 162.33329,393.79361 C 161.56046,394.27124 161.43954,398.50947 162.18559,398.97055 C 162.96007,399.44921 168.08093,410.00302 168.54054,412.06777 C 168.76225,413.0638 169.3641,413.87873 169.87798,413.87873 C 170.39185,413.87873 170.77846,414.39732 170.7371,415.03115 C 170.69573,415.66498 170.87142,417.27173 171.1275,418.60169 C 171.39583,419.9954 171.32167,421.1876 170.95241,421.41578 C 170.60004,421.63356 170.12499,423.21244 169.89675,424.92442 C 169.66852,426.6364 169.18222,428.82482 168.81608,429.78752 C 168.3132,431.10984 168.38957,431.91516 169.12836,433.08016 C 170.72264,435.59422 171.13552,438.66929 169.94035,439.12789 C 169.37835,439.34356 168.91857,439.86702 168.91857,440.29124 C 168.91857,440.7154 168.4576,441.39955 167.89419,441.81152 C 166.53531,442.80511 166.38709,450.99358 167.71314,451.81312 C 168.02576,452.00627 168.11641,452.43154 167.91461,452.75804 C 167.7128,453.08461 168.06753,454.32356 168.70289,455.51128 C 169.33824,456.69907 170.22335,458.68894 170.66977,459.93323 C 171.41569,462.01221 171.35346,462.31414 169.9023,463.65906 C 168.60848,464.8581 168.39235,465.54897 168.70612,467.48254 C 168.93776,468.9099 168.77367,470.22254 168.29089,470.80422 C 167.80448,471.39031 167.68626,472.35716 167.98821,473.2793 C 168.26073,474.11161 168.55122,476.71879 168.63374,479.07303 C 168.79421,483.65086 169.93763,489.79776 170.99693,491.77709 C 171.43131,492.58873 171.41157,493.26649 170.93689,493.83842 C 170.14898,494.78782 170.63255,501.06076 171.63854,502.94047 C 171.979,503.57654 172.66389,504.09711 173.16052,504.09711 C 173.71697,504.09711 173.94044,504.56769 173.74282,505.32335 C 173.5514,506.05537 173.83717,506.70883 174.4519,506.94471 C 175.01825,507.16209 175.31827,507.76564 175.11859,508.286 C 174.9189,508.80637 175.05914,509.41973 175.4302,509.64909 C 175.80128,509.87839 175.95754,510.44993 175.77748,510.9192 C 175.5974,511.3884 175.7491,512.55873 176.11454,513.51992 C 176.68895,515.03072 177.04946,515.21346 178.77553,514.86826 C 180.34331,514.55467 180.77208,514.69875 180.77208,515.53904 C 180.77208,516.12756 180.54983,516.55271 180.27818,516.48369 C 180.00654,516.41475 178.80469,516.59005 177.60741,516.87335 C 174.94031,517.50441 174.93633,519.46722 177.60151,519.77627 C 180.25459,520.08387 181.08618,521.44432 179.81085,523.39073 C 178.99522,524.63555 178.91313,525.39101 179.44224,526.78268 C 179.81664,527.76745 179.96037,528.8363 179.76163,529.15786 C 179.5629,529.47942 179.88168,530.47722 180.47006,531.37519 C 181.18209,532.46183 181.37153,533.51416 181.03655,534.52177 C 180.75975,535.35448 180.6109,536.86561 180.70579,537.87987 C 180.80065,538.89414 180.5967,540.07949 180.25253,540.51399 C 179.09141,541.9798 178.70139,546.05254 179.63126,547.00135 C 180.92685,548.32341 180.64763,554.12326 179.25073,554.905 C 178.63872,555.2475 178.13797,556.1057 178.13797,556.8121 C 178.13797,557.5185 177.8845,558.09643 177.5747,558.09643 C 177.26491,558.09643 176.74631,558.9697 176.42228,560.03705 C 175.96505,561.5431 175.60291,561.84629 174.80504,561.39098 L 174.80505,561.39098 z"},
+    "sa_colu":{"lang_eng":"Columbia", "z_order":1, "svg_path":"M 129.799,146.77186 C 129.51103,146.02143 128.81511,145.79507 127.4237,145.99929 C 126.34132,146.15813 125.4557,146.18388 125.4557,146.05647 C 125.4557,145.92908 126.52215,143.70713 127.8256,141.11883 L 130.1955,136.41282 L 128.64874,135.22317 C 127.79805,134.56883 126.61731,134.02689 126.02487,134.01884 C 125.43244,134.0108 124.09892,133.56151 123.0615,133.02046 C 120.92744,131.90747 119.52895,131.74762 119.52895,132.61668 C 119.52895,133.67933 117.71265,133.92981 115.32366,133.1966 C 113.17645,132.53762 112.82527,132.62594 111.22338,134.22783 C 110.08472,135.36647 108.75362,135.98331 107.42101,135.98986 C 106.29327,135.9954 104.95296,136.26433 104.44251,136.58746 C 103.15434,137.40293 101.74868,136.73354 101.74868,135.30465 C 101.74868,133.17511 100.97875,132.02892 99.538008,132.01365 C 98.617169,132.00389 97.770038,131.27461 97.10017,129.91495 C 96.295665,128.28198 95.353423,127.61863 92.744769,126.84864 C 89.945365,126.02234 89.29032,125.51861 88.625885,123.68115 C 88.11463,122.26722 87.269633,121.35412 86.231377,121.09353 C 85.348929,120.87208 84.626945,120.46368 84.626945,120.18602 C 84.626945,119.52406 81.132689,118.72222 77.242064,118.49139 C 75.534625,118.39008 73.4684,117.83846 72.650469,117.26556 C 70.76067,115.94189 67.583027,115.91343 67.08331,117.21566 C 66.412441,118.96395 60.319855,118.16324 58.025022,116.02517 C 56.841239,114.92227 55.376323,114.24834 54.162701,114.24834 C 51.81649,114.24834 43.057852,110.24443 43.358648,109.30938 C 43.475181,108.94719 44.362568,108.55708 45.330664,108.44248 C 47.294395,108.21 47.428037,107.80658 46.335486,105.4087 C 45.333799,103.21024 46.223108,102.18061 50.430452,100.66767 C 52.226871,100.02166 53.592027,99.182927 53.464121,98.803773 C 53.336202,98.424639 53.74823,97.1919 54.379706,96.064407 C 56.230862,92.759188 56.790407,91.662554 57.8698,89.224267 C 58.760486,87.212226 58.767052,86.892175 57.921376,86.704948 C 57.388568,86.586986 57.121916,86.216564 57.328819,85.881788 C 57.535742,85.547005 57.020767,85.263674 56.184462,85.252156 C 54.705598,85.231788 54.69896,85.204702 55.942196,84.264364 C 56.645274,83.732595 56.905801,83.297512 56.521181,83.297512 C 56.13658,83.297512 55.624706,81.297232 55.383718,78.852446 C 55.142716,76.40766 54.674924,73.969643 54.344152,73.434628 C 53.941218,72.782942 54.074827,72.094931 54.74889,71.350096 C 55.654063,70.34991 55.636026,70.056688 54.569276,68.428621 C 53.917096,67.433295 53.470502,65.789641 53.576821,64.776081 C 53.721955,63.392328 53.184233,62.347349 51.418271,60.581387 C 48.396298,57.559401 48.376114,56.236127 51.327256,54.607521 C 52.027429,54.221123 52.916443,53.33211 53.302841,52.631936 C 53.689239,51.931762 54.278286,51.161923 54.611837,50.921191 C 54.955648,50.673051 54.718999,49.721478 54.065324,48.723841 C 53.431208,47.756034 53.027991,46.848543 53.169331,46.707203 C 53.671031,46.20551 56.310228,48.485552 56.310228,49.420643 C 56.310228,49.943395 56.754734,50.371096 57.29802,50.371096 C 58.433125,50.371096 58.576263,48.586676 57.638934,46.121297 C 57.06286,44.606135 57.279134,44.160503 59.614519,42.050631 C 61.056867,40.747555 62.236982,39.282909 62.236982,38.795874 C 62.236982,37.591261 64.866782,35.224945 66.205538,35.224945 C 67.116532,35.224945 67.294151,34.430154 67.307209,30.294596 C 67.322744,25.372084 67.327354,25.359532 70.203015,22.392257 C 73.289122,19.207811 76.234595,18.304343 75.598357,20.737322 C 75.367438,21.620415 75.578154,22.054379 76.2379,22.054379 C 77.587159,22.054379 78.613245,20.67816 79.107859,18.205077 C 79.511293,16.18784 79.624481,16.127624 83.012412,16.127624 C 85.840448,16.127624 86.91653,15.786533 88.692218,14.327267 C 89.897121,13.337077 91.031133,12.351873 91.212228,12.137937 C 91.393324,11.924007 92.779473,11.061796 94.292554,10.221922 C 95.91285,9.3225307 97.203315,8.0586173 97.432147,7.1468848 C 97.645826,6.2954933 98.043432,5.6712348 98.315701,5.759662 C 98.587989,5.8480892 99.520571,5.2602737 100.38814,4.4534118 C 102.50306,2.4864865 106.30316,3.3522735 106.3483,5.811317 C 106.35385,6.1135024 104.58888,7.142802 102.42616,8.0986624 C 99.564462,9.3634516 98.281997,10.348281 97.715439,11.716064 C 97.287264,12.749782 96.255693,14.0419 95.423063,14.587465 C 93.166885,16.065768 90.557289,21.788926 90.533147,25.311684 C 90.519378,27.31899 89.976217,29.181262 88.890198,30.944511 C 86.831896,34.286332 86.852428,34.692624 89.072011,34.546266 C 92.405218,34.326489 93.096331,34.557672 93.561548,36.048106 C 93.815937,36.863034 94.876122,38.506675 95.917551,39.700646 C 97.282055,41.265 97.657041,42.184898 97.259757,42.993288 C 96.750629,44.029245 96.716992,44.736708 97.026342,47.901615 C 97.088277,48.535449 97.614928,49.05404 98.196632,49.05404 C 98.778337,49.05404 99.841432,49.800482 100.55906,50.7128 C 101.79087,52.278807 102.10919,52.348275 106.25133,51.955107 C 108.66443,51.726071 111.45632,51.149207 112.4555,50.673223 C 113.69892,50.08087 114.90567,49.989473 116.27977,50.383562 C 117.38395,50.700242 118.64654,50.821497 119.08555,50.653039 C 119.52456,50.484581 121.34854,51.833912 123.13886,53.651562 C 125.50134,56.050126 126.89738,56.95638 128.22969,56.95638 C 129.23933,56.95638 130.0654,56.660042 130.0654,56.297851 C 130.0654,55.935661 131.11576,55.639323 132.39954,55.639323 C 133.68331,55.639323 136.66528,55.154126 139.02611,54.561101 C 142.23322,53.755504 143.50788,53.672246 144.06748,54.231837 C 144.62705,54.791435 144.61663,55.180599 144.0262,55.771029 C 143.59156,56.205651 143.23597,57.145423 143.23597,57.859393 C 143.23597,58.57337 142.83307,59.625362 142.34064,60.197169 C 141.65153,60.997346 141.56193,62.39666 141.95157,66.272303 C 142.46826,71.411715 143.48911,73.766401 146.42644,76.594102 L 148.01387,78.122296 L 145.95421,80.247361 C 143.75087,82.520607 143.2497,84.614569 144.90895,84.614569 C 146.068,84.614569 149.82125,87.224949 149.82125,88.031053 C 149.82125,88.325139 149.39822,88.565739 148.88119,88.565739 C 148.36413,88.565739 147.22219,89.484359 146.34349,90.607124 C 144.90277,92.448066 144.60906,92.563065 143.35255,91.778363 C 142.1352,91.018131 141.79544,91.084037 140.6624,92.3002 C 139.66956,93.36589 138.23693,93.794078 134.55086,94.126866 C 126.85498,94.821672 126.11423,95.0535 126.11423,96.767353 C 126.11423,97.598765 126.29647,99.190244 126.51921,100.30394 C 126.8923,102.16942 127.16048,102.34442 129.92501,102.52647 C 131.78286,102.64883 133.04236,103.0776 133.23179,103.65219 C 133.44995,104.31398 133.20038,104.45082 132.36197,104.1291 C 131.7153,103.88095 129.89684,104.17032 128.32094,104.77216 C 125.49162,105.85271 125.4557,105.90586 125.4557,109.01572 C 125.4557,113.09272 125.88128,114.09406 128.10217,115.24253 C 129.12199,115.76991 130.5641,117.49679 131.36327,119.14768 C 132.77797,122.07009 132.7857,122.26941 131.97565,134.97033 C 131.2054,147.04683 130.78313,149.33646 129.799,146.77186 L 129.799,146.77186 z"},
+    "sa_ecua":{"lang_eng":"Ecuador", "z_order":1, "svg_path":"M 47.044049,167.66667 C 45.86828,166.07639 45.01085,165.69736 41.756087,165.32912 C 39.619531,165.08741 37.871435,164.70542 37.871435,164.48028 C 37.871435,164.25516 38.330798,163.56334 38.892246,162.94295 C 39.779758,161.9623 39.795391,161.52659 39.012098,159.60696 C 38.199889,157.61642 38.230524,157.30084 39.323305,156.40266 C 40.231686,155.65604 40.536486,154.49864 40.539515,151.78446 C 40.547351,144.76354 40.399584,143.80879 39.429724,144.6137 C 38.886451,145.06456 38.688471,146.02249 38.918857,147.08548 C 39.210941,148.43323 39.138213,148.60035 38.593314,147.83329 C 37.97705,146.96577 37.890374,146.97339 37.881517,147.89585 C 37.875965,148.47354 37.33214,149.43427 36.673005,150.03078 C 35.614059,150.98913 35.326664,151.00345 34.203524,150.15379 C 33.504464,149.62495 32.413881,149.18281 31.780048,149.17129 C 30.443005,149.14699 30.430434,149.0962 31.236729,146.97548 C 31.661776,145.85756 31.570866,144.8434 30.935953,143.6196 C 30.435517,142.65499 30.194569,141.42668 30.400517,140.88998 C 30.606452,140.35327 30.412324,139.47721 29.969095,138.94315 C 28.982455,137.75432 29.561591,135.97978 30.936223,135.97978 C 31.510848,135.97978 31.94468,135.40431 31.94468,134.64206 C 31.94468,133.9063 32.397899,133.13041 32.951827,132.91785 C 33.832457,132.57992 33.819102,132.4291 32.845375,131.71709 C 31.820238,130.96747 31.869397,130.72238 33.464254,128.63141 C 35.240667,126.30237 35.809991,123.53449 35.011525,121.10875 C 34.503938,119.56664 36.630754,117.10347 37.829941,117.84461 C 38.214936,118.08255 38.529963,117.95288 38.529963,117.55645 C 38.529963,117.15999 39.830576,116.27814 41.420211,115.59675 C 43.009832,114.91534 44.421664,114.02425 44.557572,113.61652 C 44.726675,113.10921 45.841162,113.27765 48.087968,114.15004 C 49.893804,114.85121 52.625867,115.76328 54.159263,116.17688 C 55.692653,116.59046 57.258864,117.51111 57.639711,118.22273 C 58.232445,119.33023 59.03533,119.51657 63.21522,119.51657 C 67.01205,119.51657 68.229807,119.28156 68.689506,118.46013 C 69.224192,117.50471 69.466478,117.49976 71.223662,118.40843 C 73.806436,119.74403 78.70019,124.53832 78.70019,125.73299 C 78.70019,126.2553 78.403853,126.8658 78.041662,127.08965 C 77.679471,127.31349 77.383134,128.45832 77.383134,129.6337 C 77.383134,134.42184 70.424333,142.5696 62.895511,146.59666 C 59.497254,148.41435 57.340265,150.097 55.980963,151.99068 C 54.096677,154.61573 52.492219,159.91006 52.401335,163.8026 C 52.378076,164.79862 52.091708,165.61355 51.764953,165.61355 C 51.438185,165.61355 50.860932,166.50256 50.482147,167.58914 C 49.620607,170.06055 48.827127,170.07845 47.04403,167.66667 L 47.044049,167.66667 z"},
+    "sa_fren":{"lang_eng":"French Guiana", "z_order":1, "svg_path":"M 270.12704,77.172281 C 269.29005,77.011073 269.15831,76.357355 269.8476,75.785318 C 270.10139,75.574704 270.71419,74.601488 271.20947,73.622596 C 271.94211,72.174518 272.07724,71.552298 271.93431,70.284252 C 271.795,69.048201 271.897,68.538569 272.42728,67.821294 C 272.79507,67.323864 273.13671,66.40337 273.1865,65.775757 C 273.26559,64.779525 273.06141,64.428536 271.57857,63.011301 C 269.85981,61.368559 268.39841,58.455171 268.39841,56.671405 C 268.39841,56.238663 268.22857,55.41491 268.02097,54.840831 C 267.49072,53.374559 267.80817,52.503016 269.6964,50.240366 C 270.60316,49.153794 271.34881,47.943518 271.35342,47.550867 C 271.37561,45.655263 272.17931,45.359104 274.3274,46.45497 C 275.60323,47.105847 277.58491,47.604544 280.01442,47.886117 C 280.69869,47.96542 281.73588,48.419084 282.31927,48.894251 C 284.81028,50.923253 286.83321,52.380583 287.15869,52.380583 C 287.37146,52.380583 287.42609,52.734953 287.29827,53.286059 C 287.09873,54.146456 287.11296,54.159485 287.58394,53.547768 C 288.07039,52.915933 288.10161,52.920787 289.26677,53.80952 C 290.58353,54.813845 291.08059,56.0768 290.45555,56.829926 C 290.01404,57.361892 290.12187,57.428288 290.92607,57.119685 C 291.25938,56.991776 291.4469,56.517622 291.4469,55.802628 C 291.4469,54.368136 291.86352,54.385666 292.73142,55.856677 C 293.61178,57.348751 293.5994,57.815904 292.62682,59.806695 C 292.18919,60.702458 290.42776,64.336092 288.71249,67.88145 C 286.12286,73.234179 285.37217,74.50313 284.28692,75.362691 C 282.89986,76.461248 282.03656,76.467184 280.31171,75.390003 C 279.73349,75.028893 279.46583,75.021069 278.93934,75.349869 C 278.11983,75.861668 277.13194,75.87175 276.33878,75.376401 C 275.83826,75.063824 275.52599,75.138567 274.61923,75.787982 C 272.40769,77.37189 271.92907,77.519374 270.12704,77.172287 L 270.12704,77.172281 z"},
+    "sa_guya":{"lang_eng":"Guyana", "z_order":1, "svg_path":"M 227.76899,88.111071 C 225.70169,87.705918 220.94231,83.396061 220.94231,81.929143 C 220.94231,81.232973 220.31141,80.032503 219.54031,79.261405 C 218.31182,78.032908 218.18893,77.375308 218.54721,73.947464 C 218.77207,71.795881 219.40298,69.397468 219.94919,68.617645 C 221.08197,67.000359 221.26004,64.47429 220.28378,63.870927 C 219.92159,63.64708 219.62525,62.881337 219.62525,62.169277 C 219.62525,61.279295 219.05105,60.759782 217.78827,60.50723 C 216.13145,60.175872 215.97748,59.915556 216.21823,57.853322 C 216.57472,54.799805 215.01345,53.615837 211.29045,54.116404 C 208.78093,54.453827 208.31816,54.265264 205.72935,51.850447 C 203.0751,49.374585 202.97257,49.149441 204.02159,48.100412 C 205.33382,46.788195 205.30924,46.957042 204.49833,44.824194 C 203.9243,43.314419 204.04198,43.099679 205.65076,42.721144 C 208.58562,42.030592 211.72291,39.831008 211.72291,38.463877 C 211.72291,37.697126 211.26747,37.20053 210.56426,37.20053 C 209.92701,37.20053 209.02738,36.594882 208.5651,35.85465 C 207.82742,34.673408 207.93748,34.331032 209.46488,33.055904 C 210.42205,32.25682 212.27243,30.639942 213.57683,29.462822 C 216.05956,27.222358 216.47847,27.029448 217.22971,27.780684 C 217.48163,28.032624 218.14949,28.306526 218.71381,28.389349 C 220.02742,28.582146 224.28026,31.523944 226.20092,33.568391 C 227.58142,35.03787 227.64125,35.444736 227.06547,39.449009 C 226.5565,42.988599 226.601,43.623025 227.31651,43.029204 C 227.79481,42.632256 228.18612,41.810367 228.18612,41.202775 C 228.18612,38.10731 231.44992,38.226998 235.22816,41.461031 C 237.68761,43.566227 238.07768,43.785813 239.35793,43.785813 C 240.8611,43.785813 241.37569,46.345947 240.42636,49.101401 C 239.90686,50.609233 239.63904,52.252611 239.83118,52.753329 C 240.04189,53.302404 239.74756,53.663738 239.08959,53.663738 C 238.48958,53.663738 237.09565,54.130694 235.992,54.701414 C 234.42873,55.509817 234.06764,56.053768 234.35778,57.163243 C 234.56262,57.946536 234.40318,59.678907 234.00348,61.012967 C 233.31501,63.310954 233.41132,63.612935 235.83504,66.754688 C 237.45363,68.852792 238.9082,70.081145 239.7951,70.098893 C 240.74676,70.117937 241.47504,70.814226 242.06304,72.267163 C 242.53941,73.444282 244.10279,76.012411 245.53721,77.974108 C 247.39015,80.508184 247.78215,81.388017 246.89117,81.013012 C 244.82167,80.14197 242.40133,80.569157 241.441,81.97495 C 240.94406,82.702361 240.03762,83.297512 239.42664,83.297512 C 238.81567,83.297512 237.74054,83.732595 237.03748,84.264364 C 236.33444,84.796125 235.14587,85.240632 234.39626,85.252156 C 233.64663,85.263674 232.38918,86.013942 231.60187,86.919418 C 230.81457,87.824894 229.9462,88.525384 229.67216,88.47606 C 229.39814,88.42673 228.5417,88.262486 227.769,88.111058 L 227.76899,88.111071 z"},
+    "sa_para":{"lang_eng":"Paraguay", "z_order":1, "svg_path":"M 260.78327,347.26323 C 259.6967,346.92749 257.53036,346.81036 255.96919,347.00294 L 253.13069,347.35306 L 254.5279,345.3909 C 255.29635,344.31169 256.09619,342.31463 256.30534,340.95297 C 256.51449,339.59131 256.99014,338.09109 257.36236,337.61915 C 257.73457,337.14721 258.70385,335.38186 259.51629,333.69615 C 260.99198,330.63425 260.99216,330.6296 259.693,328.97799 C 258.3199,327.23237 254.76698,325.41004 253.84619,325.97912 C 253.54643,326.16436 253.11506,326.01477 252.88757,325.64667 C 252.66008,325.27858 251.9604,324.9774 251.33274,324.9774 C 250.70507,324.9774 247.57577,323.47754 244.3787,321.64438 C 241.18163,319.81122 238.21386,318.44642 237.78366,318.6115 C 236.61381,319.06043 231.0903,317.51325 229.71618,316.35175 C 229.05572,315.79351 227.03369,314.40322 225.22274,313.26225 C 223.41179,312.12129 221.2572,310.18848 220.43477,308.96716 C 219.61233,307.74581 218.24464,306.37472 217.39543,305.92024 C 215.85957,305.09828 215.85617,305.06897 216.74976,300.3834 C 217.24384,297.79262 217.64846,294.27322 217.64889,292.5625 C 217.6493,290.8518 218.22226,288.18474 218.92208,286.63575 C 219.62192,285.08676 220.34017,283.33539 220.51823,282.74385 C 220.88721,281.51799 233.63509,277.30036 239.13502,276.58451 C 242.0922,276.19963 243.01093,276.39757 246.54346,278.18078 C 249.61686,279.73224 250.57608,280.55632 250.57608,281.64537 C 250.57608,282.43128 251.24284,284.42729 252.05777,286.08096 C 253.24337,288.4868 253.55019,290.27195 253.59313,295.01437 L 253.64681,300.94112 L 256.55649,301.38622 C 261.00391,302.06651 266.25559,302.00568 266.71112,301.26861 C 266.98393,300.8272 267.52827,300.82721 268.35302,301.26861 C 269.03162,301.63177 270.18855,301.92891 270.92399,301.92891 C 272.55394,301.92891 273.15919,303.06813 274.24778,308.18493 C 276.10319,316.90614 277.35999,318.26471 281.61074,316.14415 C 285.26465,314.32136 286.31382,316.54196 284.97365,323.26166 C 284.46039,325.83517 283.84533,330.36693 283.60681,333.33223 C 283.22348,338.09863 282.949,338.95749 281.23907,340.74067 C 280.17528,341.85001 278.94067,342.75767 278.49551,342.75767 C 278.05034,342.75767 277.29761,343.63542 276.82273,344.70824 C 276.12951,346.27433 275.66266,346.58434 274.45413,346.28102 C 273.61421,346.0702 272.47162,346.29956 271.86896,346.79993 C 270.59494,347.85776 263.64714,348.1481 260.78327,347.26322 L 260.78327,347.26323 z"},
+    "sa_peru":{"lang_eng":"Peru", "z_order":1, "svg_path":"M 139.64139,275.28918 C 137.4833,274.04273 135.49585,272.42353 135.22484,271.69094 C 134.95383,270.95833 133.90436,270.1678 132.89265,269.93418 C 131.88096,269.70055 129.50191,268.6545 127.60589,267.60962 C 125.70989,266.56474 123.71408,265.70986 123.17078,265.70986 C 121.57208,265.70986 110.71517,262.42772 110.02246,261.73501 C 109.6733,261.38583 108.7653,261.10016 108.0047,261.10016 C 107.2441,261.10016 106.34027,260.83962 105.99619,260.52118 C 105.6521,260.20275 104.18524,259.57539 102.73647,259.12707 C 101.28771,258.67876 99.065179,257.34164 97.797512,256.15572 C 96.529845,254.96978 94.867133,253.81224 94.102601,253.58336 C 93.338057,253.35449 91.587504,251.95128 90.212444,250.4651 C 88.046709,248.12436 87.726915,247.37782 87.821275,244.88317 C 87.90857,242.57528 87.61295,241.72751 86.332738,240.61438 C 85.454116,239.85046 83.759123,237.79493 82.566055,236.04658 C 81.372972,234.29823 79.770167,232.58223 79.004226,232.23324 C 78.238305,231.88426 77.327956,230.60967 76.981267,229.40083 C 76.539039,227.85891 75.571364,226.7614 73.739016,225.72359 C 72.302482,224.90994 71.356981,224.23936 71.637922,224.2334 C 72.420524,224.21679 70.456496,220.76257 68.824867,219.28596 C 68.027738,218.5646 66.170524,215.89824 64.697699,213.36076 C 63.224874,210.82329 61.179676,207.71654 60.152819,206.4569 C 59.125956,205.19725 58.285813,203.83896 58.285813,203.43846 C 58.285813,202.61675 53.890696,197.74779 52.322944,196.83274 C 51.759771,196.50404 50.667187,195.19794 49.89493,193.93027 C 47.458567,189.93095 43.731421,186.93274 39.350503,185.44806 C 37.085363,184.68042 34.820453,184.05234 34.317364,184.05234 C 32.768308,184.05234 32.43209,181.9982 33.917545,181.60975 C 35.742782,181.13244 35.575739,179.06267 33.548387,177.03532 C 32.619461,176.10642 32.006812,174.96236 32.18692,174.49301 C 32.36702,174.02368 31.941697,173.12136 31.24174,172.48791 C 28.812884,170.28983 30.121887,165.5775 34.477544,160.83922 C 36.481314,158.65943 36.946196,158.59577 37.427238,160.43527 C 37.677808,161.39352 37.334767,162.21875 36.351617,163.02264 C 35.244394,163.928 35.087849,164.38602 35.67976,164.98852 C 36.104188,165.42058 36.295702,166.17994 36.105328,166.67604 C 35.585532,168.03058 37.75772,168.5547 39.048798,167.38629 C 39.880723,166.63343 40.49025,166.54042 41.369122,167.03227 C 42.024747,167.39917 42.949584,167.55028 43.424356,167.3681 C 43.899135,167.1859 44.927184,167.90196 45.708923,168.95931 C 46.72357,170.33171 47.688907,170.88178 49.082754,170.88178 C 50.742878,170.88178 51.224216,170.46266 52.297077,168.08303 C 52.99108,166.54372 53.751345,164.09894 53.986551,162.65017 C 54.545319,159.20838 55.778815,155.73563 56.442519,155.73563 C 56.731962,155.73563 56.968756,155.20889 56.968756,154.5651 C 56.968756,152.43137 58.879041,150.61688 64.043556,147.84502 C 66.852943,146.33719 70.250212,144.03999 71.59305,142.74015 C 75.025853,139.41726 78.70019,133.23233 78.70019,130.77692 C 78.70019,129.33913 79.013762,128.73597 79.76127,128.73597 C 80.629876,128.73597 80.739218,128.28798 80.364081,126.26648 C 80.112036,124.90827 79.424071,123.26032 78.835287,122.60438 C 77.907138,121.57035 77.89265,121.33086 78.726373,120.80351 C 80.091799,119.93984 80.524004,120.0069 83.647575,121.56689 C 85.295727,122.39005 86.815406,123.76325 87.366956,124.92787 C 88.030516,126.32899 89.3356,127.33502 91.891184,128.41534 C 94.463152,129.50258 95.585363,130.37123 95.844007,131.47502 C 96.07893,132.47754 96.771281,133.09716 97.824505,133.24742 C 99.62664,133.50452 100.57412,134.56538 100.11661,135.81383 C 99.627285,137.14907 102.81211,138.82937 104.87791,138.32591 C 105.87327,138.08334 107.43222,137.90007 108.34226,137.91866 C 109.25232,137.93725 110.77996,137.22634 111.73707,136.33885 C 113.1575,135.02177 113.91892,134.79692 115.88059,135.11525 C 117.33815,135.35179 118.92283,135.16332 119.90753,134.63633 C 121.15489,133.96877 121.71118,133.94743 122.30807,134.54432 C 122.73538,134.97164 123.63789,135.32125 124.31364,135.32125 C 124.98939,135.32125 126.11428,135.62737 126.81338,136.00152 C 128.03205,136.65374 127.98776,136.87383 125.73873,141.33982 C 123.08521,146.60898 123.16393,148.19286 126.05056,147.61554 C 127.46714,147.33224 128.25016,147.58818 129.16843,148.6347 C 130.37018,150.00431 130.36838,150.0214 129.07761,149.49088 C 126.96684,148.62336 123.96209,148.91734 123.11619,150.07418 C 122.68673,150.66146 120.25453,151.91023 117.71124,152.84921 C 114.41971,154.06443 112.11302,155.4855 109.70721,157.78015 C 107.84829,159.55319 106.038,161.00385 105.68434,161.00385 C 105.33068,161.00385 105.04132,162.15301 105.04132,163.55755 C 105.04132,164.96208 104.59778,167.17278 104.05568,168.47023 C 103.24934,170.40013 103.21796,171.1539 103.88329,172.61416 C 104.56281,174.10556 104.53644,174.45247 103.72285,174.72367 C 103.1873,174.90218 101.89669,175.90068 100.85481,176.94256 C 99.332818,178.46453 99.037112,179.22 99.350328,180.78608 C 99.569051,181.87979 99.458366,182.73529 99.098105,182.73529 C 97.95814,182.73529 98.416923,185.92585 99.684577,186.81375 C 100.36026,187.28702 100.89757,187.82242 100.87858,188.00351 C 100.7935,188.8148 103.64178,192.45681 106.22202,194.83602 C 108.14777,196.6117 108.91173,197.77513 108.61834,198.48526 C 107.51299,201.16084 107.87671,201.50334 111.82355,201.50334 C 115.64026,201.50334 116.41011,202.02272 117.96511,205.64676 C 118.01049,205.75249 119.91615,205.53808 122.19994,205.17028 C 125.64808,204.61499 126.78206,204.08189 128.88661,202.02686 C 130.90628,200.0547 131.38719,199.81714 131.25471,200.85701 C 131.16327,201.5747 131.33482,204.32983 131.63592,206.97957 C 132.13279,211.35218 132.34379,211.85825 133.91982,212.45746 C 135.22405,212.95335 136.19538,212.86058 137.82214,212.08483 C 141.20022,210.47392 142.0585,210.78922 145.22022,214.80252 C 151.16326,222.34621 151.43448,222.87676 150.33574,224.80956 C 149.17134,226.85786 149.22995,233.71725 150.43676,236.63075 C 151.08823,238.20358 151.07898,238.89516 150.38986,240.13214 C 149.91756,240.97994 149.16456,242.70141 148.71653,243.95766 C 148.02192,245.90532 148.05867,246.41494 148.96608,247.41761 C 149.83478,248.37754 149.89031,248.90054 149.26835,250.26559 C 148.63415,251.65751 148.74135,252.40193 149.90807,254.70798 C 150.67895,256.23165 151.71562,257.71523 152.21178,258.00487 C 152.70793,258.29452 153.11389,258.98963 153.11389,259.54959 C 153.11389,260.80058 151.23019,264.19976 149.60304,265.885 C 148.47595,267.05232 148.46876,267.21332 149.49304,268.34513 C 150.522,269.48211 150.50129,269.60317 149.15471,270.32385 C 147.97364,270.95592 147.79182,271.47238 148.125,273.24843 C 148.93206,277.55037 145.13708,278.46327 139.6414,275.28917 L 139.64139,275.28918 z"},
+    "sa_suri":{"lang_eng":"Suriname", "z_order":1, "svg_path":"M 251.96681,80.566918 C 250.3775,80.278483 249.02564,79.959952 248.96268,79.859053 C 248.89972,79.758166 247.80659,78.193918 246.53348,76.382965 C 245.26039,74.572012 243.69846,71.956752 243.06256,70.571268 C 242.29581,68.900733 241.58947,68.173823 240.96554,68.413245 C 240.4134,68.625126 239.07187,67.761374 237.71841,66.322601 C 235.69347,64.17005 235.46546,63.589716 235.84946,61.566078 C 236.09001,60.298411 236.31628,58.532495 236.35227,57.641822 C 236.40411,56.358956 236.86943,55.93005 238.59136,55.577942 C 241.48373,54.986498 241.55164,54.881838 241.76209,50.693011 C 241.8623,48.698994 242.14995,46.73467 242.40138,46.327858 C 242.93865,45.458502 250.52066,45.991495 252.47193,47.035782 C 253.47546,47.572838 253.69938,47.482041 253.628,46.567002 C 253.55065,45.575706 254.16426,45.44809 258.47842,45.558262 C 261.75584,45.641961 262.97431,45.491375 262.10033,45.110654 C 260.97104,44.618713 261.06493,44.535726 262.75885,44.528574 C 263.84543,44.523997 265.91979,44.737018 267.36855,45.001964 C 270.43057,45.561937 270.56157,46.660408 267.97134,50.056373 C 266.16435,52.425474 266.10298,52.962188 267.10499,57.634414 C 267.55255,59.721349 268.605,61.894947 269.86002,63.324342 C 271.57858,65.281672 271.77099,65.829199 271.11138,66.885393 C 270.6827,67.571849 270.33193,69.141867 270.33193,70.374322 C 270.33193,71.606784 269.81334,73.252453 269.17951,74.031387 C 268.14313,75.304994 267.80194,75.368818 265.7913,74.665135 C 264.05343,74.056891 263.06018,74.061765 261.33122,74.686965 C 260.10784,75.129338 258.29874,75.43826 257.31098,75.373448 C 254.38188,75.181263 253.97851,75.328905 253.52448,76.759419 C 253.24764,77.631693 253.50724,78.583069 254.24435,79.397569 C 255.73967,81.049856 255.44937,81.198894 251.96683,80.566905 L 251.96681,80.566918 z"},
+    "sa_urug":{"lang_eng":"Uruguay", "z_order":1, "svg_path":"M 274.2831,415.25347 C 270.12524,413.0505 267.91838,412.30313 266.04705,412.46441 C 264.30354,412.61462 263.41645,412.18756 261.50846,410.27961 C 259.48842,408.25957 259.13695,407.46907 259.13695,404.94599 C 259.13695,402.89197 259.44648,401.8651 260.14662,401.59644 C 260.97988,401.27669 261.09655,400.27347 260.81442,395.85498 C 260.59967,392.49156 260.84541,388.34992 261.47541,384.71534 C 262.02699,381.53325 262.29011,378.62528 262.06015,378.25319 C 261.42105,377.21905 263.75539,375.02556 265.49503,375.02556 C 266.34438,375.02556 267.03929,374.72922 267.03929,374.36703 C 267.03929,374.00484 267.49041,373.7085 268.04179,373.7085 C 269.50149,373.7085 274.94163,378.93612 274.94163,380.33879 C 274.94163,382.10065 276.1117,382.51715 277.85408,381.37549 C 279.28443,380.43827 279.49344,380.47651 280.85357,381.92431 C 281.65763,382.78023 283.24936,383.84797 284.39072,384.29706 C 285.53202,384.74616 286.91038,385.63447 287.45367,386.27112 C 287.99695,386.90779 289.47864,387.99386 290.74631,388.68466 C 292.01398,389.37544 293.44614,390.75104 293.92898,391.74151 C 294.41174,392.73199 295.51267,393.86401 296.37547,394.25712 L 297.94415,394.97188 L 296.56065,396.91479 C 295.37813,398.57554 295.23365,399.46211 295.56588,403.01981 C 295.86459,406.21853 295.73288,407.36595 294.99678,407.97686 C 294.46996,408.41406 294.03895,409.11414 294.03895,409.53257 C 294.03895,410.41362 291.69867,412.56167 290.7388,412.56167 C 290.38076,412.56167 290.08778,412.80315 290.08778,413.09824 C 290.08778,413.39333 289.12468,414.08175 287.94756,414.62813 C 286.31152,415.38742 285.19926,415.47204 283.22605,414.98749 C 281.4473,414.55062 279.99959,414.58684 278.56959,415.10392 C 276.19709,415.96185 275.65566,415.98075 274.2831,415.25347 z"},
+    "sa_vene":{"lang_eng":"Venezuela", "z_order":1, "svg_path":"M 157.55896,97.985703 C 156.20074,97.05301 155.08948,96.042426 155.08948,95.73997 C 155.08948,95.437508 154.34863,93.570403 153.44315,91.590827 C 152.53768,89.611271 151.79683,87.704206 151.79683,87.352934 C 151.79683,87.001655 150.47438,85.838312 148.85805,84.767696 L 145.91924,82.8211 L 147.87026,80.635866 C 148.9433,79.433966 149.82125,78.263893 149.82125,78.035693 C 149.82125,77.807487 148.93207,76.711314 147.8453,75.599738 C 146.75853,74.488162 145.40945,72.478004 144.84736,71.132716 C 143.73023,68.459045 143.10152,60.907549 143.99605,60.907549 C 144.30237,60.907549 144.55302,60.077804 144.55302,59.06367 C 144.55302,58.04953 144.87445,56.898363 145.2673,56.505512 C 146.26062,55.512194 145.76734,52.952429 144.41987,52.107892 C 143.5877,51.586325 142.46123,51.706566 140.04717,52.574651 C 138.25871,53.217763 135.12432,53.916435 133.08185,54.127237 C 131.03938,54.338045 129.21929,54.751554 129.03721,55.046154 C 128.47223,55.960323 126.56534,54.910925 123.48012,51.988014 C 121.05065,49.686365 119.90418,49.10011 117.11688,48.734127 C 115.24694,48.488608 113.17259,48.56775 112.50718,48.91002 C 111.84175,49.252283 109.18316,49.71993 106.59917,49.94923 C 102.27355,50.333073 101.87374,50.261893 101.55723,49.051557 C 101.34455,48.238334 100.65872,47.736983 99.758872,47.736983 C 98.383035,47.736983 98.328358,47.544324 98.748927,44.178191 C 99.167883,40.824958 99.07771,40.500876 97.187695,38.567418 C 96.084469,37.438825 95.015736,35.854656 94.812745,35.047031 C 94.434888,33.543716 91.478392,31.690077 90.461197,32.318735 C 89.632867,32.830655 89.768767,32.088092 90.807286,30.427448 C 91.30896,29.625268 91.917539,27.370164 92.159699,25.41612 C 92.667471,21.318803 94.599632,17.134211 96.438006,16.150343 C 97.136672,15.776437 97.896521,14.877507 98.126552,14.152737 C 98.356602,13.427967 98.749236,12.834982 98.999108,12.834982 C 99.550185,12.834982 103.06574,18.556033 103.06574,19.45281 C 103.06574,19.803378 102.17672,21.317446 101.09015,22.817416 C 98.691964,26.128022 98.664056,26.64417 100.76089,28.906695 C 101.66637,29.883727 102.40721,31.121642 102.40721,31.657638 C 102.40721,33.090754 104.13921,33.510039 106.32289,32.60553 C 110.56967,30.846463 110.39785,26.023849 105.92616,21.470686 C 103.45657,18.956108 103.90129,17.090939 107.5108,14.824291 C 109.23121,13.743936 111.11605,12.854376 111.69934,12.847494 C 112.28262,12.840606 113.85878,12.089239 115.20189,11.177783 C 116.54502,10.266314 117.91988,9.6911353 118.25717,9.8995859 C 118.59444,10.10805 119.24084,10.047188 119.69358,9.7643571 C 121.88633,8.3945128 127.57932,8.5242692 130.62528,10.013524 C 132.36675,10.864975 133.11947,11.713417 133.35804,13.093824 C 133.90184,16.240318 135.20454,16.565078 141.72313,15.179152 C 152.57242,12.872479 153.06042,12.848311 154.87263,14.527815 C 157.22251,16.705621 163.86806,17.356128 167.3581,15.749984 C 168.75965,15.104982 170.4365,14.037073 171.08444,13.376852 C 171.7941,12.653762 173.23424,12.168124 174.70635,12.155513 C 176.99798,12.135869 177.07056,12.074349 175.87188,11.16772 C 174.6601,10.251187 174.70073,10.200869 176.65217,10.200869 C 177.7844,10.200869 179.39681,9.9442209 180.23531,9.6305376 C 182.93237,8.6215668 189.33295,8.0628846 189.33295,8.8364248 C 189.33295,9.22468 188.46817,9.5423409 187.41122,9.5423409 C 184.77856,9.5423409 183.40619,10.154752 183.40619,11.329574 C 183.40619,11.914557 183.78936,12.17033 184.34584,11.956789 C 184.86265,11.758466 185.63687,12.019599 186.06632,12.537071 C 186.86951,13.504837 186.79496,13.571895 184.09715,14.308565 C 183.52509,14.464761 183.41194,14.736391 183.81511,14.985565 C 184.18542,15.21443 185.27722,14.992453 186.24132,14.492274 C 187.89616,13.633738 188.05758,13.690128 189.1269,15.500356 C 189.91748,16.838729 190.41495,17.173288 190.77398,16.608106 C 191.1543,16.009431 191.30187,16.055844 191.34019,16.786152 C 191.36868,17.329438 191.69081,17.0331 192.05601,16.127624 L 192.72,14.481303 L 193.97826,16.021634 C 195.14334,17.447888 195.31631,17.482151 196.31417,16.48429 C 197.28802,15.510438 197.50029,15.504788 198.51784,16.425654 C 199.13716,16.986114 200.37617,17.444681 201.27124,17.444681 C 203.62146,17.444681 204.74595,18.750674 203.30376,19.805235 C 202.68252,20.259487 202.16292,20.877292 202.14908,21.178134 C 201.99925,24.434129 200.87499,25.628535 198.05845,25.523934 C 196.53409,25.46732 197.21924,26.529639 199.13861,27.198736 C 200.47302,27.663921 201.26038,27.643803 201.77273,27.131454 C 202.17466,26.729528 202.50351,26.644387 202.50351,26.942266 C 202.50351,27.240144 202.87394,27.189866 203.32667,26.83052 C 204.17114,26.160257 212.38144,25.035181 212.38144,25.589728 C 212.38144,25.75918 212.5497,26.336308 212.75535,26.872231 C 213.16808,27.947786 210.87895,30.427685 208.67834,31.288987 C 207.90931,31.589987 207.0939,32.578142 206.86632,33.484903 C 206.33289,35.610303 207.43959,38.517587 208.7821,38.517587 C 210.68983,38.517587 209.11678,39.7195 205.74207,40.840401 L 202.41083,41.946866 L 202.82526,44.399805 C 203.12961,46.201275 202.96702,47.079041 202.21307,47.704768 C 200.50657,49.121032 201.01045,50.123108 205.10022,53.446628 C 207.25281,55.19589 209.03082,56.89702 209.05139,57.226903 C 209.10336,58.059941 205.05533,61.592946 204.46613,61.228799 C 204.20222,61.065688 203.26037,61.604964 202.37316,62.427196 C 200.71737,63.961725 196.5217,65.517248 194.0384,65.517248 C 192.10396,65.517248 189.99148,67.484252 189.99148,69.285505 C 189.99148,71.119987 189.66994,71.146144 187.55637,69.48361 C 186.2274,68.438236 185.25878,68.253288 182.64013,68.544878 C 180.84649,68.744603 179.02564,68.629024 178.59382,68.288045 C 178.16202,67.947072 176.25293,67.470271 174.35143,67.228513 C 171.74246,66.896792 170.89929,66.996487 170.9151,67.634785 C 170.94438,68.817317 172.17906,70.250861 174.68069,72.006919 C 176.2271,73.09245 176.82091,74.020317 176.82091,75.351209 C 176.82091,76.364276 177.44195,77.982662 178.20099,78.94763 C 178.96005,79.912604 179.41558,81.133397 179.21331,81.66051 C 178.69544,83.010091 180.9286,84.023513 183.35229,83.538777 C 186.35965,82.937291 185.85924,84.265944 182.45834,85.912291 C 180.22209,86.994833 179.48681,87.742611 179.33033,89.093418 C 179.19724,90.242181 178.66546,90.946786 177.8087,91.109581 C 177.08432,91.24722 175.67832,92.044204 174.68425,92.88066 C 173.69019,93.717116 172.28257,94.590101 171.55624,94.820632 C 170.82992,95.051163 170.23563,95.63261 170.23563,96.112737 C 170.23563,97.247473 168.75912,97.792346 166.9595,97.321735 C 166.06218,97.087069 164.82549,97.470714 163.63001,98.354571 C 161.24255,100.11972 160.61056,100.0813 157.55896,97.985716 L 157.55896,97.985703 z"},
+}
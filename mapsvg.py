@@ -0,0 +1,94 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Svg documents and colours for the maps
+
+The continent picker is an svg document.  The quiz map is drawn straight
+from the outlines by cairorender (or idmap/polyrender), with the state
+colours defined here; reference_document() produces the equivalent svg,
+which the checks and benchmarks render with rsvg to compare against.
+"""
+
+from hittest import matrix_scale
+
+SVG_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n\
+<svg xmlns:svg="http://www.w3.org/2000/svg" xmlns="http://www.w3.org/2000/svg" version="1.0" width="1200" height="1230">\n'
+SVG_FOOTER = '</svg>'
+
+COUNTRY_GROUP_STYLE = "color:black;fill:#fff;fill-opacity:1;fill-rule:nonzero;stroke:black;stroke-width:1;stroke-linecap:round;stroke-linejoin:miter;marker:none;marker-start:none;marker-mid:none;marker-end:none;stroke-miterlimit:4;stroke-dasharray:none;stroke-dashoffset:0;stroke-opacity:1;visibility:visible;display:inline;overflow:visible"
+
+# fill colours for each country state
+STATE_COLORS = {
+    "correct": (50, 170, 50),
+    "current": (55, 250, 250),
+    "other": (80, 80, 80),
+}
+
+STATE_STYLES = dict([(state, 'style="fill:rgb(%d,%d,%d);fill-opacity:1" ' % color)
+                     for state, color in STATE_COLORS.items()])
+
+def svg_wrap(svg_internals):
+    """Wrap svg elements in a 1200x1230 svg document"""
+    return SVG_HEADER + svg_internals + SVG_FOOTER
+
+def continent_group(continent_data, screen_matrix=None):
+    """Return the opening and closing tags that place a continent's countries
+
+    screen_matrix -- the matrix the path data was already transformed
+        with, if it is in screen pixels; the group then only sets the
+        country style, with the stroke scaled to match
+    """
+    if screen_matrix is not None:
+        style = COUNTRY_GROUP_STYLE.replace("stroke-width:1;",
+            "stroke-width:%.2f;" % matrix_scale(screen_matrix))
+        return '<g style="%s">' % style, '</g>\n'
+    opening = '<g transform="translate(%s,%s)">\n<g transform="scale(%s)">\n<g style="%s">' % (
+        continent_data["svg_translate_x"], continent_data["svg_translate_y"],
+        continent_data["svg_scale"], COUNTRY_GROUP_STYLE)
+    closing = '</g>\n</g>\n</g>\n'
+    return opening, closing
+
+def country_state(country):
+    """Return "correct", "current" or "other" for a country's state record"""
+    if country["is_correct"]:
+        return "correct"
+    elif country["is_current"]:
+        return "current"
+    return "other"
+
+def render_order(continent):
+    """The continent's country keys in drawing order, lowest z_order first"""
+    return sorted(continent.keys, key=lambda k: (continent.countries[k]["z_order"], k))
+
+def reference_document(continent, path_data, screen_matrix=None):
+    """Return the svg document of a continent's map in its current state
+
+    path_data -- callable returning the svg path data for a country key
+    screen_matrix -- set when path_data returns screen pixel coordinates,
+        as from a transform.ScreenGeometry, to the matrix they were
+        transformed with
+    """
+    opening, closing = continent_group(continent.data, screen_matrix)
+    parts = [SVG_HEADER, opening]
+    for key in render_order(continent):
+        parts.append('<path %sd="%s" />\n' % (
+            STATE_STYLES[country_state(continent.countries[key])], path_data(key)))
+    parts.append(closing)
+    parts.append(SVG_FOOTER)
+    return ''.join(parts)
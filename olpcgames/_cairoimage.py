@@ -30,23 +30,57 @@ def _fixColorBase( v ):
     """Return a properly clamped colour in floating-point space"""
     return max((0,min((v,255.0))))/255.0
 
+# pygame masks for cairo's ARGB32 pixels, which are native-endian
+# 32-bit words of the form 0xAARRGGBB
+ARGB_MASKS = (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000L)
+
+def _swapWord( value ):
+    """Byte-swap a 32-bit value"""
+    return struct.unpack( '<I', struct.pack( '>I', value ) )[0]
+
+def argbMasks( data_big_endian=big_endian ):
+    """Pygame masks for reading ARGB32 words stored in the given byte order
+    
+    data_big_endian -- whether the words are stored most significant byte 
+        first; cairo always stores them in the machine's own order
+    """
+    if data_big_endian == big_endian:
+        return ARGB_MASKS
+    return tuple([_swapWord( mask ) for mask in ARGB_MASKS])
+
+def fromARGB32( data, stride, width, height, data_big_endian=big_endian ):
+    """Copy ARGB32 words into a new Pygame image
+    
+    The image is given masks matching the data, so the pixels are copied 
+    once, straight into the image, with no byte-swapping or intermediate 
+    strings.
+    """
+    image = pygame.Surface( (width,height), pygame.SRCALPHA, 32, argbMasks( data_big_endian ) )
+    pitch = image.get_pitch()
+    buffer = image.get_buffer()
+    try:
+        if pitch == stride:
+            buffer.write( data, 0 )
+        else:
+            rowsize = width * 4
+            for row in xrange( height ):
+                start = row * stride
+                buffer.write( data[start:start+rowsize], row * pitch )
+    finally:
+        del buffer # unlocks the image
+    return image
+
 def asImage( csrf ):
     """Get the pixels in csrf as a Pygame image"""
-    # Create and return a new Pygame Image derived from the Cairo Surface
-    format = 'ARGB'
-    if hasattr(csrf,'get_data'):
-        # more recent API, native-format, but have to (potentially) convert the format...
-        data = csrf.get_data()
-        if not big_endian:
-            import numpy
-            data = numpy.frombuffer( data, 'I' ).astype( '>I4' ).tostring()
-        else:
-            data = str(data) # there's one copy
-    else:
-        # older api, not native, but we know what it is...
-        data = csrf.get_data_as_rgba()
-        data = str(data) # there's one copy
     width, height = csrf.get_width(),csrf.get_height()
+    if hasattr(csrf,'get_data'):
+        # more recent API, native-format words, copied once into an image 
+        # whose masks match them
+        return fromARGB32( csrf.get_data(), csrf.get_stride(), width, height )
+    # older api, not native, but we know what it is...
+    format = 'ARGB'
+    data = csrf.get_data_as_rgba()
+    data = str(data) # there's one copy
     try:
         return pygame.image.fromstring(
             data, 
@@ -56,3 +90,74 @@ def asImage( csrf ):
     except ValueError, err:
         err.args += (len(data), (width,height), width*height*4,format )
         raise
+
+def _copyingAsImage( csrf ):
+    """The previous conversion: byte-swap, stringify, then fromstring"""
+    data = csrf.get_data()
+    if not big_endian:
+        import numpy
+        data = numpy.frombuffer( data, 'I' ).astype( '>I4' ).tostring()
+    else:
+        data = str(data)
+    return pygame.image.fromstring( data, (csrf.get_width(),csrf.get_height()), 'ARGB' )
+
+# (r,g,b,a) test pixels, opaque so that premultiplication does not apply
+_TEST_COLORS = [(255,0,0,255), (0,255,0,255), (0,0,255,255), (18,52,86,255)]
+
+def check():
+    """Check the conversion for data stored in either byte order
+    
+    Each test pixel is packed as an ARGB32 word both little- and 
+    big-endian and read back through argbMasks; a pixel drawn with 
+    cairo is then read back through asImage.
+    """
+    width, height = len(_TEST_COLORS), 1
+    for data_big_endian, order in ((False,'<'), (True,'>')):
+        data = ''.join([
+            struct.pack( order + 'I', (a << 24) | (r << 16) | (g << 8) | b )
+            for (r,g,b,a) in _TEST_COLORS
+        ])
+        image = fromARGB32( data, width * 4, width, height, data_big_endian )
+        for x, color in enumerate(_TEST_COLORS):
+            found = tuple(image.get_at( (x,0) ))
+            assert found == color, (order, x, found, color)
+
+    csrf, ctx = newContext( width, height )
+    for x, color in enumerate(_TEST_COLORS):
+        ctx.set_source_rgba( *mangle_color( color ) )
+        ctx.rectangle( x, 0, 1, 1 )
+        ctx.fill()
+    image = asImage( csrf )
+    for x, color in enumerate(_TEST_COLORS):
+        found = tuple(image.get_at( (x,0) ))
+        assert found == color, ('cairo', x, found, color)
+    print "conversion correct for both byte orders (this machine is %s-endian)" % (
+        big_endian and 'big' or 'little'
+    )
+
+def benchmark( width=1200, height=900, repeat=20 ):
+    """Time converting a full-screen surface with the old and new paths"""
+    import time
+    csrf, ctx = newContext( width, height )
+    ctx.set_source_rgb( 0.3, 0.6, 0.9 )
+    ctx.paint()
+    paths = [('fromARGB32', asImage)]
+    try:
+        import numpy
+    except ImportError:
+        print "numpy is not available, not timing the old conversion"
+    else:
+        paths.append( ('byteswap+fromstring', _copyingAsImage) )
+    for name, convert in paths:
+        best = None
+        for i in range( repeat ):
+            start = time.time()
+            convert( csrf )
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        print "%dx%d %-20s %.2f ms" % (width, height, name, best * 1000)
+
+if __name__ == "__main__":
+    check()
+    benchmark()
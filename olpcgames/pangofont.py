@@ -14,6 +14,7 @@ import pangocairo
 import pygame.rect, pygame.image
 import gtk
 import struct
+import threading
 from pygame import surface
 from olpcgames import _cairoimage
 
@@ -31,12 +32,127 @@ def install():
     sys.modules["pygame.font"] = pangofont
     print "loading..."
 
+# size() results remembered per font before they are dropped
+MAX_MEMOIZED_SIZES = 2048
+
+# render_wrapped justification values to Pango alignments
+ALIGNMENTS = (pango.ALIGN_LEFT, pango.ALIGN_CENTER, pango.ALIGN_RIGHT)
+
+class TextCache( object ):
+    """LRU cache of rendered text images, bounded by their total pixel bytes
+
+    Images are keyed by the font description, text, colours and underline
+    setting.  Cached images are shared between every caller rendering the
+    same text, so they must not be drawn on.  A lock guards the cache, so
+    fonts may render from more than one thread.
+
+    hits, misses -- lookups that were/were not found
+    """
+    def __init__( self, max_bytes=4*1024*1024 ):
+        """Initialise the cache
+
+        max_bytes -- total pixel bytes of the images to keep
+        """
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = self.misses = 0
+        self._images = {}
+        # doubly linked list of [previous, next, key] nodes, least recently
+        # used first, so a hit moves its key to the end in constant time
+        self._links = {}
+        self._root = []
+        self._root[:] = [self._root, self._root, None]
+        self._lock = threading.Lock()
+
+    def _unlink( self, node ):
+        previous, next = node[0], node[1]
+        previous[1] = next
+        next[0] = previous
+
+    def _append( self, node ):
+        last = self._root[0]
+        node[0], node[1] = last, self._root
+        last[1] = self._root[0] = node
+
+    def get( self, key ):
+        """Return the cached image for key, or None"""
+        self._lock.acquire()
+        try:
+            image = self._images.get( key )
+            if image is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            node = self._links[key]
+            self._unlink( node )
+            self._append( node )
+            return image
+        finally:
+            self._lock.release()
+
+    def put( self, key, image ):
+        """Store an image, evicting the least recently used ones to fit"""
+        size = image.get_pitch() * image.get_height()
+        if size > self.max_bytes:
+            return
+        self._lock.acquire()
+        try:
+            if key in self._images:
+                return
+            while self._root[1] is not self._root and self.bytes + size > self.max_bytes:
+                oldest = self._root[1]
+                self._unlink( oldest )
+                del self._links[oldest[2]]
+                old = self._images.pop( oldest[2] )
+                self.bytes -= old.get_pitch() * old.get_height()
+            self._images[key] = image
+            node = self._links[key] = [None, None, key]
+            self._append( node )
+            self.bytes += size
+        finally:
+            self._lock.release()
+
+    def hit_rate( self ):
+        """Return the fraction of lookups that were found"""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / float(lookups)
+
+    def stats( self ):
+        """Return a dictionary of the counters, for tuning the budget"""
+        return {
+            'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate(),
+            'images': len(self._images), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+        }
+
+    def clear( self ):
+        """Drop every cached image"""
+        self._lock.acquire()
+        try:
+            self._images.clear()
+            self._links.clear()
+            self._root[:] = [self._root, self._root, None]
+            self.bytes = 0
+        finally:
+            self._lock.release()
+
+_default_cache = None
+def defaultCache( ):
+    """Return the TextCache shared by fonts that do not bring their own"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TextCache()
+    return _default_cache
+
 class PangoFont(object):
     """Base class for a pygame.font.Font-like object drawn by Pango
     
     Attributes of note:
     
         fd -- instances Pango FontDescription object 
+        cache -- TextCache holding rendered text, None to always render;
+            defaults to the shared defaultCache()
         WEIGHT_* -- parameters for use with set_weight
         STYLE_* -- parameters for use with set_style
         
@@ -65,6 +181,12 @@ class PangoFont(object):
             if size is not None:
                 fd.set_size(size*1000)
         self.fd = fd
+        self.cache = defaultCache()
+        # one layout is reused for every render and size call
+        self._layout = None
+        self._layout_key = None
+        self._layout_lock = threading.RLock()
+        self._sizes = {}
         self.set_bold( bold )
         self.set_italic( italic )
         self.set_underline( underline )
@@ -80,24 +202,117 @@ class PangoFont(object):
         background -- three or four-tuple of 0-255 values specifying rendering 
             colour for the background, or None for trasparent background
         
-        returns a pygame image instance
+        returns a pygame image instance, shared with other callers when
+        the font has a cache, so it must not be drawn on
         """
         log.info( 'render: %r, antialias = %s, color=%s, background=%s', text, antialias, color, background )
 
-        # create layout
-        layout = pango.Layout(gtk.gdk.pango_context_get())
-        layout.set_font_description(self.fd)
-        if self.underline:
-            attrs = layout.get_attributes()
-            if not attrs:
-                attrs = pango.AttrList()
-            attrs.insert(pango.AttrUnderline(pango.UNDERLINE_SINGLE, 0, 32767))
+        if self.cache is None:
+            return self._render( text, color, background )
+        if background is not None:
+            background = tuple(background)
+        key = (self.fd.to_string(), text, tuple(color), background, self.underline)
+        image = self.cache.get( key )
+        if image is None:
+            image = self._render( text, color, background )
+            self.cache.put( key, image )
+        return image
+
+    def size( self, text ):
+        """Return the (width, height) text will take up when rendered"""
+        self._layout_lock.acquire()
+        try:
+            layout = self._getLayout()
+            try:
+                return self._sizes[text]
+            except KeyError:
+                pass
+            if len(self._sizes) >= MAX_MEMOIZED_SIZES:
+                self._sizes.clear()
+            layout.set_text(text)
+            size = self._sizes[text] = layout.get_pixel_size()
+            return size
+        finally:
+            self._layout_lock.release()
+
+    def _getLayout( self ):
+        """Return our layout, brought up to date with the font settings
+
+        The font description can be changed in place (set_bold and so
+        on), so it is compared on each call; memoized sizes are dropped
+        when it changed.  Callers hold _layout_lock.
+        """
+        key = (self.fd.to_string(), self.underline)
+        if self._layout is None:
+            self._layout = pango.Layout(gtk.gdk.pango_context_get())
+        if key != self._layout_key:
+            self._layout_key = key
+            self._sizes.clear()
+            layout = self._layout
+            layout.set_font_description(self.fd)
+            attrs = pango.AttrList()
+            if self.underline:
+                attrs.insert(pango.AttrUnderline(pango.UNDERLINE_SINGLE, 0, 32767))
             layout.set_attributes( attrs )
-        layout.set_text(text)
+        return self._layout
+
+    def _render( self, text, color, background ):
+        """Draw text with Pango into a new pygame image"""
+        self._layout_lock.acquire()
+        try:
+            layout = self._getLayout()
+            layout.set_text(text)
+            return self._drawLayout( layout, color, background )
+        finally:
+            self._layout_lock.release()
+
+    def render_wrapped( self, text, width, color=(255,255,255), background=None, justification=0 ):
+        """Render a paragraph word-wrapped to width pixels in one pass
+
+        Pango does the wrapping itself; newlines in text start new lines.
 
+        justification -- 0 left-justified, 1 centered, 2 right-justified
+
+        returns a pygame image width pixels wide, shared with other
+        callers when the font has a cache, so it must not be drawn on
+        """
+        if background is not None:
+            background = tuple(background)
+        key = (self.fd.to_string(), text, tuple(color), background, self.underline,
+               width, justification)
+        if self.cache is not None:
+            image = self.cache.get( key )
+            if image is not None:
+                return image
+        self._layout_lock.acquire()
+        try:
+            layout = self._getLayout()
+            layout.set_text(text)
+            layout.set_width(width * pango.SCALE)
+            layout.set_wrap(pango.WRAP_WORD)
+            layout.set_alignment(ALIGNMENTS[justification])
+            try:
+                image = self._drawLayout( layout, color, background, width )
+            finally:
+                layout.set_width(-1)
+                layout.set_alignment(pango.ALIGN_LEFT)
+        finally:
+            self._layout_lock.release()
+        if self.cache is not None:
+            self.cache.put( key, image )
+        return image
+
+    def _drawLayout( self, layout, color, background, width=None ):
+        """Draw a layout into a new pygame image
+
+        The image is sized to the layout's ink extents, or when width is
+        given, to that width and the layout's logical height.
+        """
         # determine pixel size
         (logical, ink) = layout.get_pixel_extents()
         ink = pygame.rect.Rect(ink)
+        if width is not None:
+            ink = pygame.rect.Rect(0, 0, width, logical[1] + logical[3])
 
         # Create a new Cairo ImageSurface
         csrf,cctx = _cairoimage.newContext( ink.w, ink.h )
@@ -119,10 +334,10 @@ class PangoFont(object):
         color = _cairoimage.mangle_color( color )
         log.debug( '  translated color: %s', color )
 
-        cctx.new_path()
-        cctx.layout_path(layout)
+        # show_layout draws from the glyph cache, which is much cheaper
+        # than turning every glyph into a path and filling it
         cctx.set_source_rgba(*color)
-        cctx.fill()
+        cctx.show_layout(layout)
 
         # Create and return a new Pygame Image derived from the Cairo Surface
         return _cairoimage.asImage( csrf )
@@ -278,3 +493,55 @@ def stdcolor(color):
 def _fixColorBase( v ):
     """Return a properly clamped colour in floating-point space"""
     return max((0,min((v,255.0))))/255.0
+
+def benchmark( count=10000 ):
+    """Time rendering and measuring count strings, before and after reuse
+
+    "before" builds a new layout per call and fills glyph paths, as
+    render() used to; "after" goes through a PangoFont with its text
+    cache turned off, so only the layout reuse and show_layout count.
+    """
+    import time
+    font = PangoFont( size=12 )
+    font.cache = None
+    texts = ['Country %d' % (i % 500) for i in range( count )]
+
+    start = time.time()
+    for text in texts:
+        layout = pango.Layout(gtk.gdk.pango_context_get())
+        layout.set_font_description(font.fd)
+        layout.set_text(text)
+        layout.get_pixel_size()
+    measure_before = time.time() - start
+
+    start = time.time()
+    for text in texts:
+        font.size( text )
+    measure_after = time.time() - start
+
+    start = time.time()
+    for text in texts:
+        layout = pango.Layout(gtk.gdk.pango_context_get())
+        layout.set_font_description(font.fd)
+        layout.set_text(text)
+        ink = pygame.rect.Rect(layout.get_pixel_extents()[1])
+        csrf,cctx = _cairoimage.newContext( ink.w, ink.h )
+        cctx = pangocairo.CairoContext(cctx)
+        cctx.new_path()
+        cctx.layout_path(layout)
+        cctx.set_source_rgba(*_cairoimage.mangle_color( (255,255,255) ))
+        cctx.fill()
+        _cairoimage.asImage( csrf )
+    render_before = time.time() - start
+
+    start = time.time()
+    for text in texts:
+        font.render( text )
+    render_after = time.time() - start
+
+    print "%d strings: measure %.0f -> %.0f ms, render %.0f -> %.0f ms" % (
+        count, measure_before * 1000, measure_after * 1000,
+        render_before * 1000, render_after * 1000)
+
+if __name__ == "__main__":
+    benchmark()
@@ -66,6 +66,7 @@ def pauseScreen( overlaySVG=None ):
     old_screen = screen.copy()  # save this for later.
     pause_sprite = svgsprite.SVGSprite(
         overlaySVG,
+        cache = svgsprite.defaultCache(),
     )
     pause_sprite.rect.center = screen.get_rect().center
     group = sprite.RenderUpdates( )
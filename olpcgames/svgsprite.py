@@ -2,13 +2,146 @@
 from pygame import sprite
 from olpcgames import _cairoimage
 import cairo, rsvg
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5
+
+class RenderCache( object ):
+    """LRU cache of rendered SVG images, bounded by their total pixel bytes
+
+    Images are keyed by a hash of the SVG source plus the requested size.
+    Parsed rsvg.Handle objects are kept for the most recent sources, so
+    rendering the same SVG at a new size does not parse it again.
+
+    Cached images are shared between every sprite showing them, so they
+    must not be drawn on.
+
+    hits, misses -- image lookups that were/were not found
+    handle_hits, handle_misses -- parses that were saved/performed
+    """
+    def __init__( self, max_bytes=16*1024*1024, max_handles=4 ):
+        """Initialise the cache
+
+        max_bytes -- total pixel bytes of the images to keep
+        max_handles -- number of parsed SVG handles to keep
+        """
+        self.max_bytes = max_bytes
+        self.max_handles = max_handles
+        self.bytes = 0
+        self.hits = self.misses = 0
+        self.handle_hits = self.handle_misses = 0
+        # each cache has a doubly linked list of [previous, next, key]
+        # nodes, least recently used first, so a hit moves its key to the
+        # end in constant time
+        self._images = {}
+        self._image_links = {}
+        self._image_root = []
+        self._image_root[:] = [self._image_root, self._image_root, None]
+        self._handles = {}
+        self._handle_links = {}
+        self._handle_root = []
+        self._handle_root[:] = [self._handle_root, self._handle_root, None]
+
+    def _unlink( self, node ):
+        previous, next = node[0], node[1]
+        previous[1] = next
+        next[0] = previous
+
+    def _append( self, root, node ):
+        last = root[0]
+        node[0], node[1] = last, root
+        last[1] = root[0] = node
+
+    def key( self, svg, size ):
+        """Return the cache key for svg source rendered at size"""
+        return md5( svg ).hexdigest(), tuple(size)
+
+    def get( self, key ):
+        """Return the cached image for key, or None"""
+        image = self._images.get( key )
+        if image is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        node = self._image_links[key]
+        self._unlink( node )
+        self._append( self._image_root, node )
+        return image
+
+    def put( self, key, image ):
+        """Store an image, evicting the least recently used ones to fit"""
+        if image is None or key in self._images:
+            return
+        size = image.get_pitch() * image.get_height()
+        if size > self.max_bytes:
+            return
+        root = self._image_root
+        while root[1] is not root and self.bytes + size > self.max_bytes:
+            oldest = root[1]
+            self._unlink( oldest )
+            del self._image_links[oldest[2]]
+            old_image = self._images.pop( oldest[2] )
+            self.bytes -= old_image.get_pitch() * old_image.get_height()
+        self._images[key] = image
+        node = self._image_links[key] = [None, None, key]
+        self._append( root, node )
+        self.bytes += size
+
+    def handle( self, key, svg ):
+        """Return a parsed rsvg.Handle for the svg source of key"""
+        digest = key[0]
+        root = self._handle_root
+        handle = self._handles.get( digest )
+        if handle is not None:
+            self.handle_hits += 1
+            node = self._handle_links[digest]
+            self._unlink( node )
+        else:
+            self.handle_misses += 1
+            while root[1] is not root and len(self._handles) >= self.max_handles:
+                oldest = root[1]
+                self._unlink( oldest )
+                del self._handle_links[oldest[2]]
+                del self._handles[oldest[2]]
+            handle = self._handles[digest] = rsvg.Handle( data = svg )
+            node = self._handle_links[digest] = [None, None, digest]
+        self._append( root, node )
+        return handle
+
+    def stats( self ):
+        """Return a dictionary of the counters, for tuning the budget"""
+        return {
+            'hits': self.hits, 'misses': self.misses,
+            'handle_hits': self.handle_hits, 'handle_misses': self.handle_misses,
+            'images': len(self._images), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+        }
+
+    def clear( self ):
+        """Drop every cached image and handle"""
+        self._images.clear()
+        self._image_links.clear()
+        self._image_root[:] = [self._image_root, self._image_root, None]
+        self._handles.clear()
+        self._handle_links.clear()
+        self._handle_root[:] = [self._handle_root, self._handle_root, None]
+        self.bytes = 0
+
+_default_cache = None
+def defaultCache( ):
+    """Return the RenderCache shared by sprites that do not bring their own"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RenderCache()
+    return _default_cache
 
 class SVGSprite( sprite.Sprite ):
     """Sprite class which renders SVG source-code as a Pygame image"""
     rect = image = None
     resolution = None
+    cache = None
     def __init__( 
-        self, svg=None, size=None, *args
+        self, svg=None, size=None, *args, **named
     ):
         """Initialise the svg sprite
         
@@ -17,8 +150,11 @@ class SVGSprite( sprite.Sprite ):
             as None or 0 causes proportional scaling, leaving both 
             as None or 0 causes natural scaling (screen resolution)
         args -- if present, groups to which to automatically add
+        cache -- optional RenderCache (named argument only); when given,
+            setting the same svg at the same size reuses the earlier image
         """
         self.size = size
+        self.cache = named.get( 'cache' )
         super( SVGSprite, self ).__init__( *args )
         if svg:
             self.setSVG( svg )
@@ -31,15 +167,23 @@ class SVGSprite( sprite.Sprite ):
             width,height = self.size
         else:
             width,height = None,None
-        self.image = self._render( width,height )
+        if self.cache is not None:
+            key = self.cache.key( svg, (width,height) )
+            self.image = self.cache.get( key )
+            if self.image is None:
+                self.image = self._render( width,height, self.cache.handle( key, svg ) )
+                self.cache.put( key, self.image )
+        else:
+            self.image = self._render( width,height )
         rect = self.image.get_rect()
         if self.rect:
             rect.move( self.rect[0], self.rect[1] ) # should let something higher-level do that...
         self.rect = rect
 
-    def _render( self, width, height ):
+    def _render( self, width, height, handle=None ):
         """Render our SVG to a Pygame image"""
-        handle = rsvg.Handle( data = self.svg )
+        if handle is None:
+            handle = rsvg.Handle( data = self.svg )
         originalSize = (width,height)
         scale = 1.0
         hw,hh = handle.get_dimension_data()[:2]
@@ -0,0 +1,226 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Map drawing with pygame's own polygon functions
+
+The PolygonMap draws the countries with pygame.draw.polygon, straight
+from the screen-space outlines the continent already keeps flattened at
+the level of detail the map is shown at, so neither rsvg nor cairo is
+involved.  One pixel outlines are antialiased with pygame.gfxdraw where
+that module is available.  Changed countries are repainted by clipping
+to their bounding box and drawing everything overlapping it again, like
+the MapCompositor does.  draw_tile() draws zoomed map tiles the same way,
+for a tiles.TilePyramid.
+
+Nothing here imports cairo or rsvg (the benchmark aside); the continent
+picker and olpcgames still use them.
+"""
+
+import math
+
+import pygame
+try:
+    import pygame.gfxdraw as gfxdraw
+except ImportError:
+    gfxdraw = None
+
+from hittest import matrix_scale
+from mapsvg import STATE_COLORS, country_state, render_order
+
+BORDER_COLOR = (0, 0, 0)
+# pixels outside every country, drawn transparent
+BACKGROUND = (255, 0, 255)
+
+class PolygonMap(object):
+    """The map of one continent drawn with pygame.draw
+
+    continent -- the continents.Continent to draw
+    screen -- the continent's transform.ScreenGeometry
+    size -- (width, height) of the map in pixels
+    """
+    def __init__(self, continent, screen, size=(1200, 1230)):
+        self.continent = continent
+        self.screen = screen
+        self.size = size
+        self.order = render_order(continent)
+        self.image = None
+        self.stroke_width = max(1, int(round(matrix_scale(screen.matrix))))
+        self.padding = self.stroke_width
+        self._fills = {}
+        self._points = {}
+
+    def points(self, key):
+        """Return a country's rings as lists of (x, y) integer points"""
+        try:
+            return self._points[key]
+        except KeyError:
+            polygons = []
+            for ring in self.screen.rings(key):
+                points = [(int(round(ring[i])), int(round(ring[i + 1])))
+                          for i in range(0, len(ring) - 1, 2)]
+                if len(points) >= 3:
+                    polygons.append(points)
+            self._points[key] = polygons
+            return polygons
+
+    def _refresh(self, key):
+        """Update a country's fill, returning whether it changed"""
+        if key not in self.continent.countries:
+            return False
+        fill = STATE_COLORS[country_state(self.continent.countries[key])]
+        if self._fills.get(key) != fill:
+            self._fills[key] = fill
+            return True
+        return False
+
+    def render(self, keys):
+        """Bring the image up to date after keys may have changed state
+
+        returns the rectangles of the image that were redrawn
+        """
+        if self.image is None:
+            for key in self.order:
+                self._refresh(key)
+            self.image = pygame.Surface(self.size)
+            self.image.set_colorkey(BACKGROUND)
+            self._draw(self.order, self.image.get_rect())
+            return [self.image.get_rect()]
+
+        rects = []
+        for key in keys:
+            if self._refresh(key):
+                rect = self.country_rect(key)
+                if rect.width and rect.height:
+                    self._draw(self._overlapping(rect), rect)
+                    rects.append(rect)
+        return rects
+
+    def prepare(self, fills):
+        """Nothing worth doing ahead of time; repainting is quick enough"""
+        return None
+
+    def apply(self, prepared):
+        """Counterpart of MapCompositor.apply; render() does the repainting"""
+        return []
+
+    def country_rect(self, key):
+        """The part of the image a country's fill and outline can touch"""
+        min_x, min_y, max_x, max_y = self.screen.bbox(key)
+        left = int(math.floor(min_x)) - self.padding
+        top = int(math.floor(min_y)) - self.padding
+        rect = pygame.Rect(left, top,
+            int(math.ceil(max_x)) + self.padding - left + 1, int(math.ceil(max_y)) + self.padding - top + 1)
+        return rect.clip(pygame.Rect((0, 0), self.size))
+
+    def _overlapping(self, rect):
+        """The keys of the countries that can draw into rect, in drawing order"""
+        keys = []
+        for key in self.order:
+            min_x, min_y, max_x, max_y = self.screen.bbox(key)
+            if (max_x + self.padding >= rect.left and min_x - self.padding <= rect.right and
+                    max_y + self.padding >= rect.top and min_y - self.padding <= rect.bottom):
+                keys.append(key)
+        return keys
+
+    def _draw(self, keys, rect):
+        """Clear rect and draw the countries in keys into it"""
+        image = self.image
+        image.set_clip(rect)
+        image.fill(BACKGROUND)
+        for key in keys:
+            fill = self._fills[key]
+            for points in self.points(key):
+                pygame.draw.polygon(image, fill, points)
+                if self.stroke_width == 1 and gfxdraw is not None:
+                    gfxdraw.aapolygon(image, points, BORDER_COLOR)
+                else:
+                    pygame.draw.lines(image, BORDER_COLOR, True, points, self.stroke_width)
+        image.set_clip(None)
+
+def draw_tile(geometry, keys, fills, rect, zoom, stroke_width):
+    """Draw the countries in keys into the zoomed map pixels in rect
+
+    A rasterizer for tiles.TilePyramid; outlines keep the width they have
+    on the unzoomed map.
+    """
+    image = pygame.Surface(rect.size)
+    image.fill(BORDER_COLOR)
+    width = max(1, int(round(stroke_width)))
+    left, top = rect.left, rect.top
+    outlines = []
+    for key in keys:
+        for ring in geometry.rings(key):
+            points = [(int(round(ring[i] * zoom - left)), int(round(ring[i + 1] * zoom - top)))
+                      for i in range(0, len(ring) - 1, 2)]
+            if len(points) >= 3:
+                pygame.draw.polygon(image, fills[key], points)
+                outlines.append(points)
+    for points in outlines:
+        if width == 1 and gfxdraw is not None:
+            gfxdraw.aapolygon(image, points, BORDER_COLOR)
+        else:
+            pygame.draw.lines(image, BORDER_COLOR, True, points, width)
+    return image
+
+def benchmark(repeat=20):
+    """Compare drawing with pygame.draw against a full rsvg render"""
+    import time
+    import rsvg
+    from olpcgames import _cairoimage
+    import mapbundle
+    import mapsvg
+    import simplify
+    import transform
+    from continents import ContinentRegistry
+
+    pygame.init()
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        lod = simplify.LevelsOfDetail(continent)
+        level = lod.choose_level(simplify.effective_scale(continent.data))
+        matrix = transform.screen_matrix(continent.data)
+        screen = transform.ScreenGeometry(continent.keys, lambda k: lod.rings(k, level), matrix)
+        document = mapsvg.reference_document(continent, screen.svg_path, matrix)
+
+        start = time.time()
+        for i in range(repeat):
+            surface, context = _cairoimage.newContext(1200, 1230)
+            rsvg.Handle(data=document).render_cairo(context)
+            _cairoimage.asImage(surface)
+        svg = (time.time() - start) / repeat
+
+        start = time.time()
+        for i in range(repeat):
+            polygon_map = PolygonMap(continent, screen)
+            polygon_map.render(continent.keys)
+        polygons = (time.time() - start) / repeat
+
+        country = continent.keys[0]
+        start = time.time()
+        for i in range(repeat):
+            continent.countries[country]["is_current"] = i % 2
+            polygon_map.render([country])
+        repaint = (time.time() - start) / repeat
+
+        print "%s: rsvg %.1f ms, pygame.draw %.1f ms, repaint one country %.2f ms" % (
+            key, svg * 1000, polygons * 1000, repaint * 1000)
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,87 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Background preparation of the next question
+
+While the player is reading a question, the game picks the next country
+and its pick list and has the map repaints for it rendered on a worker
+thread.  When the question is answered the result is taken over, so the
+next question appears without the pygame thread having to render it.
+"""
+
+import sys
+import threading
+
+class Prefetcher(object):
+    """Runs one job at a time on a worker thread and hands over its result
+
+    Each job is submitted with a tag, such as the map renderer it drew
+    with; a result is only handed over to a taker asking with the same
+    tag, so work done for another continent is thrown away.
+    """
+    def __init__(self):
+        self._thread = None
+        self._tag = None
+        self._result = None
+        self._error = None
+        self.hits = 0
+        self.misses = 0
+
+    def submit(self, tag, job):
+        """Start running job, a callable taking no arguments, in the background"""
+        self.discard()
+        self._tag = tag
+
+        def run():
+            try:
+                self._result = job()
+            except:
+                self._error = sys.exc_info()
+
+        self._thread = threading.Thread(target=run, name="prefetch")
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def take(self, tag):
+        """Return the result of the job submitted under tag, or None
+
+        Waits for the job if it is still running.  An exception raised by
+        the job is raised again here.
+        """
+        if self._thread is None:
+            self.misses += 1
+            return None
+        self._thread.join()
+        self._thread = None
+        result, error = self._result, self._error
+        self._result = self._error = None
+        if error is not None:
+            raise error[0], error[1], error[2]
+        if self._tag is not tag:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def discard(self):
+        """Wait for any running job and drop its result"""
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self._result = self._error = None
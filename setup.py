@@ -1,5 +1,11 @@
 #!/usr/bin/env python
 
+# Compile the map data into the binary map bundle that the game mmaps at
+# startup.  Do this first so the bundle ends up in the MANIFEST.
+import mapbundle
+from mapdata import continents_data, countries_data
+mapbundle.compile_bundle(mapbundle.BUNDLE_FILENAME, continents_data, countries_data)
+
 # Make the MANIFEST file.  The contents of the activity folder and the NEWS and MANIFEST
 # files are already included in the .xo file which the bundlebuilder creates, so don't
 # add them to the manifest file.
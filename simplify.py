@@ -0,0 +1,266 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Level-of-detail simplification of country outlines
+
+Outlines are flattened once and run through Douglas-Peucker, recording
+for every vertex the largest tolerance at which it survives.  Each level
+of detail is then just the vertices whose importance is above that
+level's tolerance, so all levels come out of a single pass.
+
+Simplification works on the arcs of the continent's topology, so a border
+shared by two countries is simplified once for both of them, and the end
+points where borders meet are never dropped.
+"""
+
+from array import array
+
+from topology import continent_topology, open_ring
+
+# tolerances of the precomputed levels, in map (svg path) units
+LEVEL_TOLERANCES = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+# the largest simplification error we accept on screen, in pixels
+MAX_PIXEL_ERROR = 0.5
+
+PINNED = float('inf')
+
+def _segment_distance(px, py, ax, ay, bx, by):
+    """Distance from point p to the segment a-b"""
+    dx = bx - ax
+    dy = by - ay
+    length = dx * dx + dy * dy
+    if length == 0:
+        t = 0.0
+    else:
+        t = ((px - ax) * dx + (py - ay) * dy) / length
+        t = max(0.0, min(1.0, t))
+    ex = ax + t * dx - px
+    ey = ay + t * dy - py
+    return (ex * ex + ey * ey) ** 0.5
+
+def _rank(ring, importance, first, last):
+    """Douglas-Peucker importance for the vertices strictly between first and last"""
+    stack = [(first, last, PINNED)]
+    while stack:
+        first, last, ceiling = stack.pop()
+        if last - first < 2:
+            continue
+        ax, ay = ring[first * 2], ring[first * 2 + 1]
+        bx, by = ring[last * 2], ring[last * 2 + 1]
+        best = -1.0
+        best_index = first + 1
+        for i in range(first + 1, last):
+            d = _segment_distance(ring[i * 2], ring[i * 2 + 1], ax, ay, bx, by)
+            if d > best:
+                best = d
+                best_index = i
+        # never outrank the split that made this run, so levels nest
+        value = min(best, ceiling)
+        importance[best_index] = value
+        stack.append((first, best_index, value))
+        stack.append((best_index, last, value))
+
+def rank_ring(ring, pinned=()):
+    """Compute the importance of each vertex of a closed ring
+
+    ring -- flat array of x,y values, not repeating the first point
+    pinned -- indices of vertices that must always be kept
+
+    returns array('f') of per-vertex importance
+    """
+    n = len(ring) // 2
+    importance = array('f', [0.0]) * n
+    anchors = sorted(set(pinned))
+    if len(anchors) < 2:
+        # anchor on the first vertex and the vertex farthest from it
+        x0, y0 = ring[0], ring[1]
+        far = max(range(n), key=lambda i: (ring[i * 2] - x0) ** 2 + (ring[i * 2 + 1] - y0) ** 2)
+        anchors = sorted(set(anchors + [0, far]))
+    for i in anchors:
+        importance[i] = PINNED
+    for j in range(len(anchors)):
+        first = anchors[j]
+        last = anchors[(j + 1) % len(anchors)]
+        if last <= first:
+            last += n
+        if last - first < 2:
+            continue
+        if last < n:
+            _rank(ring, importance, first, last)
+        else:
+            # the run wraps around the end of the ring; rank a rotated copy
+            indices = range(first, last + 1)
+            run = array('f')
+            for i in indices:
+                i %= n
+                run.extend((ring[i * 2], ring[i * 2 + 1]))
+            run_importance = array('f', [0.0]) * len(indices)
+            _rank(run, run_importance, 0, len(indices) - 1)
+            for k in range(1, len(indices) - 1):
+                importance[indices[k] % n] = run_importance[k]
+    # keep at least a triangle
+    if len([v for v in importance if v == PINNED]) < 3 and n >= 3:
+        best = max([i for i in range(n) if importance[i] != PINNED], key=lambda i: importance[i])
+        importance[best] = PINNED
+    return importance
+
+def rank_arc(arc):
+    """Compute the importance of each vertex of a topology arc
+
+    Arc end points are where borders meet, so they are always kept.
+    """
+    n = len(arc) // 2
+    if n > 3 and arc[0] == arc[-2] and arc[1] == arc[-1]:
+        # a closed arc is a whole ring of its own
+        importance = rank_ring(open_ring(arc))
+        importance.append(PINNED)
+        return importance
+    importance = array('f', [0.0]) * n
+    importance[0] = importance[n - 1] = PINNED
+    _rank(arc, importance, 0, n - 1)
+    return importance
+
+class LevelsOfDetail(object):
+    """Precomputed simplified outlines for one continents.Continent
+
+    tolerances -- level tolerances in map units, finest first
+    """
+    def __init__(self, continent, tolerances=LEVEL_TOLERANCES):
+        self.tolerances = tuple(tolerances)
+        self.keys = list(continent.keys)
+        topology = continent.derived("topology", continent_topology)
+
+        # simplify each shared border once, so both sides match exactly
+        level_arcs = [[] for t in self.tolerances]
+        for arc in topology.arcs:
+            importance = rank_arc(arc)
+            for level, tolerance in enumerate(self.tolerances):
+                simplified = array('f')
+                for i, value in enumerate(importance):
+                    if value > tolerance:
+                        simplified.extend((arc[i * 2], arc[i * 2 + 1]))
+                level_arcs[level].append(simplified)
+
+        self._level_arcs = level_arcs
+        # which countries use each arc, for stroking every border once
+        self.arc_owners = topology.arc_owners()
+        self._levels = {}
+        self._svg_paths = {}
+        for key in self.keys:
+            levels = []
+            for arcs in level_arcs:
+                rings = []
+                for ring in topology.objects[key]:
+                    coords = topology.ring_coords(ring, arcs)
+                    if len(coords) < 6:
+                        # the ring collapsed; fall back to the finest level
+                        coords = topology.ring_coords(ring, level_arcs[0])
+                    rings.append(coords)
+                levels.append(rings)
+            self._levels[key] = levels
+
+    def rings(self, key, level):
+        """Return the simplified rings of a country at a level"""
+        return self._levels[key][level]
+
+    def arcs(self, level):
+        """Return the simplified topology arcs at a level"""
+        return self._level_arcs[level]
+
+    def svg_path(self, key, level):
+        """Return svg path data for a country at a level"""
+        try:
+            return self._svg_paths[key, level]
+        except KeyError:
+            parts = []
+            for ring in self._levels[key][level]:
+                points = ['%.2f,%.2f' % (ring[i], ring[i + 1]) for i in range(0, len(ring), 2)]
+                parts.append('M ' + points[0] + ' L ' + ' '.join(points[1:]) + ' z')
+            path = self._svg_paths[key, level] = ' '.join(parts)
+            return path
+
+    def vertex_count(self, level):
+        """Total number of vertices in all countries at a level"""
+        return sum([len(ring) // 2 for key in self.keys for ring in self._levels[key][level]])
+
+    def choose_level(self, scale):
+        """Return the coarsest level that stays within MAX_PIXEL_ERROR
+
+        scale -- screen pixels per map unit
+        """
+        chosen = 0
+        for level, tolerance in enumerate(self.tolerances):
+            if tolerance * scale <= MAX_PIXEL_ERROR:
+                chosen = level
+        return chosen
+
+def effective_scale(continent_data, map_scale=1.0):
+    """Screen pixels per map unit for a continent
+
+    map_scale -- how much the rendered map document is scaled to fit the
+        screen; 1.0 when it is drawn at its natural 1200x1230 size
+    """
+    return continent_data["svg_scale"] * map_scale
+
+def benchmark(repeat=3):
+    """Report vertex counts and render times per level for each continent"""
+    import time
+    import mapbundle
+    from continents import ContinentRegistry
+
+    try:
+        import cairo, rsvg
+    except ImportError:
+        rsvg = None
+        print "rsvg is not available, only reporting vertex counts"
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        start = time.time()
+        lod = LevelsOfDetail(continent)
+        built = time.time() - start
+        original = sum([continent.geometry[k].num_vertices() for k in continent.keys])
+        level = lod.choose_level(effective_scale(continent.data))
+        print "%s: levels built in %.0f ms, %d path vertices, game uses level %d" % (
+            key, built * 1000, original, level)
+        for i, tolerance in enumerate(lod.tolerances):
+            line = "  level %d (tolerance %.2f): %6d vertices" % (i, tolerance, lod.vertex_count(i))
+            if rsvg is not None:
+                svg = ('<svg xmlns="http://www.w3.org/2000/svg" width="1200" height="1230">'
+                       '<g transform="translate(%s,%s) scale(%s)">' % (
+                       continent.data["svg_translate_x"], continent.data["svg_translate_y"],
+                       continent.data["svg_scale"]) +
+                       ''.join(['<path style="fill:rgb(80,80,80);stroke:black" d="%s"/>' %
+                                lod.svg_path(k, i) for k in continent.keys]) +
+                       '</g></svg>')
+                best = None
+                for r in range(repeat):
+                    start = time.time()
+                    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 1200, 1230)
+                    rsvg.Handle(data=svg).render_cairo(cairo.Context(surface))
+                    elapsed = time.time() - start
+                    if best is None or elapsed < best:
+                        best = elapsed
+                line += ", rsvg render %.1f ms" % (best * 1000)
+            print line
+
+if __name__ == '__main__':
+    benchmark()
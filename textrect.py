@@ -6,6 +6,94 @@ class TextRectException:
     def __str__(self):
         return self.message
 
+# word widths and line heights are remembered per font, and whole wrapped
+# layouts per (text, font, rect size, justification); each cache is simply
+# emptied when it grows past MAX_CACHED entries
+MAX_CACHED = 1024
+_widths = {}
+_line_heights = {}
+_layouts = {}
+
+def _text_width(font, text):
+    widths = _widths.get(font)
+    if widths is None:
+        widths = _widths[font] = {}
+    try:
+        return widths[text]
+    except KeyError:
+        if len(widths) >= MAX_CACHED:
+            widths.clear()
+        width = widths[text] = font.size(text)[0]
+        return width
+
+def _line_height(font):
+    try:
+        return _line_heights[font]
+    except KeyError:
+        height = _line_heights[font] = font.size("")[1]
+        return height
+
+def wrap_lines(string, font, width):
+    """Split string into lines no wider than width pixels
+
+    Each word is measured once (and remembered), and lines are built by
+    adding up word widths, so wrapping is linear in the length of the text.
+    """
+    final_lines = []
+    space = _text_width(font, " ")
+    for requested_line in string.splitlines():
+        if _text_width(font, requested_line) <= width:
+            final_lines.append(requested_line)
+            continue
+        words = requested_line.split(' ')
+        # if any of our words are too long to fit, return.
+        for word in words:
+            if _text_width(font, word) >= width:
+                raise TextRectException, "The word " + word + " is too long to fit in the rect passed."
+        accumulated_line = []
+        # width of the line so far, each word followed by a space
+        accumulated_width = 0
+        for word in words:
+            word_width = _text_width(font, word) + space
+            if accumulated_line and accumulated_width + word_width >= width:
+                final_lines.append(" ".join(accumulated_line))
+                accumulated_line = []
+                accumulated_width = 0
+            accumulated_line.append(word)
+            accumulated_width += word_width
+        final_lines.append(" ".join(accumulated_line))
+    return final_lines
+
+def _layout(string, font, rect, justification):
+    """Return the wrapped lines of string with the position of each"""
+    key = (string, font, rect.width, rect.height, justification)
+    try:
+        return _layouts[key]
+    except KeyError:
+        pass
+    if justification not in (0, 1, 2):
+        raise TextRectException, "Invalid justification argument: " + str(justification)
+
+    layout = []
+    accumulated_height = 0
+    height = _line_height(font)
+    for line in wrap_lines(string, font, rect.width):
+        if accumulated_height + height >= rect.height:
+            raise TextRectException, "Once word-wrapped, the text string was too tall to fit in the rect."
+        if line != "":
+            x = 0
+            if justification == 1:
+                x = (rect.width - _text_width(font, line)) / 2
+            elif justification == 2:
+                x = rect.width - _text_width(font, line)
+            layout.append((line, (x, accumulated_height)))
+        accumulated_height += height
+
+    if len(_layouts) >= MAX_CACHED:
+        _layouts.clear()
+    _layouts[key] = layout
+    return layout
+
 def render_textrect(string, font, rect, text_color, background_color, justification=0):
     """Returns a surface containing the passed text string, reformatted
     to fit within the given rect, word-wrapping as necessary. The text
@@ -14,7 +102,8 @@ def render_textrect(string, font, rect, text_color, background_color, justificat
     Takes the following arguments:
 
     string - the text you wish to render. \n begins a new line.
-    font - a Font object
+    font - a Font object; an olpcgames PangoFont wraps the text itself
+           and renders the whole paragraph at once
     rect - a rectstyle giving the size of the surface requested.
     text_color - a three-byte tuple of the rgb value of the
                  text color. ex (0, 0, 0) = BLACK
@@ -30,55 +119,21 @@ def render_textrect(string, font, rect, text_color, background_color, justificat
     """
 
     import pygame
-    
-    final_lines = []
-
-    requested_lines = string.splitlines()
-
-    # Create a series of lines that will fit on the provided
-    # rectangle.
-
-    for requested_line in requested_lines:
-        if font.size(requested_line)[0] > rect.width:
-            words = requested_line.split(' ')
-            # if any of our words are too long to fit, return.
-            for word in words:
-                if font.size(word)[0] >= rect.width:
-                    raise TextRectException, "The word " + word + " is too long to fit in the rect passed."
-            # Start a new line
-            accumulated_line = ""
-            for word in words:
-                test_line = accumulated_line + word + " "
-                # Build the line while the words fit.    
-                if font.size(test_line)[0] < rect.width:
-                    accumulated_line = test_line
-                else:
-                    final_lines.append(accumulated_line)
-                    accumulated_line = word + " "
-            final_lines.append(accumulated_line)
-        else:
-            final_lines.append(requested_line)
-
-    # Let's try to write the text out on the surface.
 
     surface = pygame.Surface(rect.size)
     surface.fill(background_color)
 
-    accumulated_height = 0
-    for line in final_lines:
-        if accumulated_height + font.size(line)[1] >= rect.height:
+    if hasattr(font, 'render_wrapped'):
+        if justification not in (0, 1, 2):
+            raise TextRectException, "Invalid justification argument: " + str(justification)
+        tempsurface = font.render_wrapped(string, rect.width, text_color, None, justification)
+        if tempsurface.get_height() >= rect.height:
             raise TextRectException, "Once word-wrapped, the text string was too tall to fit in the rect."
-        if line != "":
-            tempsurface = font.render(line, 1, text_color)
-            if justification == 0:
-                surface.blit(tempsurface, (0, accumulated_height))
-            elif justification == 1:
-                surface.blit(tempsurface, ((rect.width - tempsurface.get_width()) / 2, accumulated_height))
-            elif justification == 2:
-                surface.blit(tempsurface, (rect.width - tempsurface.get_width(), accumulated_height))
-            else:
-                raise TextRectException, "Invalid justification argument: " + str(justification)
-        accumulated_height += font.size(line)[1]
+        surface.blit(tempsurface, (0, 0))
+        return surface
+
+    for line, position in _layout(string, font, rect, justification):
+        surface.blit(font.render(line, 1, text_color), position)
 
     return surface
 
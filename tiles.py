@@ -0,0 +1,381 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tiled, zoomable map
+
+Countries like Gambia, Swaziland or Rwanda are a few pixels across on the
+quiz map.  A TilePyramid renders the map in TILE_SIZE square tiles at
+each of ZOOM_LEVELS, on demand and straight from the country outlines,
+and keeps the most recently used tiles in a TileCache.  A MapView pans
+and zooms over the pyramid, rendering at most a couple of missing tiles
+per frame and showing an enlarged lower-zoom tile until the real one is
+ready, so zooming never stalls a frame.  magnify() builds an inset of a
+small country from the same tiles, with the same budget per frame.
+
+Tile coordinates are in base map pixels (the map as drawn at zoom 1)
+multiplied by the zoom.
+
+Tiles are drawn with cairo_tile() unless the pyramid is given another
+rasterizer, such as polyrender.draw_tile; cairo is only imported when a
+cairo tile is drawn.
+"""
+
+import math
+
+import pygame
+
+from mapsvg import STATE_COLORS, country_state, render_order
+
+TILE_SIZE = 256
+ZOOM_LEVELS = (1, 2, 4, 8)
+
+# each tile is TILE_SIZE * TILE_SIZE * 4 bytes, 256 kB
+MAX_TILES = 64
+
+# how many missing tiles a MapView renders per frame
+TILES_PER_FRAME = 2
+
+BACKGROUND_COLOR = (0, 0, 0)
+
+class TileCache(object):
+    """Least recently used cache of rendered tiles
+
+    hits, misses -- lookups that were/were not found
+    """
+    def __init__(self, max_tiles=MAX_TILES):
+        self.max_tiles = max_tiles
+        self.hits = self.misses = 0
+        self._tiles = {}
+        # doubly linked list of [previous, next, key] nodes, least recently
+        # used first, so a hit moves its key to the end in constant time
+        self._links = {}
+        self._root = []
+        self._root[:] = [self._root, self._root, None]
+
+    def _unlink(self, node):
+        previous, next = node[0], node[1]
+        previous[1] = next
+        next[0] = previous
+
+    def _append(self, node):
+        last = self._root[0]
+        node[0], node[1] = last, self._root
+        last[1] = self._root[0] = node
+
+    def get(self, key):
+        tile = self._tiles.get(key)
+        if tile is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        node = self._links[key]
+        self._unlink(node)
+        self._append(node)
+        return tile
+
+    def peek(self, key):
+        """Return a cached tile without counting or reordering it"""
+        return self._tiles.get(key)
+
+    def put(self, key, tile):
+        node = self._links.get(key)
+        if node is None:
+            node = self._links[key] = [None, None, key]
+        else:
+            self._unlink(node)
+        self._tiles[key] = tile
+        self._append(node)
+        while len(self._tiles) > self.max_tiles:
+            oldest = self._root[1]
+            self._unlink(oldest)
+            del self._links[oldest[2]]
+            del self._tiles[oldest[2]]
+
+    def discard(self, key):
+        if key in self._tiles:
+            del self._tiles[key]
+            self._unlink(self._links.pop(key))
+
+    def __len__(self):
+        return len(self._tiles)
+
+class TilePyramid(object):
+    """A continent's map as tiles at several zoom levels
+
+    continent -- the continents.Continent to draw
+    geometry_for -- callable taking a zoom level and returning the
+        transform.ScreenGeometry to draw it with, in base map pixels
+    size -- (width, height) of the map at zoom 1
+    stroke_width -- outline width in pixels
+    rasterize -- callable (geometry, keys, fills, rect, zoom, stroke_width)
+        returning the image of the zoomed map pixels in rect; defaults to
+        cairo_tile
+    """
+    def __init__(self, continent, geometry_for, size, stroke_width=1.0, cache=None, rasterize=None):
+        self.continent = continent
+        self.geometry_for = geometry_for
+        self.size = size
+        self.stroke_width = stroke_width
+        if rasterize is None:
+            rasterize = cairo_tile
+        self.rasterize = rasterize
+        if cache is None:
+            cache = TileCache()
+        self.cache = cache
+        self.order = render_order(continent)
+        # the whole map at zoom 1, if the caller has one, for placeholders
+        self.base_image = None
+        # antialiasing and half the stroke reach past a country's outline
+        self.padding = int(math.ceil(stroke_width / 2.0)) + 1
+
+    def tile_range(self, zoom, rect):
+        """The (tx, ty) of the tiles covering rect, given in zoomed pixels"""
+        columns = int(math.ceil(self.size[0] * zoom / float(TILE_SIZE)))
+        rows = int(math.ceil(self.size[1] * zoom / float(TILE_SIZE)))
+        left = max(0, rect.left // TILE_SIZE)
+        top = max(0, rect.top // TILE_SIZE)
+        right = min(columns - 1, (rect.right - 1) // TILE_SIZE)
+        bottom = min(rows - 1, (rect.bottom - 1) // TILE_SIZE)
+        return [(tx, ty) for ty in range(top, bottom + 1) for tx in range(left, right + 1)]
+
+    def tile(self, zoom, tx, ty, render=True):
+        """Return a tile, rendering it if it is missing and render is true"""
+        key = (zoom, tx, ty)
+        tile = self.cache.get(key)
+        if tile is None and render:
+            tile = self.render_tile(zoom, tx, ty)
+            self.cache.put(key, tile)
+        return tile
+
+    def render_tile(self, zoom, tx, ty):
+        """Rasterize one tile from the country outlines"""
+        geometry = self.geometry_for(zoom)
+        left = tx * TILE_SIZE / float(zoom)
+        top = ty * TILE_SIZE / float(zoom)
+        right = left + TILE_SIZE / float(zoom)
+        bottom = top + TILE_SIZE / float(zoom)
+        keys = []
+        fills = {}
+        countries = self.continent.countries
+        for key in self.order:
+            min_x, min_y, max_x, max_y = geometry.bbox(key)
+            if (max_x + self.padding >= left and min_x - self.padding <= right and
+                    max_y + self.padding >= top and min_y - self.padding <= bottom):
+                keys.append(key)
+                fills[key] = STATE_COLORS[country_state(countries[key])]
+
+        rect = pygame.Rect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        return self.rasterize(geometry, keys, fills, rect, zoom, self.stroke_width)
+
+    def placeholder(self, zoom, tx, ty):
+        """An enlarged piece of a lower-zoom tile standing in for a missing one"""
+        for lower in reversed([z for z in ZOOM_LEVELS if z < zoom]):
+            factor = zoom // lower
+            parent = self.cache.peek((lower, tx // factor, ty // factor))
+            if parent is not None:
+                piece = TILE_SIZE // factor
+                area = pygame.Rect((tx % factor) * piece, (ty % factor) * piece, piece, piece)
+                return pygame.transform.scale(parent.subsurface(area), (TILE_SIZE, TILE_SIZE))
+        if self.base_image is not None:
+            piece = TILE_SIZE // zoom
+            area = pygame.Rect(tx * piece, ty * piece, piece, piece)
+            if self.base_image.get_rect().contains(area):
+                return pygame.transform.scale(self.base_image.subsurface(area), (TILE_SIZE, TILE_SIZE))
+        return None
+
+    def invalidate(self, keys):
+        """Drop the tiles showing countries whose state changed"""
+        base = self.geometry_for(ZOOM_LEVELS[0])
+        for key in keys:
+            if key not in self.continent.countries:
+                continue
+            min_x, min_y, max_x, max_y = base.bbox(key)
+            for zoom in ZOOM_LEVELS:
+                rect = pygame.Rect(int((min_x - self.padding) * zoom), int((min_y - self.padding) * zoom),
+                    int((max_x - min_x + 2 * self.padding) * zoom) + 1,
+                    int((max_y - min_y + 2 * self.padding) * zoom) + 1)
+                for tx, ty in self.tile_range(zoom, rect):
+                    self.cache.discard((zoom, tx, ty))
+
+def cairo_tile(geometry, keys, fills, rect, zoom, stroke_width):
+    """Draw the countries in keys into the zoomed map pixels in rect, with cairo"""
+    from olpcgames import _cairoimage
+    from cairorender import draw_countries
+
+    surface, context = _cairoimage.newContext(rect.width, rect.height)
+    context.translate(-rect.left, -rect.top)
+    context.scale(zoom, zoom)
+    # keep the outlines as thin as on the unzoomed map
+    draw_countries(context, geometry, keys, fills, stroke_width / float(zoom))
+    return _cairoimage.asImage(surface)
+
+class MapView(object):
+    """A pannable, zoomable window onto a TilePyramid
+
+    viewport -- the pygame.Rect of the screen the map is drawn into; at
+        zoom 1 the map's top left corner is at the viewport's
+    """
+    def __init__(self, pyramid, viewport):
+        self.pyramid = pyramid
+        self.viewport = viewport
+        self.zoom = ZOOM_LEVELS[0]
+        # top left corner of the viewport, in zoomed map pixels
+        self.offset = (0, 0)
+
+    def _clamp(self):
+        width = max(0, self.pyramid.size[0] * self.zoom - self.viewport.width)
+        height = max(0, self.pyramid.size[1] * self.zoom - self.viewport.height)
+        self.offset = (min(max(0, int(self.offset[0])), width),
+                       min(max(0, int(self.offset[1])), height))
+
+    def to_map(self, x, y):
+        """Convert a screen position to base map pixels"""
+        return ((x - self.viewport.left + self.offset[0]) / float(self.zoom),
+                (y - self.viewport.top + self.offset[1]) / float(self.zoom))
+
+    def zoom_at(self, x, y, zoom):
+        """Change zoom level, keeping the map point under x,y in place"""
+        map_x, map_y = self.to_map(x, y)
+        self.zoom = zoom
+        self.offset = (map_x * zoom - (x - self.viewport.left),
+                       map_y * zoom - (y - self.viewport.top))
+        self._clamp()
+
+    def zoom_in(self, x, y):
+        larger = [z for z in ZOOM_LEVELS if z > self.zoom]
+        if larger:
+            self.zoom_at(x, y, larger[0])
+
+    def zoom_out(self, x, y):
+        smaller = [z for z in ZOOM_LEVELS if z < self.zoom]
+        if smaller:
+            self.zoom_at(x, y, smaller[-1])
+
+    def pan(self, dx, dy):
+        """Move the map by dx, dy screen pixels"""
+        self.offset = (self.offset[0] - dx, self.offset[1] - dy)
+        self._clamp()
+
+    def draw(self, surface, budget=TILES_PER_FRAME):
+        """Draw the visible tiles, rendering at most budget missing ones
+
+        returns the number of tiles still missing, so the caller knows to
+        draw again next frame
+        """
+        visible = pygame.Rect(self.offset, self.viewport.size)
+        missing = 0
+        clip = surface.get_clip()
+        surface.set_clip(self.viewport)
+        for tx, ty in self.pyramid.tile_range(self.zoom, visible):
+            key = (self.zoom, tx, ty)
+            tile = self.pyramid.cache.get(key)
+            if tile is None and budget > 0:
+                tile = self.pyramid.render_tile(*key)
+                self.pyramid.cache.put(key, tile)
+                budget -= 1
+            if tile is None:
+                missing += 1
+                tile = self.pyramid.placeholder(self.zoom, tx, ty)
+            position = (self.viewport.left + tx * TILE_SIZE - self.offset[0],
+                        self.viewport.top + ty * TILE_SIZE - self.offset[1])
+            if tile is None:
+                surface.fill(BACKGROUND_COLOR, pygame.Rect(position, (TILE_SIZE, TILE_SIZE)))
+            else:
+                surface.blit(tile, position)
+        surface.set_clip(clip)
+        return missing
+
+def magnify(pyramid, bbox, size=(200, 200), budget=TILES_PER_FRAME):
+    """Return an inset showing the map around bbox as large as will fit
+
+    bbox -- (min_x, min_y, max_x, max_y) in base map pixels
+    size -- (width, height) of the inset
+    budget -- how many missing tiles to render, as for MapView.draw
+
+    returns the inset and the number of tiles still missing from it
+    """
+    width = max(bbox[2] - bbox[0], 1.0)
+    height = max(bbox[3] - bbox[1], 1.0)
+    zoom = ZOOM_LEVELS[0]
+    for level in ZOOM_LEVELS:
+        # leave some of the surroundings in view
+        if width * level * 2 <= size[0] and height * level * 2 <= size[1]:
+            zoom = level
+    left = int((bbox[0] + bbox[2]) / 2.0 * zoom - size[0] / 2)
+    top = int((bbox[1] + bbox[3]) / 2.0 * zoom - size[1] / 2)
+
+    inset = pygame.Surface(size)
+    inset.fill(BACKGROUND_COLOR)
+    missing = 0
+    for tx, ty in pyramid.tile_range(zoom, pygame.Rect((left, top), size)):
+        key = (zoom, tx, ty)
+        tile = pyramid.cache.get(key)
+        if tile is None and budget > 0:
+            tile = pyramid.render_tile(*key)
+            pyramid.cache.put(key, tile)
+            budget -= 1
+        if tile is None:
+            missing += 1
+            tile = pyramid.placeholder(zoom, tx, ty)
+        if tile is not None:
+            inset.blit(tile, (tx * TILE_SIZE - left, ty * TILE_SIZE - top))
+    return inset, missing
+
+def benchmark(frames=40):
+    """Time MapView frames while zooming in on each continent's smallest country"""
+    import time
+    import mapbundle
+    import simplify
+    import transform
+    from continents import ContinentRegistry
+    from hittest import matrix_scale
+
+    pygame.init()
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        lod = simplify.LevelsOfDetail(continent)
+        matrix = transform.screen_matrix(continent.data)
+
+        def geometry_for(zoom):
+            level = lod.choose_level(simplify.effective_scale(continent.data, zoom))
+            return transform.continent_screen_geometry(continent, lod, level, matrix)
+
+        size = (1200, 1230)
+        pyramid = TilePyramid(continent, geometry_for, size, matrix_scale(matrix))
+        view = MapView(pyramid, pygame.Rect((0, 0), (1200, 900)))
+        screen = pygame.Surface((1200, 900))
+        base = geometry_for(1)
+        smallest = min(continent.keys, key=lambda k: (base.bbox(k)[2] - base.bbox(k)[0]) *
+                                                     (base.bbox(k)[3] - base.bbox(k)[1]))
+        min_x, min_y, max_x, max_y = base.bbox(smallest)
+        x, y = (min_x + max_x) / 2, (min_y + max_y) / 2
+
+        times = []
+        for frame in range(frames):
+            if frame % (frames // len(ZOOM_LEVELS)) == 0:
+                view.zoom_in(x, y)
+            start = time.time()
+            view.draw(screen)
+            times.append(time.time() - start)
+        print "%s (zooming on %s): frame time mean %.1f ms, worst %.1f ms, %d tiles cached" % (
+            key, smallest, sum(times) / len(times) * 1000, max(times) * 1000, len(pyramid.cache))
+
+if __name__ == '__main__':
+    benchmark()
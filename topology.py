@@ -0,0 +1,309 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Shared-border (arc) topology for country outlines
+
+Neighbouring countries in mapdata each carry their own copy of the border
+between them.  build_topology() finds those shared runs of vertices and
+stores each one once, as an arc, in the style of TopoJSON: a country
+becomes a list of rings, and a ring a list of arc references, where
+reference i means arcs[i] and ~i means arcs[i] walked backwards.
+
+Each vertex is merged into the first vertex of another country seen within
+SNAP map units of it, which takes care of the nearly-identical copies of a border
+that the hand-traced data has.
+
+setup.py stores each continent's topology in the map bundle, and country
+outlines are decoded from its arcs; it is only built at runtime when
+there is no bundle.  Renderers use the arcs to stroke each border once.
+"""
+
+from array import array
+
+# vertices closer than this, in map units, are treated as the same point
+SNAP = 1.0
+
+# outlines are flattened this finely before building arcs, in map units
+FLATTEN_TOLERANCE = 0.1
+
+def _reversed_coords(coords):
+    result = array('f')
+    for i in range(len(coords) - 2, -1, -2):
+        result.extend((coords[i], coords[i + 1]))
+    return result
+
+def open_ring(ring):
+    """Drop the closing vertex of a ring if it repeats the first one"""
+    if len(ring) >= 4 and ring[0] == ring[-2] and ring[1] == ring[-1]:
+        return ring[:-2]
+    return ring
+
+class Topology(object):
+    """Countries stored as rings of shared arcs
+
+    arcs -- list of array('f') of x,y values; closed arcs repeat their first point
+    objects -- dictionary mapping country keys to lists of rings, each a
+        list of arc references
+    """
+    def __init__(self, arcs, objects):
+        self.arcs = arcs
+        self.objects = objects
+
+    def arc_coords(self, ref, arcs=None):
+        """Return the coordinates of an arc reference, reversed if negative"""
+        if arcs is None:
+            arcs = self.arcs
+        if ref < 0:
+            return _reversed_coords(arcs[~ref])
+        return arcs[ref]
+
+    def ring_coords(self, ring, arcs=None):
+        """Join a ring's arcs into a flat x,y array, not repeating the first point
+
+        arcs -- optional replacement arc list with the same indices, such as
+            a simplified copy of self.arcs
+        """
+        coords = array('f')
+        for ref in ring:
+            arc = self.arc_coords(ref, arcs)
+            if coords:
+                # each arc starts where the previous one ended
+                coords.extend(arc[2:])
+            else:
+                coords.extend(arc)
+        return open_ring(coords)
+
+    def rings(self, key, arcs=None):
+        """Return a country's rings as flat x,y arrays"""
+        return [self.ring_coords(ring, arcs) for ring in self.objects[key]]
+
+    def arc_owners(self):
+        """Return, for each arc, the sorted keys of the countries that use it"""
+        owners = [set() for arc in self.arcs]
+        for key, rings in self.objects.items():
+            for ring in rings:
+                for ref in ring:
+                    owners[_arc_index(ref)].add(key)
+        return [sorted(o) for o in owners]
+
+    def vertex_count(self):
+        return sum([len(arc) // 2 for arc in self.arcs])
+
+def build_topology(shapes, snap=SNAP):
+    """Build a Topology from flattened outlines
+
+    shapes -- dictionary mapping keys to lists of rings, each a flat x,y array
+    """
+    # merge each vertex into the first vertex of another country seen
+    # within snap of it
+    positions = []
+    position_keys = []
+    cells = {}
+    limit = snap * snap
+
+    def merge(key, x, y):
+        cx = int(x // snap)
+        cy = int(y // snap)
+        for nx in (cx - 1, cx, cx + 1):
+            for ny in (cy - 1, cy, cy + 1):
+                for point in cells.get((nx, ny), ()):
+                    px, py = positions[point]
+                    if position_keys[point] != key and (px - x) * (px - x) + (py - y) * (py - y) <= limit:
+                        return point
+        positions.append((x, y))
+        position_keys.append(key)
+        cells.setdefault((cx, cy), []).append(len(positions) - 1)
+        return len(positions) - 1
+
+    rings = []
+    for key in sorted(shapes):
+        for ring in shapes[key]:
+            ring = open_ring(ring)
+            points = []
+            for i in range(0, len(ring), 2):
+                point = merge(key, ring[i], ring[i + 1])
+                if not points or points[-1] != point:
+                    points.append(point)
+            while len(points) > 1 and points[0] == points[-1]:
+                points.pop()
+            if len(points) >= 3:
+                rings.append((key, points))
+
+    # a junction is a point reached from different neighbours in different
+    # rings, which is where a shared border starts or ends
+    neighbours = {}
+    for key, points in rings:
+        n = len(points)
+        for i in range(n):
+            pair = [points[i - 1], points[(i + 1) % n]]
+            pair.sort()
+            neighbours.setdefault(points[i], set()).add(tuple(pair))
+
+    arcs = []
+    arc_index = {}
+    objects = {}
+
+    def reference(points):
+        path = tuple(points)
+        if path in arc_index:
+            return arc_index[path]
+        backwards = path[::-1]
+        if backwards in arc_index:
+            return ~arc_index[backwards]
+        coords = array('f')
+        for point in path:
+            coords.extend(positions[point])
+        arcs.append(coords)
+        arc_index[path] = len(arcs) - 1
+        return len(arcs) - 1
+
+    for key, points in rings:
+        n = len(points)
+        junctions = [i for i in range(n) if len(neighbours[points[i]]) > 1]
+        if not junctions:
+            # a ring shares no partial border; store it as one closed arc,
+            # starting at its smallest point so copies of it match up
+            start = points.index(min(points))
+            refs = [reference(points[start:] + points[:start + 1])]
+        else:
+            refs = []
+            for j in range(len(junctions)):
+                first = junctions[j]
+                last = junctions[(j + 1) % len(junctions)]
+                if last <= first:
+                    last += n
+                refs.append(reference([points[i % n] for i in range(first, last + 1)]))
+        objects.setdefault(key, []).append(refs)
+
+    return _join_private_arcs(Topology(arcs, objects))
+
+def _arc_index(ref):
+    if ref < 0:
+        return ~ref
+    return ref
+
+def _join_private_arcs(topology):
+    """Join runs of consecutive arcs that only one ring uses
+
+    Noise in the traced borders splits coastlines and other unshared runs
+    into many short arcs; joining them back up saves the repeated end
+    points.
+    """
+    uses = [0] * len(topology.arcs)
+    for rings in topology.objects.values():
+        for ring in rings:
+            for ref in ring:
+                uses[_arc_index(ref)] += 1
+
+    arcs = []
+    renumbered = {}
+    objects = {}
+    for key in sorted(topology.objects):
+        for ring in topology.objects[key]:
+            private = [uses[_arc_index(ref)] == 1 for ref in ring]
+            if any(private) and not all(private):
+                # start on a shared arc so no private run wraps around
+                start = private.index(False)
+                ring = ring[start:] + ring[:start]
+                private = private[start:] + private[:start]
+
+            runs = []
+            for ref, is_private in zip(ring, private):
+                if is_private and runs and runs[-1][0]:
+                    runs[-1][1].append(ref)
+                else:
+                    runs.append((is_private, [ref]))
+
+            refs = []
+            for is_private, run in runs:
+                if is_private:
+                    coords = array('f')
+                    for ref in run:
+                        arc = topology.arc_coords(ref)
+                        if coords:
+                            coords.extend(arc[2:])
+                        else:
+                            coords.extend(arc)
+                    arcs.append(coords)
+                    refs.append(len(arcs) - 1)
+                else:
+                    ref = run[0]
+                    index = _arc_index(ref)
+                    if index not in renumbered:
+                        arcs.append(topology.arcs[index])
+                        renumbered[index] = len(arcs) - 1
+                    if ref < 0:
+                        refs.append(~renumbered[index])
+                    else:
+                        refs.append(renumbered[index])
+            objects.setdefault(key, []).append(refs)
+    return Topology(arcs, objects)
+
+def continent_topology(continent, tolerance=FLATTEN_TOLERANCE):
+    """Return the Topology of a continents.Continent's countries
+
+    A compiled map bundle already holds it; otherwise it is built from
+    the outlines.
+    """
+    stored = getattr(continent.geometry, "topology", None)
+    if stored is not None:
+        return stored(continent.key)
+    shapes = {}
+    for key in continent.keys:
+        shapes[key] = continent.geometry[key].flatten(tolerance)
+    return build_topology(shapes)
+
+def benchmark(repeat=3):
+    """Compare the size of the arc store with separately stored outlines"""
+    import time
+    import mapbundle
+    from continents import ContinentRegistry
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        shapes = {}
+        for country in continent.keys:
+            shapes[country] = [open_ring(r) for r in
+                               continent.geometry[country].flatten(FLATTEN_TOLERANCE)]
+        ring_vertices = sum([len(r) // 2 for rings in shapes.values() for r in rings])
+
+        best = None
+        for i in range(repeat):
+            start = time.time()
+            topology = build_topology(shapes)
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+
+        start = time.time()
+        for country in continent.keys:
+            topology.rings(country)
+        rebuild = time.time() - start
+
+        shared = len([o for o in topology.arc_owners() if len(o) > 1])
+        references = sum([len(ring) for rings in topology.objects.values() for ring in rings])
+        print "%s: %d countries" % (key, len(continent.keys))
+        print "  separate outlines: %6d vertices, %7d bytes" % (ring_vertices, ring_vertices * 8)
+        print "  arc store:         %6d vertices, %7d bytes in %d arcs (%d shared), %d arc references" % (
+            topology.vertex_count(), topology.vertex_count() * 8, len(topology.arcs), shared, references)
+        print "  build %.1f ms, rebuild all rings %.1f ms" % (best * 1000, rebuild * 1000)
+
+if __name__ == '__main__':
+    benchmark()
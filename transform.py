@@ -0,0 +1,171 @@
+# Geoquiz.activity
+# A multi-player geography game for the XO laptop.
+#
+# Copyright (C) 2008 Gordon McCreight
+# This file is part of Geoquiz.activity
+#
+#     Geoquiz.activity is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     Geoquiz.activity is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with Geoquiz.activity. If not, see <http://www.gnu.org/licenses/>.
+
+"""Country outlines in screen space
+
+Rather than wrapping the countries in nested translate and scale groups
+and letting rsvg apply them to every vertex on every render, a
+ScreenGeometry maps all of a continent's outlines to screen pixels, in
+one batched pass with numpy, or ring by ring without it (gathering the
+rings only pays off with numpy).  The result is cached on the continent
+per level of detail and screen matrix, so the svg renderer,
+the label layer and hit-testing all use ready-to-draw coordinates, and
+only a change of screen size redoes the pass.
+"""
+
+from array import array
+
+from hittest import multiply, continent_matrix, transform_ring, rings_bbox
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def screen_matrix(continent_data, map_scale=1.0):
+    """The matrix from a continent's map units to screen pixels
+
+    map_scale -- how much the map document is scaled to fit the screen
+    """
+    return multiply((map_scale, 0.0, 0.0, map_scale, 0.0, 0.0), continent_matrix(continent_data))
+
+def transform_coords(coords, matrix):
+    """Return a flat x,y array('f') with matrix applied to every point"""
+    if numpy is None or not coords:
+        return transform_ring(coords, matrix)
+    a, b, c, d, e, f = matrix
+    points = numpy.frombuffer(coords, numpy.float32).reshape(-1, 2)
+    linear = numpy.array([[a, b], [c, d]], numpy.float32)
+    result = numpy.dot(points, linear) + numpy.array([e, f], numpy.float32)
+    return array('f', result.astype(numpy.float32).tostring())
+
+class ScreenGeometry(object):
+    """A continent's outlines transformed to screen pixels
+
+    keys -- the country keys
+    rings -- callable returning a country's flat x,y rings in map units
+    matrix -- the (a, b, c, d, e, f) map to screen matrix
+    arcs -- optional list of the topology arcs the rings are made of, in
+        map units, so borders can be stroked once (see cairorender)
+    arc_owners -- with arcs, the keys of the countries using each arc
+    """
+    def __init__(self, keys, rings, matrix, arcs=None, arc_owners=None):
+        self.matrix = matrix
+        self.keys = list(keys)
+        self.arc_owners = arc_owners
+        self._bboxes = {}
+        self._svg_paths = {}
+
+        if numpy is None:
+            self._rings = dict([(key, [transform_ring(ring, matrix) for ring in rings(key)])
+                                for key in self.keys])
+            self.arcs = None
+            if arcs is not None:
+                self.arcs = [transform_ring(arc, matrix) for arc in arcs]
+            return
+
+        # gather every ring into one array so the transform is one pass
+        coords = array('f')
+        spans = []
+        for key in self.keys:
+            for ring in rings(key):
+                spans.append((key, len(coords), len(coords) + len(ring)))
+                coords.extend(ring)
+        arc_spans = []
+        for arc in arcs or ():
+            arc_spans.append((len(coords), len(coords) + len(arc)))
+            coords.extend(arc)
+        coords = transform_coords(coords, matrix)
+
+        self._rings = dict([(key, []) for key in self.keys])
+        for key, start, end in spans:
+            self._rings[key].append(coords[start:end])
+        self.arcs = None
+        if arcs is not None:
+            self.arcs = [coords[start:end] for start, end in arc_spans]
+
+    def rings(self, key):
+        """Return a country's rings as flat x,y arrays in screen pixels"""
+        return self._rings[key]
+
+    def bbox(self, key):
+        """Return a country's (min_x, min_y, max_x, max_y) on screen"""
+        try:
+            return self._bboxes[key]
+        except KeyError:
+            bbox = self._bboxes[key] = rings_bbox(self._rings[key])
+            return bbox
+
+    def svg_path(self, key):
+        """Return svg path data for a country in screen pixels"""
+        try:
+            return self._svg_paths[key]
+        except KeyError:
+            parts = []
+            for ring in self._rings[key]:
+                points = ['%.1f,%.1f' % (ring[i], ring[i + 1]) for i in range(0, len(ring), 2)]
+                parts.append('M ' + points[0] + ' L ' + ' '.join(points[1:]) + ' z')
+            path = self._svg_paths[key] = ' '.join(parts)
+            return path
+
+def continent_screen_geometry(continent, lod, level, matrix):
+    """Return the cached ScreenGeometry of a continents.Continent
+
+    lod -- the continent's simplify.LevelsOfDetail
+    level -- which level of detail to transform
+    """
+    return continent.derived(("screen_geometry", level, matrix),
+        lambda c: ScreenGeometry(c.keys, lambda key: lod.rings(key, level), matrix,
+                                 lod.arcs(level), lod.arc_owners))
+
+def benchmark(repeat=5):
+    """Time transforming every outline ring by ring and in one batch"""
+    import time
+    import mapbundle
+    from continents import ContinentRegistry
+    from simplify import LevelsOfDetail
+
+    if numpy is None:
+        print "numpy is not available, ScreenGeometry goes ring by ring too"
+
+    registry = ContinentRegistry(*mapbundle.load('/nonexistent'))
+    for key in sorted(registry.continents_data):
+        continent = registry.get(key)
+        lod = LevelsOfDetail(continent)
+        matrix = screen_matrix(continent.data)
+        for level in (0, len(lod.tolerances) - 1):
+            per_ring = batched = None
+            for r in range(repeat):
+                start = time.time()
+                for country in continent.keys:
+                    [transform_ring(ring, matrix) for ring in lod.rings(country, level)]
+                elapsed = time.time() - start
+                if per_ring is None or elapsed < per_ring:
+                    per_ring = elapsed
+
+                start = time.time()
+                ScreenGeometry(continent.keys, lambda k: lod.rings(k, level), matrix)
+                elapsed = time.time() - start
+                if batched is None or elapsed < batched:
+                    batched = elapsed
+            print "%s level %d: %6d vertices, ring by ring %.2f ms, batched %.2f ms" % (
+                key, level, lod.vertex_count(level), per_ring * 1000, batched * 1000)
+
+if __name__ == '__main__':
+    benchmark()